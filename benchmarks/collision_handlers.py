@@ -0,0 +1,64 @@
+"""Measures the per-step cost of the pymunk collision callbacks VTWorld installs
+
+Each level is simulated twice from the same start: once with every solid-collision callback routed
+through Python (as all worlds used to be, forced here with no-op handlers), and once with only the
+callbacks the world needs. Levels are ranked by how many dynamic objects they have, since those are the
+ones with the most contacts per step.
+
+Usage:
+    python benchmarks/collision_handlers.py [--levels N] [--time SECONDS] [--repeats R]
+"""
+import argparse
+import glob
+import json
+import os
+import time
+from virtualtools.world import load_vt_from_dict
+
+TRIAL_DIR = os.path.join(os.path.dirname(__file__), '..', 'virtualtools', 'trials', 'Original')
+
+
+def _noop(o1, o2):
+    return
+
+
+def time_rollout(worlddict, simtime, all_handlers):
+    w = load_vt_from_dict(worlddict)
+    if all_handlers:
+        w.solid_collision_pre = _noop
+        w.solid_collision_post = _noop
+        w.record_collisions = True
+    else:
+        w.record_collisions = False
+    nsteps = int(round(simtime / w.bts))
+    t = time.perf_counter()
+    for _ in range(nsteps):
+        w._cpSpace.step(w.bts)
+    return (time.perf_counter() - t) / nsteps
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--levels', type=int, default=5, help='number of contact-heavy levels to run')
+    parser.add_argument('--time', type=float, default=10., help='simulated seconds per rollout')
+    parser.add_argument('--repeats', type=int, default=3, help='rollouts per setting (best is reported)')
+    args = parser.parse_args()
+
+    levels = []
+    for fl in sorted(glob.glob(os.path.join(TRIAL_DIR, '*.json'))):
+        with open(fl, 'r') as ifl:
+            wd = json.load(ifl)['world']
+        ndyn = len([o for o in wd['objects'].values() if o.get('density', 1) != 0
+                    and o['type'] not in ['Goal', 'Blocker']])
+        levels.append((ndyn, os.path.basename(fl)[:-5], wd))
+    levels.sort(key=lambda l: -l[0])
+
+    print('%-20s %6s %16s %16s %8s' % ('level', 'dyn', 'all (us/step)', 'needed (us/step)', 'speedup'))
+    for ndyn, name, wd in levels[:args.levels]:
+        full = min([time_rollout(wd, args.time, True) for _ in range(args.repeats)])
+        needed = min([time_rollout(wd, args.time, False) for _ in range(args.repeats)])
+        print('%-20s %6d %16.1f %16.1f %7.2fx' % (name, ndyn, full * 1e6, needed * 1e6, full / needed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""Measures how much faster each solver fidelity profile is than "exact", and how often it agrees on success
+
+Each level gets the same set of random tool placements (legal ones only), which are run once under every
+profile in FIDELITY_PROFILES. A profile's agreement is the fraction of placements whose success label
+matches the label under "exact"; its speedup is the total rollout time under "exact" divided by its own.
+Placements run in the interface's pooled base world, which rolls out exactly as a freshly loaded world
+would (checked by benchmarks/pooled_worlds.py), so labels do not depend on the order they are run in.
+
+Usage:
+    python benchmarks/fidelity_profiles.py [--levels N] [--actions A] [--seed S]
+"""
+import argparse
+import glob
+import json
+import os
+import random
+import time
+from virtualtools.world.constants import FIDELITY_PROFILES, DEFAULT_FIDELITY
+from virtualtools.interfaces import ToolPicker
+
+TRIAL_DIR = os.path.join(os.path.dirname(__file__), '..', 'virtualtools', 'trials', 'Original')
+
+
+def sample_actions(tp, n, rng):
+    # Random placements of random tools, keeping only the legal ones
+    dims = tp.worlddict['dims']
+    actions = []
+    for _ in range(n):
+        act = {'tool': rng.choice(list(tp.toolnames)),
+               'position': (rng.uniform(0, dims[0]), rng.uniform(0, dims[1]))}
+        if tp.run_placement(act)[0] is not None:
+            actions.append(act)
+    return actions
+
+
+def time_profile(tp, actions, fidelity):
+    labels = []
+    t = time.perf_counter()
+    for act in actions:
+        labels.append(bool(tp.run_placement(act, fidelity=fidelity)[0]))
+    return time.perf_counter() - t, labels
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--levels', type=int, default=None, help='number of levels to run (default: all)')
+    parser.add_argument('--actions', type=int, default=20, help='random placements tried per level')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the placements')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    profiles = [DEFAULT_FIDELITY] + [p for p in FIDELITY_PROFILES if p != DEFAULT_FIDELITY]
+    times = dict([(p, 0.) for p in profiles])
+    agree = dict([(p, 0) for p in profiles])
+    successes = dict([(p, 0) for p in profiles])
+    n = 0
+    for fl in sorted(glob.glob(os.path.join(TRIAL_DIR, '*.json')))[:args.levels]:
+        with open(fl, 'r') as ifl:
+            tp = ToolPicker(json.load(ifl))
+        actions = sample_actions(tp, args.actions, rng)
+        exact = None
+        for p in profiles:
+            dt, labels = time_profile(tp, actions, p)
+            if exact is None:
+                exact = labels
+            times[p] += dt
+            agree[p] += sum([l == e for l, e in zip(labels, exact)])
+            successes[p] += sum(labels)
+        n += len(actions)
+
+    print('%d placements' % n)
+    print('%-12s %10s %9s %10s %10s' % ('profile', 'time (s)', 'speedup', 'successes', 'agreement'))
+    for p in profiles:
+        print('%-12s %10.2f %8.2fx %10d %9.1f%%' % (p, times[p], times[DEFAULT_FIDELITY] / times[p],
+                                                  successes[p], 100. * agree[p] / max(n, 1)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""Checks that rollouts in interface base worlds match rollouts in freshly loaded worlds, and times the ways of getting a world
+
+Each level gets a set of random tool placements, which are run with `run_placement` (in a base world built
+from the interface's compiled spec) first in order, then in reverse, then shuffled. Every result must equal
+the outcome of the same placement in a freshly loaded world (`observe_placement_path(..., return_world=True)`).
+Mismatches are printed and the script exits with status 1.
+
+For comparison, each placement is also run in one world that is rewound with `VTWorld.restore` between
+placements; the number of those trajectories that differ from a fresh world's is reported, along with the
+time to get a world by `load_vt_from_dict`, by building it from the compiled spec, and by `restore`.
+
+Usage:
+    python benchmarks/pooled_worlds.py [--levels N] [--actions A] [--seed S] [--repeats R]
+"""
+import argparse
+import glob
+import json
+import os
+import random
+import sys
+import time
+import numpy as np
+from virtualtools.world import load_vt_from_dict
+from virtualtools.interfaces import ToolPicker, CollisionError, get_path
+
+TRIAL_DIR = os.path.join(os.path.dirname(__file__), '..', 'virtualtools', 'trials', 'Original')
+
+
+def fresh_outcome(tp, act):
+    try:
+        path, success, time = tp.observe_placement_path(act, return_world=True)[:3]
+    except CollisionError:
+        return [None, -1], None
+    return [success, time], path
+
+
+def same_path(p1, p2):
+    return all([np.array_equal(p1[k], p2[k]) for k in p2.keys()])
+
+
+def time_per_call(fn, repeats, setup=None):
+    # Only fn is timed; setup (if given) runs untimed before each call
+    total = 0.
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        t = time.perf_counter()
+        fn()
+        total += time.perf_counter() - t
+    return total / repeats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--levels', type=int, default=None, help='number of levels to run (default: all)')
+    parser.add_argument('--actions', type=int, default=20, help='random placements tried per level')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the placements and call orders')
+    parser.add_argument('--repeats', type=int, default=200, help='calls timed per level for each way of getting a world')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    n = 0
+    bad = 0
+    nrestored = 0
+    restored_differ = 0
+    print('%-14s %10s %10s %10s' % ('level', 'load (ms)', 'spec (ms)', 'restore (ms)'))
+    for fl in sorted(glob.glob(os.path.join(TRIAL_DIR, '*.json')))[:args.levels]:
+        with open(fl, 'r') as ifl:
+            tp = ToolPicker(json.load(ifl))
+        dims = tp.worlddict['dims']
+        actions = [{'tool': rng.choice(list(tp.toolnames)),
+                    'position': (rng.uniform(0, dims[0]), rng.uniform(0, dims[1]))}
+                   for _ in range(args.actions)]
+        expected = [fresh_outcome(tp, act) for act in actions]
+        order = list(range(len(actions)))
+        shuffled = order[:]
+        rng.shuffle(shuffled)
+        for i in order + order[::-1] + shuffled:
+            n += 1
+            pooled = list(tp.run_placement(actions[i]))
+            if pooled != expected[i][0]:
+                bad += 1
+                print('%s %s: pooled %s, fresh %s' % (os.path.basename(fl), actions[i], pooled, expected[i][0]))
+
+        # The same placements in one world rewound between them
+        w = load_vt_from_dict(tp.worlddict)
+        snap = w.snapshot()
+        for act, (_, path) in zip(actions, expected):
+            if path is None:
+                continue
+            w.restore(snap)
+            rpath = get_path(tp.place(act, w), tp.maxtime, tp.bts)[0]
+            nrestored += 1
+            if not same_path(rpath, path):
+                restored_differ += 1
+
+        t_load = time_per_call(lambda: load_vt_from_dict(tp.worlddict), args.repeats)
+        t_spec = time_per_call(lambda: tp._get_base_world(), args.repeats)
+        # Each restore rewinds a world that has been run for a while
+        t_restore = time_per_call(lambda: w.restore(snap), args.repeats, lambda: w.step(.5))
+        print('%-14s %10.3f %10.3f %10.3f' % (os.path.basename(fl)[:-5], 1000 * t_load, 1000 * t_spec, 1000 * t_restore))
+
+    print('%d of %d rollouts in rewound worlds have trajectories that differ from fresh worlds' % (restored_differ, nrestored))
+    print('%d of %d base-world rollouts differ from fresh worlds' % (bad, n))
+    sys.exit(1 if bad > 0 else 0)
+
+
+if __name__ == '__main__':
+    main()
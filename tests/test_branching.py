@@ -0,0 +1,42 @@
+import json
+import os
+import numpy as np
+import pytest
+from virtualtools.world import load_vt_from_dict
+from virtualtools.interfaces import Branch, StateRecorder, run_branches
+
+TRIAL_DIR = os.path.join(os.path.dirname(__file__), '..', 'virtualtools', 'trials', 'Original')
+
+BRANCHES = [Branch(),
+            Branch(kicks=(('Ball', (0, 2000), (0, 0)),)),
+            Branch(gravity=400.),
+            Branch(collision_noise={'noise_collision_direction': .2, 'noise_collision_elasticity': .2,
+                                    'seed': 1, 'seed_index': 0}),
+            Branch(properties={'Ball': {'friction': .1, 'elasticity': .9}})]
+
+
+def make_recorders():
+    # Module-level so it can be sent to worker processes
+    return [StateRecorder()]
+
+
+def load_world(name):
+    with open(os.path.join(TRIAL_DIR, name + '.json'), 'r') as ifl:
+        return load_vt_from_dict(json.load(ifl)['world'])
+
+
+def same_results(r1, r2):
+    p1 = r1.recorders[0].path
+    p2 = r2.recorders[0].path
+    return r1.outcome == r2.outcome and p1.keys() == p2.keys() and \
+        all([np.array_equal(p1[k], p2[k]) for k in p1.keys()])
+
+
+@pytest.mark.parametrize('level', ['Catapult', 'Launch_A'])
+def test_run_branches_workers_match_serial(level):
+    serial = run_branches(load_world(level), 1., BRANCHES, 6., 0.1, make_recorders)
+    parallel = run_branches(load_world(level), 1., BRANCHES, 6., 0.1, make_recorders, workers=2)
+    assert len(parallel) == len(serial)
+    assert all([same_results(p, s) for p, s in zip(parallel, serial)])
+    # The kicked branch really does differ from the unchanged one
+    assert not same_results(serial[0], serial[1])
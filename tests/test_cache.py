@@ -0,0 +1,87 @@
+import json
+import os
+import pytest
+from virtualtools.interfaces import ToolPicker, RolloutCache, QuiescenceDetector
+
+TRIAL_DIR = os.path.join(os.path.dirname(__file__), '..', 'virtualtools', 'trials', 'Original')
+
+ACTION = {'tool': 'obj1', 'position': (90, 400)}
+NOISE = {'noise_position_static': 5., 'seed': 3}
+
+
+def load_toolpicker(name='Basic', cache=True):
+    with open(os.path.join(TRIAL_DIR, name + '.json'), 'r') as ifl:
+        tp = ToolPicker(json.load(ifl))
+    if cache:
+        tp.cache = RolloutCache()
+    return tp
+
+
+@pytest.mark.parametrize('method', ['run_placement', 'observe_placement_path', 'observe_full_path',
+                                    'observe_collision_events'])
+@pytest.mark.parametrize('noise', [None, NOISE])
+def test_cached_matches_uncached(method, noise):
+    tp = load_toolpicker()
+    plain = load_toolpicker(cache=False)
+    expected = getattr(plain, method)(ACTION, noise, 5.)
+    first = getattr(tp, method)(ACTION, noise, 5.)
+    again = getattr(tp, method)(ACTION, noise, 5.)
+    assert tp.cache.hits == 1 and tp.cache.misses == 1
+    assert repr(first) == repr(expected) and repr(again) == repr(expected)
+
+
+def test_positional_and_keyword_arguments_share_a_key():
+    tp = load_toolpicker()
+    r1 = tp.observe_placement_path(ACTION, None, 5., True, None, False)
+    r2 = tp.observe_placement_path(ACTION, maxtime=5.)
+    r3 = tp.observe_placement_path(action=ACTION, noise=None, maxtime=5., stop_on_goal=True)
+    assert tp.cache.misses == 1 and tp.cache.hits == 2
+    assert repr(r1) == repr(r2) == repr(r3)
+
+
+def test_return_world_bypasses_cache():
+    tp = load_toolpicker()
+    tp.observe_placement_path(ACTION, None, 5., True, None, True)
+    assert len(tp.cache) == 0
+
+
+def change_bts(tp):
+    tp.bts = 0.05
+
+
+def change_maxtime(tp):
+    tp.maxtime = 10.
+
+
+def change_fidelity(tp):
+    tp.fidelity = 'fast'
+
+
+def change_quiescence(tp):
+    tp.quiescence = QuiescenceDetector()
+
+
+def change_noise_seed(tp):
+    tp.noise_seed = 7
+
+
+def change_world(tp):
+    wd = json.loads(json.dumps(tp.worlddict))
+    wd['gravity'] = wd['gravity'] * 2
+    tp.worlddict = wd
+
+
+@pytest.mark.parametrize('change', [change_bts, change_maxtime, change_fidelity, change_quiescence,
+                                    change_noise_seed, change_world])
+def test_settings_change_the_key(change):
+    tp = load_toolpicker()
+    noise = {'noise_position_static': 5., 'seed_index': 0}
+    tp.run_placement(ACTION, noise)
+    tp.run_placement(ACTION, noise)
+    assert tp.cache.hits == 1
+    change(tp)
+    result = tp.run_placement(ACTION, noise)
+    assert tp.cache.hits == 1 and tp.cache.misses == 2
+    plain = load_toolpicker(cache=False)
+    change(plain)
+    assert repr(result) == repr(plain.run_placement(ACTION, noise))
@@ -0,0 +1,49 @@
+import json
+import os
+import numpy as np
+import pytest
+from virtualtools.world import VTWorld
+from virtualtools.interfaces import ToolPicker, FreeSpaceMap, compute_free_space, check_collision_by_polys
+
+TRIAL_DIR = os.path.join(os.path.dirname(__file__), '..', 'virtualtools', 'trials', 'Original')
+
+
+def load_toolpicker(name):
+    with open(os.path.join(TRIAL_DIR, name + '.json'), 'r') as ifl:
+        return ToolPicker(json.load(ifl))
+
+
+@pytest.mark.parametrize('level', ['Basic', 'Catapult', 'Chaining', 'Shafts_A', 'Unsupport'])
+@pytest.mark.parametrize('resolution', [1., 4.])
+def test_valid_positions_never_collide(level, resolution):
+    tp = load_toolpicker(level)
+    w = tp._get_base_world()
+    rng = np.random.default_rng(0)
+    nvalid = 0
+    for tool in tp.toolnames:
+        fsm = tp.free_space_map(tool, resolution)
+        for pos in rng.uniform(0, 600, size=(300, 2)):
+            if fsm.is_valid(pos):
+                nvalid += 1
+                assert not check_collision_by_polys(w, tp._tools[tool], tuple(pos)), (tool, pos)
+    assert nvalid > 0
+
+
+def test_grid_blocks_every_colliding_grid_point():
+    tp = load_toolpicker('Catapult')
+    w = tp._get_base_world()
+    fsm = tp.free_space_map('obj1', 10.)
+    for i, j in np.argwhere(fsm.grid):
+        pos = (i * fsm.resolution, j * fsm.resolution)
+        assert not check_collision_by_polys(w, tp._tools['obj1'], pos), pos
+
+
+def test_thin_obstacle_between_grid_points_is_blocked():
+    # A sliver narrower than the grid spacing that no grid point falls inside
+    w = VTWorld((100, 100), 200., [False, False, False, False])
+    w.add_poly('Sliver', [(45.2, 0), (45.8, 0), (45.8, 100), (45.2, 100)], (0, 0, 0), density=0)
+    tool = [[(-.25, -.25), (.25, -.25), (.25, .25), (-.25, .25)]]
+    fsm = FreeSpaceMap(compute_free_space(w, tool, 10.), 10.)
+    assert check_collision_by_polys(w, tool, (45.5, 55.))
+    assert not fsm.is_valid((45.5, 55.))
+    assert fsm.is_valid((75., 55.))
@@ -0,0 +1,46 @@
+import json
+import os
+import random
+import pytest
+from virtualtools.interfaces import ToolPicker, CollisionError
+
+TRIAL_DIR = os.path.join(os.path.dirname(__file__), '..', 'virtualtools', 'trials', 'Original')
+
+
+def load_toolpicker(name, **kwargs):
+    with open(os.path.join(TRIAL_DIR, name + '.json'), 'r') as ifl:
+        return ToolPicker(json.load(ifl), **kwargs)
+
+
+def random_actions(tp, n, seed=0):
+    rng = random.Random(seed)
+    dims = tp.worlddict['dims']
+    return [{'tool': rng.choice(list(tp.toolnames)),
+             'position': (rng.uniform(0, dims[0]), rng.uniform(0, dims[1]))}
+            for _ in range(n)]
+
+
+def fresh_outcome(tp, act):
+    try:
+        return list(tp.observe_placement_path(act, return_world=True)[1:3])
+    except CollisionError:
+        return [None, -1]
+
+
+def test_place_without_world_returns_new_world():
+    tp = load_toolpicker('Basic')
+    act = {'tool': 'obj1', 'position': (90, 400)}
+    w1 = tp.place(act)
+    w2 = tp.place(act)
+    assert w1 is not w2
+    assert w1 is not tp._get_base_world()
+    assert w1.objects.keys() == w2.objects.keys()
+
+
+@pytest.mark.parametrize('level', ['Basic', 'Catapult', 'Unsupport'])
+def test_run_placement_independent_of_history(level):
+    tp = load_toolpicker(level)
+    actions = random_actions(tp, 8)
+    expected = [fresh_outcome(tp, act) for act in actions]
+    for i in list(range(len(actions))) + list(range(len(actions)))[::-1]:
+        assert list(tp.run_placement(actions[i])) == expected[i]
@@ -0,0 +1,82 @@
+import json
+import os
+import pickle
+import numpy as np
+import pytest
+from virtualtools.world import load_vt_from_dict, noisify_world, trunc_norm, VTNoiseSource
+from virtualtools.interfaces import get_state_path
+
+TRIAL_DIR = os.path.join(os.path.dirname(__file__), '..', 'virtualtools', 'trials', 'Original')
+
+NOISE = {'noise_position_static': 5., 'noise_position_moving': 5., 'noise_collision_direction': .2,
+         'noise_collision_elasticity': .2, 'noise_gravity': .1}
+
+
+def load_level(name):
+    with open(os.path.join(TRIAL_DIR, name + '.json'), 'r') as ifl:
+        return json.load(ifl)['world']
+
+
+def final_states(w):
+    path = get_state_path(w, 5., 0.1)[0]
+    return repr(dict([(nm, p[-1]) for nm, p in path.items()]))
+
+
+def test_noisify_world_reuses_factory():
+    w = load_vt_from_dict(load_level('Towers_A'))
+    noisify_world(w, **NOISE)
+    factory = w._noisy_factory
+    noisify_world(w, **NOISE)
+    assert w._noisy_factory is factory
+    # A changed world gets a new factory
+    w.add_placed_circle('PLACED', (300, 500), 10, (0, 0, 255))
+    noisify_world(w, **NOISE)
+    assert w._noisy_factory is not factory
+    assert 'PLACED' in w._noisy_factory._wdict['objects']
+
+
+def test_noisify_world_matches_fresh_factory():
+    d = load_level('Towers_A')
+    w = load_vt_from_dict(d)
+    noisify_world(w, seed=4, seed_index=0, **NOISE)
+    reused = final_states(noisify_world(w, seed=4, seed_index=1, **NOISE))
+    fresh = final_states(noisify_world(load_vt_from_dict(d), seed=4, seed_index=1, **NOISE))
+    assert reused == fresh
+
+
+def test_seeded_streams_reproduce():
+    p1, c1 = VTNoiseSource.streams(11, 3)
+    p2, c2 = VTNoiseSource.streams(11, 3)
+    assert np.array_equal(p1.normals(100), p2.normals(100))
+    assert [c1.trunc_norm(0, 1, -.5, .5) for _ in range(50)] == [c2.trunc_norm(0, 1, -.5, .5) for _ in range(50)]
+    # Other indices and the two streams of one index are independent
+    p3, c3 = VTNoiseSource.streams(11, 4)
+    assert not np.array_equal(VTNoiseSource.streams(11, 3)[0].normals(10), p3.normals(10))
+    assert not np.array_equal(VTNoiseSource.streams(11, 3)[0].normals(10), c3.normals(10))
+
+
+def test_normals_match_single_draws():
+    # Including draws that run across several buffer refills
+    a = VTNoiseSource(5, buffer_size=16)
+    b = VTNoiseSource(5, buffer_size=16)
+    single = [b.normal() for _ in range(3)]
+    assert np.array_equal(a.normals(3), single)
+    assert np.array_equal(a.normals(40), [b.normal() for _ in range(40)])
+    assert len(a.normals(0)) == 0
+    assert a.normal() == b.normal()
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires os.fork')
+def test_forked_children_draw_fresh_default_noise():
+    trunc_norm(0, 1)
+    r, w = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(r)
+        os.write(w, pickle.dumps([trunc_norm(0, 1) for _ in range(5)]))
+        os._exit(0)
+    os.close(w)
+    with os.fdopen(r, 'rb') as fl:
+        child = pickle.loads(fl.read())
+    os.waitpid(pid, 0)
+    assert child != [trunc_norm(0, 1) for _ in range(5)]
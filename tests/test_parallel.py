@@ -0,0 +1,47 @@
+import json
+import os
+import pytest
+from virtualtools.interfaces import ToolPicker
+
+TRIAL_DIR = os.path.join(os.path.dirname(__file__), '..', 'virtualtools', 'trials', 'Original')
+
+NOISE = {'noise_position_static': 5., 'noise_position_moving': 5., 'noise_collision_direction': .2,
+         'noise_collision_elasticity': .2, 'noise_gravity': .1, 'seed': 2}
+
+EXECUTORS = ['pool'] + (['fork'] if hasattr(os, 'fork') else [])
+
+
+def load_toolpicker(name):
+    with open(os.path.join(TRIAL_DIR, name + '.json'), 'r') as ifl:
+        return ToolPicker(json.load(ifl))
+
+
+def actions(tp):
+    return [{'tool': t, 'position': (100 + 60 * i, 350 + 30 * (i % 3))}
+            for i, t in enumerate(list(tp.toolnames) * 2)]
+
+
+@pytest.mark.parametrize('executor', EXECUTORS)
+def test_run_placements_match_serial(executor):
+    tp = load_toolpicker('Catapult')
+    acts = actions(tp)
+    serial = tp.run_placements(acts, maxtime=5.)
+    tp.executor = executor
+    try:
+        assert tp.run_placements(acts, maxtime=5., workers=2) == serial
+    finally:
+        tp.close_pool()
+
+
+@pytest.mark.parametrize('executor', EXECUTORS)
+def test_indexed_noise_matches_serial(executor):
+    tp = load_toolpicker('Catapult')
+    acts = actions(tp)
+    indices = list(range(len(acts)))
+    serial = tp.observe_full_path_batch(acts, NOISE, 5., noise_indices=indices)
+    tp.executor = executor
+    try:
+        parallel = tp.observe_full_path_batch(acts, NOISE, 5., workers=2, noise_indices=indices)
+    finally:
+        tp.close_pool()
+    assert repr(parallel) == repr(serial)
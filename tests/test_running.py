@@ -0,0 +1,71 @@
+import json
+import os
+import pytest
+from virtualtools.world import load_vt_from_dict
+from virtualtools.interfaces import ToolPicker, run_game, get_path, get_state_path, get_geom_path, \
+    get_collisions, RolloutOutcome, QuiescenceDetector, StopWhen
+from virtualtools.interfaces.running import get_path_bounding_boxes, get_game_outcomes
+
+TRIAL_DIR = os.path.join(os.path.dirname(__file__), '..', 'virtualtools', 'trials', 'Original')
+
+# Baseline number of values each wrapper returns
+WRAPPERS = [(run_game, 2), (get_path, 3), (get_path_bounding_boxes, 3), (get_state_path, 3),
+            (get_geom_path, 3), (get_collisions, 4), (get_game_outcomes, 4)]
+
+STOPPING = [dict(),
+            dict(quiescence=QuiescenceDetector()),
+            dict(stop_predicates=[StopWhen(lambda v: v.time > 1., 'late')]),
+            dict(quiescence=QuiescenceDetector(), stop_predicates=[])]
+
+
+def load_level(name):
+    with open(os.path.join(TRIAL_DIR, name + '.json'), 'r') as ifl:
+        return json.load(ifl)
+
+
+@pytest.mark.parametrize('fn,n', WRAPPERS)
+@pytest.mark.parametrize('stopping', STOPPING)
+def test_wrapper_arity(fn, n, stopping):
+    d = load_level('Basic')['world']
+    assert len(fn(load_vt_from_dict(d), 5., 0.1, **stopping)) == n
+    res = fn(load_vt_from_dict(d), 5., 0.1, return_outcome=True, **stopping)
+    assert len(res) == n + 1
+    assert isinstance(res[-1], RolloutOutcome)
+    assert (res[-1].success, res[-1].time) == (res[-3], res[-2])
+
+
+def test_wrapper_outcome_reports_predicate():
+    d = load_level('Basic')['world']
+    res = run_game(load_vt_from_dict(d), 5., 0.1, stop_predicates=[StopWhen(lambda v: v.time > 1., 'late')],
+                   return_outcome=True)
+    assert res[-1].stop_reason == 'predicate'
+    assert res[-1].stopped_by == 'late'
+
+
+@pytest.mark.parametrize('method,n', [('run_placement', 2), ('observe_placement_path', 3),
+                                      ('observe_full_path', 3), ('observe_geom_path', 3),
+                                      ('observe_game_path', 4), ('observe_collision_events', 4)])
+def test_interface_arity(method, n):
+    tp = ToolPicker(load_level('Basic'))
+    tp.quiescence = QuiescenceDetector()
+    legal = {'tool': 'obj1', 'position': (90, 400)}
+    illegal = {'tool': 'obj1', 'position': (300, 10)}
+    preds = [StopWhen(lambda v: v.time > 1., 'late')]
+    fn = getattr(tp, method)
+    assert len(fn(legal, maxtime=5., stop_predicates=preds)) == n
+    res = fn(legal, maxtime=5., stop_predicates=preds, return_outcome=True)
+    assert len(res) == n + 1 and res[-1].stop_reason == 'predicate'
+    if method == 'observe_placement_path':
+        return
+    bad = fn(illegal, maxtime=5., stop_predicates=preds, return_outcome=True)
+    assert len(fn(illegal, maxtime=5., stop_predicates=preds)) == len(bad) - 1
+    assert bad[-1] == RolloutOutcome(None, -1, 'illegal')
+
+
+def test_run_placements_pairs_under_quiescence():
+    # Callers unpack (success, time) from every result
+    tp = ToolPicker(load_level('Basic'))
+    tp.quiescence = QuiescenceDetector()
+    for r, _ in tp.run_placements([{'tool': 'obj1', 'position': (90, 400)},
+                                   {'tool': 'obj1', 'position': (300, 10)}], maxtime=5.):
+        assert r in [True, False, None]
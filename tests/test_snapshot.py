@@ -0,0 +1,55 @@
+import glob
+import json
+import os
+import pytest
+from virtualtools.world import load_vt_from_dict
+
+TRIAL_DIR = os.path.join(os.path.dirname(__file__), '..', 'virtualtools', 'trials', 'Original')
+
+
+def load_level(name):
+    with open(os.path.join(TRIAL_DIR, name + '.json'), 'r') as ifl:
+        return json.load(ifl)['world']
+
+
+def collision_counts(w):
+    return sorted([(tuple(sorted(e[:2])), e[2]) for e in w._collision_events])
+
+
+@pytest.mark.parametrize('level', ['Basic', 'Catapult', 'Towers_A', 'Unsupport'])
+def test_restore_round_trip(level):
+    w = load_vt_from_dict(load_level(level))
+    snap = w.snapshot()
+    w.add_placed_circle('PLACED', (300, 500), 10, (0, 0, 255))
+    for _ in range(20):
+        w.step(0.1)
+    w.restore(snap)
+    assert 'PLACED' not in w.objects
+    again = w.snapshot()
+    assert again['time'] == snap['time']
+    assert again['objects'] == snap['objects']
+    assert again['bodies'] == snap['bodies']
+    assert again['collision_events'] == snap['collision_events']
+
+
+def test_restore_rejects_removed_objects():
+    w = load_vt_from_dict(load_level('Basic'))
+    snap = w.snapshot()
+    w.remove_object([nm for nm, o in w.objects.items() if not o.is_static()][0])
+    with pytest.raises(AssertionError):
+        w.restore(snap)
+
+
+@pytest.mark.parametrize('level', sorted([os.path.basename(f)[:-5] for f in glob.glob(os.path.join(TRIAL_DIR, '*.json'))]))
+def test_restore_first_step_events_match_fresh(level):
+    # Contacts left over from before the restore must neither end nor hide the contacts a fresh world starts with
+    d = load_level(level)
+    w = load_vt_from_dict(d)
+    snap = w.snapshot()
+    for _ in range(300):
+        w.step(w.bts)
+    w.restore(snap)
+    fresh = load_vt_from_dict(d)
+    w.step(w.bts)
+    fresh.step(fresh.bts)
+    assert collision_counts(w) == collision_counts(fresh)
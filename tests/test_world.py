@@ -0,0 +1,29 @@
+import json
+import os
+import pytest
+from virtualtools.world import load_vt_from_dict
+from virtualtools.world import world as world_module
+from virtualtools.interfaces import get_collisions
+
+TRIAL_DIR = os.path.join(os.path.dirname(__file__), '..', 'virtualtools', 'trials', 'Original')
+
+
+def load_level(name):
+    with open(os.path.join(TRIAL_DIR, name + '.json'), 'r') as ifl:
+        return json.load(ifl)['world']
+
+
+def rollout(d):
+    w = load_vt_from_dict(d)
+    path, collisions, success, t = get_collisions(w, 5., 0.1)
+    return repr((path, collisions, success, t))
+
+
+@pytest.mark.parametrize('level', ['Basic', 'Catapult', 'Unsupport'])
+def test_python_callback_fallback_matches(level, monkeypatch):
+    # Without access to pymunk's C callbacks, unused events get empty Python callbacks instead
+    d = load_level(level)
+    expected = rollout(d)
+    monkeypatch.setattr(world_module, '_DEFAULT_CALLBACKS', None)
+    assert rollout(d) == expected
+
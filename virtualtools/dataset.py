@@ -31,6 +31,7 @@ def get_feasible_actions(set, name, variation, size, tool, balance=0.5, with_var
 
     tp = ToolPicker(btr)
     wd = load_vt_from_dict(tp._worlddict)
+    fsm = tp.free_space_map(tool)
 
     areas = []
     dynamic_objects = wd.get_dynamic_objects()
@@ -56,8 +57,9 @@ def get_feasible_actions(set, name, variation, size, tool, balance=0.5, with_var
         x = np.random.randint(area[0], area[2])
         y = np.random.randint(area[1], area[3])
 
+        if not fsm.is_valid((x, y)):
+            continue
         try:
-            tp.place({"tool": tool, "position": (x, y)})
             path_dict, fcol, success, _, aux_wd = tp.observe_collision_events(action={'tool': tool, 'position': (x,y)}, maxtime=20., stop_on_goal=True, return_world=True)
             if not path_dict or not fcol:
                 continue
@@ -96,11 +98,8 @@ def get_feasible_actions(set, name, variation, size, tool, balance=0.5, with_var
     i = 0
     while len(feasible_actions) < size:
         action = actions[i]
-        try:
-            tp.place({"tool": tool, "position": (action[0], action[1])})
+        if fsm.is_valid(action):
             feasible_actions.append(action)
-        except:
-            pass
         i += 1
 
     print(f"Total generated actions: {len(feasible_actions)}")
@@ -65,7 +65,9 @@ class VTGenerator(ABC):
             interface = self.propose_world()
             if verbose:
                 print('Generated world')
-            if self.check_placements(interface, verbose):
+            passed = self.check_placements(interface, verbose)
+            interface.close_pool()
+            if passed:
                 if verbose:
                     print('Passed checks - returning')
                 return interface
@@ -153,15 +155,16 @@ class VTGenerator(ABC):
         else:
             raise ValueError("plc_type must be one of 'any', 'specific', or 'lure'")
         numsuc = 0
-        for _ in range(self._opts['nsims']):
-            act = fn(interface)
-            r = None
-            # Ignore failed placements
-            while r is None:
-                act = fn(interface)
-                r = interface.run_placement(act)[0]
-            if r:
-                numsuc += 1
+        nleft = self._opts['nsims']
+        # Run placements in batches, redrawing failed placements until there are enough legal ones
+        while nleft > 0:
+            acts = [fn(interface) for _ in range(nleft)]
+            for r, _ in interface.run_placements(acts, workers=self._opts['workers']):
+                if r is None:
+                    continue
+                nleft -= 1
+                if r:
+                    numsuc += 1
         return numsuc / self._opts['nsims']
 
     # Function to set defaults options (see above)
@@ -176,6 +179,7 @@ class VTGenerator(ABC):
         _set_opt('min_lure_place', 0.0)
         _set_opt('max_lure_place', 1.0)
         _set_opt('nsims', 100)
+        _set_opt('workers', None)
         
     @property
     def options(self):
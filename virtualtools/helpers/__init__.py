@@ -2,6 +2,7 @@ from .pmhelp import *
 from .geom import *
 from .physics import *
 from .misc import *
+from .stats import *
 
 
 __all__ = [
@@ -12,5 +13,7 @@ __all__ = [
     # Functions on the world: physics
     'distance_to_object', 'object_bounding_box', 'filter_collision_events', 'strip_goal',
     # Others: misc
-    'word_to_color'
+    'word_to_color', 'canonical_hash',
+    # Binomial intervals: stats
+    'wilson_interval', 'beta_interval', 'success_interval'
 ]
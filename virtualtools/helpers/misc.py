@@ -1,4 +1,7 @@
-from typing import Tuple, Annotated, Dict
+from typing import Tuple, Annotated, Dict, Any
+import json
+import hashlib
+import numpy as np
 
 
 
@@ -41,3 +44,44 @@ def word_to_color(colorname: str):
             return (0, 0, 0, 0)
         else:
             raise Exception('Color name not known: ' + c)
+
+
+def _canonicalize(obj: Any) -> Any:
+    # JSON-ready version of obj where equal values look the same (tuples and arrays become lists, every number a float)
+    # Fast paths for the types that make up nearly all of a world dict
+    t = type(obj)
+    if t is float:
+        return obj
+    if t is list or t is tuple:
+        return [_canonicalize(v) for v in obj]
+    if t is int:
+        return float(obj)
+    if obj is None or isinstance(obj, str):
+        return obj
+    if isinstance(obj, (bool, np.bool_)):
+        return bool(obj)
+    if isinstance(obj, (int, float, np.integer, np.floating)):
+        return float(obj)
+    if isinstance(obj, dict):
+        return dict([(str(k), _canonicalize(v)) for k, v in obj.items()])
+    if isinstance(obj, (list, tuple, np.ndarray)):
+        return [_canonicalize(v) for v in obj]
+    raise TypeError("Cannot canonicalize object of type " + str(type(obj)))
+
+
+def canonical_hash(obj: Any) -> str:
+    """Returns a stable hash of a JSON-like object, e.g., a world dict or an action
+
+    The hash does not depend on dict ordering, or on whether numbers are ints, floats, or numpy scalars, or sequences are lists, tuples, or numpy arrays, so it is the same across processes and runs
+
+    Args:
+        obj (Any): a structure of dicts, sequences, numbers, strings, and None
+
+    Raises:
+        TypeError: if obj contains anything else
+
+    Returns:
+        str: a hex digest identifying the object
+    """
+    enc = json.dumps(_canonicalize(obj), sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(enc.encode('utf-8')).hexdigest()
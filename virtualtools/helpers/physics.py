@@ -3,7 +3,6 @@ from ..world.abstracts import VTObject, VTCond_Base
 import pymunk as pm
 import numpy as np
 import scipy.spatial as sps
-import re
 import operator
 import copy
 
@@ -79,9 +78,10 @@ def filter_collision_events(eventlist, slop_time = .2):
             tmp = o2
             o2 = o1
             o1 = tmp
-            # Also need to swap the normals
-            ci[0] = -ci[0]
-        comb = re.sub('__', '_', o1+"_"+o2).strip('_') # Filtering for objects that start with _
+            # Also need to swap the normals (without changing the input events)
+            ci = [-ci[0]] + list(ci[1:])
+        # Key on the name pair itself: joining names with '_' breaks for names that contain it
+        comb = (o1, o2)
         if tp == 'begin':
             # We have already seen them disconnect
             if comb in last_list.keys():
@@ -110,7 +110,7 @@ def filter_collision_events(eventlist, slop_time = .2):
 
     # Clear out disconnects that never reconnect
     for comb, tm in last_list.items():
-        o1, o2 = comb.split('_')
+        o1, o2 = comb
         try:
             output_events.append([o1,o2,begin_list[comb], last_list[comb], col_list[comb]])
             del begin_list[comb]
@@ -122,7 +122,7 @@ def filter_collision_events(eventlist, slop_time = .2):
 
     # Add in the items still in contact
     for comb, tm in begin_list.items():
-        o1, o2 = comb.split('_')
+        o1, o2 = comb
         output_events.append([o1,o2,tm,None,col_list_beg[comb]])
 
     return sorted(output_events, key=operator.itemgetter(2))
@@ -0,0 +1,66 @@
+from typing import Tuple
+from scipy.stats import norm, beta
+
+__all__ = ['wilson_interval', 'beta_interval', 'success_interval']
+
+
+def wilson_interval(successes: int, n: int, confidence: float = 0.95) -> Tuple[float, float]:
+    """Returns the Wilson score interval for a binomial proportion
+
+    Args:
+        successes (int): the number of successes
+        n (int): the number of trials
+        confidence (float, optional): the coverage of the interval. Defaults to 0.95.
+
+    Returns:
+        Tuple[float, float]: the (lower, upper) bounds of the interval; (0, 1) if there are no trials
+    """
+    if n == 0:
+        return (0., 1.)
+    z = norm.ppf(0.5 + confidence / 2)
+    p = successes / n
+    denom = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denom
+    half = z * ((p * (1 - p) / n + z * z / (4 * n * n)) ** 0.5) / denom
+    return (float(max(0., center - half)), float(min(1., center + half)))
+
+
+def beta_interval(successes: int, n: int, confidence: float = 0.95,
+                  prior: Tuple[float, float] = (1., 1.)) -> Tuple[float, float]:
+    """Returns the equal-tailed Bayesian credible interval for a binomial proportion under a beta prior
+
+    Args:
+        successes (int): the number of successes
+        n (int): the number of trials
+        confidence (float, optional): the posterior mass inside the interval. Defaults to 0.95.
+        prior (Tuple[float, float], optional): the (alpha, beta) parameters of the prior. Defaults to (1., 1.) (uniform).
+
+    Returns:
+        Tuple[float, float]: the (lower, upper) bounds of the interval
+    """
+    a = prior[0] + successes
+    b = prior[1] + n - successes
+    tail = (1 - confidence) / 2
+    return (float(beta.ppf(tail, a, b)), float(beta.ppf(1 - tail, a, b)))
+
+
+def success_interval(successes: int, n: int, confidence: float = 0.95,
+                     method: str = 'wilson') -> Tuple[float, float]:
+    """Returns an interval for a success probability
+
+    Args:
+        successes (int): the number of successes
+        n (int): the number of trials
+        confidence (float, optional): the coverage of the interval. Defaults to 0.95.
+        method (str, optional): either 'wilson' (`wilson_interval`) or 'bayes' (`beta_interval` with a uniform prior). Defaults to 'wilson'.
+
+    Raises:
+        AssertionError: if the method is not 'wilson' or 'bayes'
+
+    Returns:
+        Tuple[float, float]: the (lower, upper) bounds of the interval
+    """
+    assert method in ['wilson', 'bayes'], "Interval method must be 'wilson' or 'bayes'"
+    if method == 'wilson':
+        return wilson_interval(successes, n, confidence)
+    return beta_interval(successes, n, confidence)
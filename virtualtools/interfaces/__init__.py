@@ -1,4 +1,11 @@
-from .running import run_game, get_path, get_state_path, get_geom_path, get_collisions, CollisionError
+from .running import run_game, get_path, get_state_path, get_geom_path, get_collisions, CollisionError, \
+    simulate, iter_rollout, ROLLOUT_FIELDS, RolloutOutcome, QuiescenceDetector, RolloutView, StopPredicate, \
+    StopWhen, StopInRegion, StopOnTouch, Recorder, StateRecorder, BoundingBoxRecorder, GeomRecorder, \
+    GoalTimeRecorder, SatisfiedTimesRecorder, CollisionRecorder
+from .trajectory import Trajectory
+from .branching import Branch, BranchResult, apply_branch, run_branches
+from .freespace import FreeSpaceMap, compute_free_space
+from .cache import RolloutCache
 from .vtinterface import VTInterface, check_collision_by_polys, place_object_by_polys, VTActionError
 from .toolpicker import ToolPicker, load_tool_picker
 from .vertexdrawer import VertexDrawer
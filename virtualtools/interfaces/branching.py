@@ -0,0 +1,165 @@
+from typing import Tuple, Dict, List, Callable, NamedTuple
+import multiprocessing as mp
+import pickle
+from ..world import VTWorld, noisify_collisions
+from .running import Recorder, RolloutOutcome, simulate
+
+"""
+Branching rollouts: simulate a world up to a fork time once, then continue many copies of it
+(each with its own kicks, collision noise, or property changes) from that point
+
+    prefix ----- fork_time --+-- branch 0 ------->
+                             +-- branch 1 ------->
+                             +-- ...
+"""
+
+__all__ = ['Branch', 'BranchResult', 'apply_branch', 'run_branches']
+
+
+class Branch(NamedTuple):
+    """The changes made to a copy of the world at the fork time before it is continued
+
+    Args:
+        kicks (Tuple, optional): (object name, impulse, position) triples, each applied with `VTWorld.kick`. Defaults to ().
+        collision_noise (Dict, optional): keyword arguments for `noisify_collisions` (noise_collision_direction, noise_collision_elasticity, seed, seed_index). Defaults to None (the branch keeps the collision noise of the prefix, if any).
+        properties (Dict, optional): new object properties, as {object name: {'friction': ..., 'elasticity': ...}}. Defaults to None.
+        gravity (float, optional): a new strength of gravity. Defaults to None (unchanged).
+    """
+    kicks: Tuple = ()
+    collision_noise: Dict = None
+    properties: Dict = None
+    gravity: float = None
+
+
+class BranchResult(NamedTuple):
+    """The result of one branch: its outcome (with times measured from the start of the prefix), and the recorders that observed it from the fork onwards
+    """
+    outcome: RolloutOutcome
+    recorders: List[Recorder]
+
+
+# Object properties that branches may change
+_BRANCH_PROPERTIES = ['friction', 'elasticity']
+
+
+def apply_branch(gameworld: VTWorld, branch: Branch):
+    """Makes the changes described by a branch to a world, in place
+
+    Args:
+        gameworld (VTWorld): the world to change (usually a copy of the world at the fork time)
+        branch (Branch): the changes to make
+
+    Raises:
+        AssertionError: if a property other than friction or elasticity is changed, or an object does not exist
+    """
+    if branch.gravity is not None:
+        gameworld.gravity = branch.gravity
+    if branch.properties:
+        for onm, props in branch.properties.items():
+            o = gameworld.get_object(onm)
+            for k, v in props.items():
+                assert k in _BRANCH_PROPERTIES, "Branches can only change " + ", ".join(_BRANCH_PROPERTIES)
+                setattr(o, k, v)
+    for onm, impulse, position in branch.kicks:
+        gameworld.kick(onm, impulse, position)
+    if branch.collision_noise is not None:
+        noisify_collisions(gameworld, **branch.collision_noise)
+
+
+def _run_prefix(gameworld: VTWorld,
+                fork_time: float,
+                step_size: float,
+                recorders: List[Recorder]) -> bool:
+    # Steps until the fork time (measured on the world clock); returns whether the goal was met first
+    for r in recorders:
+        r.start(gameworld)
+    won = gameworld.check_end()
+    # Half a step of tolerance, so accumulated rounding doesn't add an extra step
+    while not won and gameworld.time < fork_time - step_size / 2:
+        gameworld.step(step_size)
+        for r in recorders:
+            r.record(gameworld)
+        won = gameworld.check_end()
+    for r in recorders:
+        r.finish(gameworld)
+    return won
+
+
+def _run_branch(fork_world: VTWorld,
+                branch: Branch,
+                start_time: float,
+                maxtime: float,
+                step_size: float,
+                recorders: Callable[[], List[Recorder]]) -> BranchResult:
+    child = fork_world.copy()
+    apply_branch(child, branch)
+    recs = recorders() if recorders is not None else []
+    elapsed = child.time - start_time
+    out = simulate(child, maxtime - elapsed, step_size, recs)
+    return BranchResult(RolloutOutcome(out.success, elapsed + out.time, out.stop_reason), recs)
+
+
+# The world at the fork time held by each worker process (set once by the pool initializer)
+_worker_fork_world = None
+
+
+def _init_branch_worker(world_bytes: bytes):
+    global _worker_fork_world
+    _worker_fork_world = pickle.loads(world_bytes)
+
+
+def _run_branch_in_worker(job):
+    return _run_branch(_worker_fork_world, *job)
+
+
+def run_branches(gameworld: VTWorld,
+                 fork_time: float,
+                 branches: List[Branch],
+                 maxtime: float=20.,
+                 step_size: float=0.1,
+                 recorders: Callable[[], List[Recorder]]=None,
+                 prefix_recorders: List[Recorder]=(),
+                 workers: int=None
+                 ) -> List[BranchResult]:
+    """Simulates a world up to a fork time once, then continues a copy of it for each branch
+
+    The prefix is run on `gameworld` itself (which is left at the fork time); each branch continues from a `VTWorld.copy` of it, so mid-simulation state (velocities, collision records, goal progress) carries over into every branch. Times in the outcomes are measured from the world time at the start of the call. If the goal is met during the prefix, the branches are not simulated and each reports the prefix outcome
+
+    Args:
+        gameworld (VTWorld): the world to simulate (with all objects added)
+        fork_time (float): the world time at which to branch; rounded to a whole number of steps
+        branches (List[Branch]): the changes for each branch
+        maxtime (float, optional): the total time (prefix and branch) to run before timing out. Defaults to 20.
+        step_size (float, optional): the time between checking for solutions (and recording). Defaults to 0.1.
+        recorders (Callable[[], List[Recorder]], optional): makes a fresh list of recorders for each branch; these start at the fork. Defaults to None (no recorders).
+        prefix_recorders (List[Recorder], optional): recorders to feed during the prefix. Defaults to ().
+        workers (int, optional): if more than 1, runs the branches in this many worker processes. The world at the fork time is sent to each worker once, so any handlers set on it must be picklable, as must `recorders`. Defaults to None (run serially).
+
+    Returns:
+        List[BranchResult]: the (outcome, recorders) of each branch, in the same order as `branches`
+    """
+    start_time = gameworld.time
+    assert fork_time >= start_time, "Cannot fork a world before its current time"
+    assert fork_time - start_time <= maxtime, "Fork time must fall within maxtime"
+    if _run_prefix(gameworld, fork_time, step_size, prefix_recorders):
+        out = RolloutOutcome(True, gameworld.time - start_time, "goal")
+        results = []
+        for _ in branches:
+            recs = recorders() if recorders is not None else []
+            for r in recs:
+                r.start(gameworld)
+                r.finish(gameworld)
+            results.append(BranchResult(out, recs))
+        return results
+
+    jobs = [(b, start_time, maxtime, step_size, recorders) for b in branches]
+    if workers is None or workers <= 1 or len(jobs) <= 1:
+        return [_run_branch(gameworld, *job) for job in jobs]
+    pool = mp.Pool(min(workers, len(jobs)),
+                   initializer=_init_branch_worker,
+                   initargs=(pickle.dumps(gameworld, protocol=pickle.HIGHEST_PROTOCOL),))
+    try:
+        return pool.map(_run_branch_in_worker, jobs)
+    finally:
+        pool.close()
+        pool.join()
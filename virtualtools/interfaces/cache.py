@@ -0,0 +1,142 @@
+from typing import Any
+from collections import OrderedDict
+import functools
+import inspect
+import os
+import pickle
+import sqlite3
+
+__all__ = ['RolloutCache', 'cached_rollout']
+
+
+class RolloutCache:
+
+    def __init__(self, max_entries: int = 1024, path: str = None):
+        """A content-addressed store of rollout results, with a bounded in-memory LRU and an optional on-disk sqlite backend
+
+        Results are stored pickled, so every lookup returns a fresh copy that callers can modify freely. The sqlite file can be shared between processes (including the workers of a VTWorkerPool) and between runs; each process opens its own connection
+
+        Args:
+            max_entries (int, optional): the most results held in memory. Defaults to 1024.
+            path (str, optional): the path of a sqlite database to also store results in. Defaults to None (memory only).
+        """
+        assert max_entries > 0, "Cache must be able to hold at least one entry"
+        self._max_entries = max_entries
+        self._path = path
+        self._memory = OrderedDict()
+        self._conn = None
+        self._conn_pid = None
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self):
+        # Only the settings travel; each process keeps its own memory and connection
+        return {'max_entries': self._max_entries, 'path': self._path}
+
+    def __setstate__(self, state):
+        self.__init__(state['max_entries'], state['path'])
+
+    def _connect(self) -> sqlite3.Connection:
+        # Connections cannot be shared across a fork, so reopen in each process
+        if self._conn is None or self._conn_pid != os.getpid():
+            self._conn = sqlite3.connect(self._path, timeout=60)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('CREATE TABLE IF NOT EXISTS rollouts (key TEXT PRIMARY KEY, value BLOB)')
+            self._conn.commit()
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def _remember(self, key: str, blob: bytes):
+        self._memory[key] = blob
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Looks up a result
+
+        Args:
+            key (str): the key the result was stored under
+            default (Any, optional): what to return if there is no result. Defaults to None.
+
+        Returns:
+            Any: the result, or `default`
+        """
+        blob = self._memory.get(key)
+        if blob is not None:
+            self._memory.move_to_end(key)
+        elif self._path is not None:
+            row = self._connect().execute('SELECT value FROM rollouts WHERE key = ?', (key,)).fetchone()
+            if row is not None:
+                blob = row[0]
+                self._remember(key, blob)
+        if blob is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return pickle.loads(blob)
+
+    def put(self, key: str, value: Any):
+        """Stores a result
+
+        Args:
+            key (str): the key to store the result under
+            value (Any): the (picklable) result
+        """
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self._remember(key, blob)
+        if self._path is not None:
+            conn = self._connect()
+            conn.execute('INSERT OR REPLACE INTO rollouts (key, value) VALUES (?, ?)',
+                         (key, sqlite3.Binary(blob)))
+            conn.commit()
+
+    def clear(self):
+        """Removes all stored results (from memory and disk)
+        """
+        self._memory = OrderedDict()
+        if self._path is not None:
+            conn = self._connect()
+            conn.execute('DELETE FROM rollouts')
+            conn.commit()
+
+    def __len__(self):
+        if self._path is not None:
+            return self._connect().execute('SELECT COUNT(*) FROM rollouts').fetchone()[0]
+        return len(self._memory)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries
+
+
+def cached_rollout(method):
+    """Wraps a VTInterface rollout method (run_placement and the observe_* methods) to look its results up in the interface's RolloutCache
+
+    Calls bypass the cache when the interface has no cache, when the world is returned (`return_world=True`), when object properties are adjusted, when stop predicates are given (they can be arbitrary functions), or when the noise is not seeded (so each call is a fresh sample)
+    """
+    sig = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        # Bind positional and keyword arguments alike, so the key does not depend on how they were passed
+        bound = sig.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        a = bound.arguments
+        key = None
+        if self._cache is not None and not a.get('return_world') and not a['new_object_properties'] \
+                and a.get('stop_predicates') is None:
+            key = self._rollout_key(method.__name__, a['action'], a['noise'], a['maxtime'], a['stop_on_goal'],
+                                    a.get('fidelity'), a.get('return_outcome', False))
+        if key is None:
+            return method(*bound.args, **bound.kwargs)
+        result = self._cache.get(key)
+        if result is None:
+            result = method(*bound.args, **bound.kwargs)
+            self._cache.put(key, result)
+        return result
+    return wrapper
@@ -0,0 +1,171 @@
+from typing import Tuple, List
+import numpy as np
+import pymunk as pm
+from scipy.spatial import ConvexHull
+from ..world import VTWorld
+
+__all__ = ['FreeSpaceMap', 'compute_free_space']
+
+# Number of sides used to approximate circles (and the ends of segments)
+_CIRCLE_SIDES = 16
+
+
+def _circle_poly(center, radius: float) -> np.ndarray:
+    # Circumscribed polygon, so it fully covers the circle (errs towards "blocked")
+    r = radius / np.cos(np.pi / _CIRCLE_SIDES)
+    angs = np.arange(_CIRCLE_SIDES) * (2 * np.pi / _CIRCLE_SIDES)
+    return np.stack([center[0] + r * np.cos(angs), center[1] + r * np.sin(angs)], axis=1)
+
+
+def _shape_points(shape: pm.Shape) -> np.ndarray:
+    # Points (in world coordinates) whose convex hull covers the shape
+    b = shape.body
+    if isinstance(shape, pm.Poly):
+        pts = np.array([tuple(b.local_to_world(v)) for v in shape.get_vertices()])
+        if shape.radius > 0:
+            pts = np.concatenate([_circle_poly(p, shape.radius) for p in pts])
+        return pts
+    elif isinstance(shape, pm.Circle):
+        return _circle_poly(tuple(b.local_to_world(shape.offset)), shape.radius)
+    elif isinstance(shape, pm.Segment):
+        return np.concatenate([_circle_poly(tuple(b.local_to_world(shape.a)), shape.radius),
+                               _circle_poly(tuple(b.local_to_world(shape.b)), shape.radius)])
+    else:
+        raise NotImplementedError("Cannot rasterize shape of type " + str(type(shape)))
+
+
+def _minkowski_poly(obstacle: np.ndarray, part: np.ndarray) -> np.ndarray:
+    # The set of placement points p where (part + p) overlaps the obstacle is
+    #  obstacle (+) (-part), which for convex shapes is the hull of all vertex differences
+    diffs = (obstacle[:, np.newaxis, :] - part[np.newaxis, :, :]).reshape(-1, 2)
+    hull = ConvexHull(diffs)
+    # scipy gives 2D hull vertices in counterclockwise order
+    return diffs[hull.vertices]
+
+
+def compute_free_space(world: VTWorld,
+                       tool_polys: List[List[Tuple[float, float]]],
+                       resolution: float = 1.) -> np.ndarray:
+    """Finds every grid position in a world where a tool could be placed without overlapping anything
+
+    Each convex part of the tool is swept against each shape in the world (objects, goals, container sensors, and blockers) by taking their Minkowski sum, and every grid point inside any of these sums is marked as blocked. The sums are grown by one grid cell in each direction, so every grid point around a blocked position is blocked too; this lets `FreeSpaceMap.is_valid` answer for positions between grid points without ever passing one that overlaps something, at the cost of a band (one cell wide) of legal positions next to each obstacle. Circles and the rounded ends of segments are approximated by circumscribed polygons, which likewise only err towards "blocked"
+
+    Args:
+        world (VTWorld): the world to place into
+        tool_polys (List[List[Tuple[float, float]]]): the convex polygons making up the tool, relative to the placement point
+        resolution (float, optional): the spacing of the grid in pixels. Defaults to 1.
+
+    Returns:
+        np.ndarray: a boolean (nx, ny) array; entry [i, j] is True if the tool can be placed at (i*resolution, j*resolution)
+    """
+    xs = np.arange(0, world.dims[0], resolution)
+    ys = np.arange(0, world.dims[1], resolution)
+    valid = np.ones((len(xs), len(ys)), dtype=bool)
+    # Growing each part by the square of half-width `resolution` grows the swept shapes by a grid cell
+    #  (the small extra margin keeps points exactly one cell away blocked despite rounding)
+    r = resolution * (1 + 1e-6)
+    cell = np.array([[-r, -r], [r, -r], [r, r], [-r, r]])
+    parts = [(np.array(p, dtype=float)[:, np.newaxis, :] + cell[np.newaxis, :, :]).reshape(-1, 2)
+             for p in tool_polys]
+    obstacles = []
+    for o in list(world.objects.values()) + list(world.blockers.values()):
+        for s in o._expose_all_shapes():
+            obstacles.append(_shape_points(s))
+
+    for obs in obstacles:
+        for part in parts:
+            mpoly = _minkowski_poly(obs, part)
+            # Only test the grid points inside the bounding box of the swept shape
+            lo = np.searchsorted(xs, mpoly[:, 0].min(), side='left')
+            hi = np.searchsorted(xs, mpoly[:, 0].max(), side='right')
+            bo = np.searchsorted(ys, mpoly[:, 1].min(), side='left')
+            to = np.searchsorted(ys, mpoly[:, 1].max(), side='right')
+            if lo >= hi or bo >= to:
+                continue
+            gx = xs[lo:hi, np.newaxis]
+            gy = ys[np.newaxis, bo:to]
+            inside = np.ones((hi - lo, to - bo), dtype=bool)
+            # A point is inside a CCW polygon if it is left of (or on) every edge
+            nxt = np.roll(mpoly, -1, axis=0)
+            for (vx, vy), (wx, wy) in zip(mpoly, nxt):
+                inside &= ((wx - vx) * (gy - vy) - (wy - vy) * (gx - vx)) >= 0
+            valid[lo:hi, bo:to] &= ~inside
+    return valid
+
+
+class FreeSpaceMap:
+
+    def __init__(self, valid: np.ndarray, resolution: float):
+        """A grid of the positions where a tool can be legally placed
+
+        Args:
+            valid (np.ndarray): a boolean (nx, ny) array; entry [i, j] is True if the tool can be placed at (i*resolution, j*resolution)
+            resolution (float): the spacing of the grid in pixels
+        """
+        self._valid = valid
+        self._res = resolution
+        self._positions = None
+
+    @property
+    def grid(self) -> np.ndarray:
+        """np.ndarray: the boolean (nx, ny) validity grid
+        """
+        return self._valid
+
+    @property
+    def resolution(self) -> float:
+        return self._res
+
+    @property
+    def positions(self) -> np.ndarray:
+        """np.ndarray: an (n, 2) array of every valid (x, y) grid position
+        """
+        if self._positions is None:
+            self._positions = np.argwhere(self._valid) * self._res
+        return self._positions
+
+    @property
+    def fraction_valid(self) -> float:
+        """float: the proportion of grid positions that are valid
+        """
+        return float(self._valid.mean())
+
+    def is_valid(self, position: Tuple[float, float]) -> bool:
+        """Checks whether a position is valid, using the grid points around it
+
+        A position between grid points is only called valid if every grid point around it is. Since blocked regions are grown by a grid cell (see `compute_free_space`), a position that overlaps anything always has a blocked grid point around it, so positions called valid are always legal placements
+
+        Args:
+            position (Tuple[float, float]): the (x, y) placement position
+
+        Returns:
+            bool: True if all surrounding grid points (or the grid point itself, for a position on the grid) are valid placements; False if any is not or if the position is off the grid
+        """
+        x = position[0] / self._res
+        y = position[1] / self._res
+        i0, i1 = int(np.floor(x)), int(np.ceil(x))
+        j0, j1 = int(np.floor(y)), int(np.ceil(y))
+        if i0 < 0 or j0 < 0 or i1 >= self._valid.shape[0] or j1 >= self._valid.shape[1]:
+            return False
+        return bool(self._valid[i0:i1+1, j0:j1+1].all())
+
+    def sample(self, n: int = 1, rng: np.random.Generator = None) -> np.ndarray:
+        """Draws valid placement positions uniformly from the grid
+
+        Args:
+            n (int, optional): the number of positions to draw. Defaults to 1.
+            rng (np.random.Generator, optional): the random generator to use. Defaults to numpy's global random state.
+
+        Returns:
+            np.ndarray: an (n, 2) array of (x, y) positions
+
+        Raises:
+            AssertionError: if there are no valid positions
+        """
+        pos = self.positions
+        assert len(pos) > 0, "No valid placement positions to sample from"
+        if rng is None:
+            idx = np.random.randint(0, len(pos), size=n)
+        else:
+            idx = rng.integers(0, len(pos), size=n)
+        return pos[idx]
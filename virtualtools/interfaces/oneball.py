@@ -4,7 +4,7 @@ Interface for a level that includes dropping a
 
 from typing import Tuple, Annotated, Dict
 from .vtinterface import VTInterface, place_ball
-from ..world import VTWorld
+from ..world import VTWorld, load_vt_from_dict
 import json
 
 __all__ = ['OneBall', 'load_one_ball']
@@ -14,9 +14,10 @@ class OneBall(VTInterface):
                  gamedict: Dict,
                  basic_timestep: float=0.1,
                  maxtime: float=20.,
-                 world_timestep: float=None):
+                 world_timestep: float=None,
+                 noise_seed: int=0):
         super().__init__(gamedict['world'], basic_timestep,
-                         maxtime, world_timestep)
+                         maxtime, world_timestep, noise_seed)
         self._ballsize = gamedict['ballsize']
         self._obdict = gamedict
         
@@ -35,6 +36,7 @@ class OneBall(VTInterface):
     def place(self,
               action: Dict,
               world: VTWorld=None) -> VTWorld:
+        world = world or load_vt_from_dict(self._worlddict)
         self._check_action(action)
         world = place_ball(world, self._ballsize, action['position'])
         return world
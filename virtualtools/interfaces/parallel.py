@@ -0,0 +1,175 @@
+from typing import Dict, List
+import multiprocessing as mp
+import os
+import pickle
+import numpy as np
+
+__all__ = ['VTWorkerPool', 'VTForkServer']
+
+# The interface held by each worker process (set once by the pool initializer)
+_worker_interface = None
+
+
+def _init_worker(interface_bytes: bytes):
+    global _worker_interface
+    _worker_interface = pickle.loads(interface_bytes)
+    # Forked workers inherit the parent's random state; reseed so noisy runs differ across workers
+    np.random.seed()
+    # Compile the base world spec up front so the first batch doesn't pay for it
+    _worker_interface._get_base_world()
+
+
+def _run_in_worker(job):
+    method, action, kwargs = job
+    return getattr(_worker_interface, method)(action, **kwargs)
+
+
+class VTWorkerPool:
+
+    def __init__(self, interface, workers: int):
+        """A long-lived set of worker processes that each hold their own copy of an interface
+
+        The interface (and its world) is deserialized once per worker when the pool starts; after that only actions and results are passed between processes. Each worker runs its rollouts serially, so throughput scales with the number of workers
+
+        Args:
+            interface (VTInterface): the interface to evaluate actions on
+            workers (int): the number of worker processes
+        """
+        assert workers > 1, "A worker pool needs at least two workers"
+        self._workers = workers
+        self._pool = mp.Pool(workers,
+                             initializer=_init_worker,
+                             initargs=(pickle.dumps(interface),))
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    def map(self, method: str, actions: List[Dict], kwargs: Dict = None,
+            item_kwargs: List[Dict] = None) -> List:
+        """Calls an interface method on each action in the workers
+
+        Args:
+            method (str): the name of the VTInterface method to call (e.g., "run_placement")
+            actions (List[Dict]): the actions to pass as the first argument
+            kwargs (Dict, optional): keyword arguments to pass along with every action. Defaults to None.
+            item_kwargs (List[Dict], optional): extra keyword arguments for each action (overriding `kwargs`). Defaults to None.
+
+        Returns:
+            List: the method results, in the same order as `actions`
+        """
+        kwargs = kwargs or {}
+        if item_kwargs is None:
+            jobs = [(method, a, kwargs) for a in actions]
+        else:
+            jobs = [(method, a, dict(kwargs, **ik)) for a, ik in zip(actions, item_kwargs)]
+        # A few chunks per worker balances load without too much messaging
+        chunksize = max(1, len(jobs) // (4 * self._workers))
+        return self._pool.map(_run_in_worker, jobs, chunksize=chunksize)
+
+    def close(self):
+        """Shuts down the worker processes
+        """
+        self._pool.close()
+        self._pool.join()
+
+
+class VTForkServer:
+
+    def __init__(self, interface, workers: int):
+        """Runs batches by forking the current process, so workers share the interface's memory copy-on-write
+
+        The interface's compiled base world specs and noisy world factories are built once, up front, in this process. Each batch then forks `workers` children with `os.fork`; they inherit the interface as it is (nothing is pickled on the way in) and only send their pickled results back through a pipe. Children are short-lived, so there are no idle processes between batches. Requires a platform with `os.fork` (not Windows), and the calling process should not be running other threads
+
+        Args:
+            interface (VTInterface): the interface to evaluate actions on
+            workers (int): the number of child processes per batch
+        """
+        assert workers > 1, "A fork server needs at least two workers"
+        assert hasattr(os, 'fork'), "The fork server requires os.fork"
+        self._interface = interface
+        self._workers = workers
+        # Warm everything the children would otherwise each build for themselves
+        for stop_on_goal in [True, False]:
+            interface._get_base_world(stop_on_goal)
+            interface._get_noisy_factory(stop_on_goal).contact_groups
+            interface._get_noisy_factory(stop_on_goal).touch_sets
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    def _run_child(self, jobs: List, fd: int):
+        # Runs in the forked child: never returns
+        status = 0
+        try:
+            # Children inherit the parent's random state; reseed so unseeded noise differs across children
+            np.random.seed()
+            try:
+                out = ('ok', [getattr(self._interface, m)(a, **kw) for m, a, kw in jobs])
+            except Exception as e:
+                out = ('error', e)
+                status = 1
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(out, f, protocol=pickle.HIGHEST_PROTOCOL)
+        finally:
+            os._exit(status)
+
+    def map(self, method: str, actions: List[Dict], kwargs: Dict = None,
+            item_kwargs: List[Dict] = None) -> List:
+        """Calls an interface method on each action in forked children
+
+        Args:
+            method (str): the name of the VTInterface method to call (e.g., "run_placement")
+            actions (List[Dict]): the actions to pass as the first argument
+            kwargs (Dict, optional): keyword arguments to pass along with every action. Defaults to None.
+            item_kwargs (List[Dict], optional): extra keyword arguments for each action (overriding `kwargs`). Defaults to None.
+
+        Raises:
+            Exception: the first exception raised by a call in any of the children
+
+        Returns:
+            List: the method results, in the same order as `actions`
+        """
+        kwargs = kwargs or {}
+        if item_kwargs is None:
+            jobs = [(method, a, kwargs) for a in actions]
+        else:
+            jobs = [(method, a, dict(kwargs, **ik)) for a, ik in zip(actions, item_kwargs)]
+        # One contiguous chunk per child keeps the results in order
+        nchild = min(self._workers, len(jobs))
+        bounds = [len(jobs) * i // nchild for i in range(nchild + 1)]
+        children = []
+        for i in range(nchild):
+            r, w = os.pipe()
+            pid = os.fork()
+            if pid == 0:
+                os.close(r)
+                for _, other_r in children:
+                    os.close(other_r)
+                self._run_child(jobs[bounds[i]:bounds[i+1]], w)
+            os.close(w)
+            children.append((pid, r))
+        results = []
+        error = None
+        # Reading each pipe to the end lets its child finish even if its results overflow the pipe buffer
+        for pid, r in children:
+            with os.fdopen(r, 'rb') as f:
+                data = f.read()
+            os.waitpid(pid, 0)
+            if not data:
+                error = error or RuntimeError("Fork server child " + str(pid) + " exited without results")
+                continue
+            status, out = pickle.loads(data)
+            if status == 'ok':
+                results.extend(out)
+            else:
+                error = error or out
+        if error is not None:
+            raise error
+        return results
+
+    def close(self):
+        """Nothing to shut down (children only live for one batch); kept to match VTWorkerPool
+        """
+        return
@@ -1,7 +1,8 @@
 from ..world import VTWorld
 import numpy as np
-from typing import Tuple, Dict, List
-from ..helpers import filter_collision_events
+from abc import ABC, abstractmethod
+from typing import Tuple, Dict, List, NamedTuple, Generator, Callable
+from .trajectory import Trajectory
 
 """
 Various functions for running the gameworld forward
@@ -10,8 +11,604 @@ Typically take in three arguments:
     gameworld (virtualtools.VTWorld): the gameworld (with all objects added)
     maxtime (float): the total time to run the world until time out. Defaults to 20s
     step_size (float): the time between checking for solutions. Defaults to 0.1s
+
+All of these are thin wrappers around `simulate`, which steps the world once and hands it to a
+list of recorders at every step; combine recorders to get several views out of a single rollout.
+They also take an optional `quiescence` detector (a QuiescenceDetector) to stop early, unsuccessfully,
+once the world has come to rest, and optional `stop_predicates` (StopPredicates) to stop as soon as any
+of them fires. Their results keep the same shape either way; pass `return_outcome=True` to have the
+RolloutOutcome (with the reason the rollout stopped and the predicate that fired) appended to the result
 """
 
+########################################
+# Recorders
+########################################
+
+class Recorder(ABC):
+    """Base class for objects that observe a world as it is stepped forward by `simulate`
+    """
+
+    def start(self, gameworld: VTWorld):
+        """Called once before the first step (by default records the initial state)
+
+        Args:
+            gameworld (VTWorld): the world being simulated
+        """
+        self.record(gameworld)
+
+    @abstractmethod
+    def record(self, gameworld: VTWorld):
+        """Called after every step of `step_size` seconds
+
+        Args:
+            gameworld (VTWorld): the world being simulated
+        """
+        raise NotImplementedError("record method must be overwritten")
+
+    def finish(self, gameworld: VTWorld):
+        """Called once after the last step
+
+        Args:
+            gameworld (VTWorld): the world being simulated
+        """
+        return
+
+    def __getstate__(self):
+        # Tracked bodies and objects belong to the world; only the records travel (e.g., back from worker processes)
+        state = self.__dict__.copy()
+        state.pop('_tracked', None)
+        return state
+
+
+def _dynamic_objects(gameworld: VTWorld) -> List:
+    return [(onm, o) for onm, o in gameworld.objects.items() if not o.is_static()]
+
+
+class StateRecorder(Recorder):
+    """Records [x, y, rotation, vx, vy] for every dynamic object at every step in `path` (a Trajectory)
+
+    Args:
+        maxtime (float, optional): the length of the rollout, used with step_size to preallocate the trajectory. Defaults to None (grow as needed).
+        step_size (float, optional): the time between records. Defaults to None.
+        dtype (type, optional): the floating point type to store states as. Defaults to np.float64.
+    """
+
+    def __init__(self, maxtime: float=None, step_size: float=None, dtype: type=np.float64):
+        if maxtime is not None and step_size is not None:
+            self._n_steps = Trajectory.steps_for(maxtime, step_size)
+        else:
+            self._n_steps = 256
+        self._dtype = dtype
+        self.path = None
+
+    def start(self, gameworld: VTWorld):
+        self._tracked = [(onm, o._cpBody) for onm, o in _dynamic_objects(gameworld)]
+        self.path = Trajectory([onm for onm, _ in self._tracked], self._n_steps, self._dtype)
+        self.record(gameworld)
+
+    def record(self, gameworld: VTWorld):
+        states = []
+        for _, b in self._tracked:
+            p = b.position
+            v = b.velocity
+            states.append((p.x, p.y, b.angle, v.x, v.y))
+        self.path.append(states)
+
+
+class BoundingBoxRecorder(Recorder):
+    """Records [x, y, rotation, bounding box, geometry] for every dynamic object at every step in `path`
+    """
+
+    def start(self, gameworld: VTWorld):
+        self._tracked = _dynamic_objects(gameworld)
+        self.path = dict([(onm, []) for onm, _ in self._tracked])
+        self.record(gameworld)
+
+    def record(self, gameworld: VTWorld):
+        path = self.path
+        for onm, o in self._tracked:
+            b = o._cpBody
+            p = b.position
+            geom = o.to_geom()
+            if o._cpShape is None:
+                # Multi-shape objects: bounding box of the geometry we already have
+                allverts = np.concatenate([np.array(poly) for poly in geom])
+                x_min, y_min = allverts.min(0)
+                x_max, y_max = allverts.max(0)
+                bb = (x_min, y_min, x_max, y_max)
+            else:
+                bb = o._cpShape.cache_bb()
+            path[onm].append([p.x, p.y, b.angle, bb, geom])
+
+
+class GeomRecorder(Recorder):
+    """Records the world-coordinate geometry (vertices, or position and radius for balls) of every dynamic object at every step in `path`. The first entry instead holds the initial [position, rotation, velocity]
+    """
+
+    def start(self, gameworld: VTWorld):
+        self._tracked = _dynamic_objects(gameworld)
+        self.path = dict([(onm, [[o.position, o.rotation, o.velocity]])
+                          for onm, o in self._tracked])
+
+    def record(self, gameworld: VTWorld):
+        path = self.path
+        for onm, o in self._tracked:
+            if o.type == 'Poly':
+                geom = o.vertices
+            elif o.type == 'Ball':
+                geom = [o.position, o.radius]
+            elif o.type == 'Container' or o.type == 'Compound':
+                geom = o.polys
+            else:
+                raise Exception('Shape type "' + o.type + '" not found')
+            path[onm].append([o.type, geom])
+
+
+class GoalTimeRecorder(Recorder):
+    """Records the time remaining on the goal condition after every step in `remaining_times` (-1 if the countdown has not started)
+    """
+
+    def start(self, gameworld: VTWorld):
+        self.remaining_times = []
+
+    def record(self, gameworld: VTWorld):
+        rt = gameworld.goal_cond.remaining_time()
+        if rt is None:
+            rt = -1
+        self.remaining_times.append(rt)
+
+
+class SatisfiedTimesRecorder(Recorder):
+    """Records the time each condition of the world's condition set (a VTCondSet, see `VTWorld.attach_cond_set`) was first met, in `satisfied_times` (None for conditions that never were)
+    """
+
+    def start(self, gameworld: VTWorld):
+        assert gameworld.goal_cond is not None and gameworld.goal_cond.type == 'CondSet', \
+            "SatisfiedTimesRecorder needs a world with a condition set"
+        self.satisfied_times = None
+
+    def record(self, gameworld: VTWorld):
+        return
+
+    def finish(self, gameworld: VTWorld):
+        self.satisfied_times = gameworld.goal_cond.satisfied_times()
+
+
+class CollisionRecorder(Recorder):
+    """Collects the collision episodes of the rollout (merged as they happen by the world's collision tracker) in `collisions`
+
+    Args:
+        collision_slop (float, optional): breaks in contact shorter than this are merged into a single collision. Defaults to 0.2001.
+    """
+
+    def __init__(self, collision_slop: float=0.2001):
+        self.collision_slop = collision_slop
+        self.collisions = None
+        self._was_recording = None
+
+    def start(self, gameworld: VTWorld):
+        # Worlds may have recording turned off to skip the begin/separate callbacks
+        self._was_recording = gameworld.record_collisions
+        gameworld.record_collisions = True
+        # Episodes are merged as they happen, so the tracker needs the slop up front
+        gameworld.collision_tracker.slop_time = self.collision_slop
+
+    def record(self, gameworld: VTWorld):
+        return
+
+    def finish(self, gameworld: VTWorld):
+        self.collisions = gameworld.collision_tracker.episodes()
+        gameworld.record_collisions = self._was_recording
+
+
+########################################
+# Simulation engine
+########################################
+
+class RolloutOutcome(NamedTuple):
+    """The result of `simulate`: whether the goal was accomplished, the time the world was stopped at, why it stopped ("goal", "timeout", "settled", or "predicate"; "illegal" for interface actions that could not be placed), and the name of the stop predicate that ended it (if any)
+    """
+    success: bool
+    time: float
+    stop_reason: str
+    stopped_by: str = None
+
+
+class QuiescenceDetector:
+
+    def __init__(self, energy_threshold: float=0.5, window: float=1.):
+        """Decides when a world has come to rest, so a rollout can stop early (with stop_reason "settled")
+
+        The world is at rest when no goal countdown is running and either every dynamic object is asleep, or the kinetic energy per unit mass of the dynamic objects has stayed below `energy_threshold` for `window` seconds. Energy is measured per unit mass so the threshold doesn't depend on the size or density of objects: the default of 0.5 is everything moving at about 1 unit/s
+
+        Args:
+            energy_threshold (float, optional): the kinetic energy per unit mass (in units^2/s^2) below which the world counts as still. Defaults to 0.5.
+            window (float, optional): how long (in seconds) the world must stay still. Defaults to 1.
+        """
+        assert energy_threshold >= 0 and window >= 0, "Quiescence threshold and window must be non-negative"
+        self.energy_threshold = energy_threshold
+        self.window = window
+        self.reset()
+
+    def reset(self):
+        """Forgets how long the world has been still (called at the start of each rollout)
+        """
+        self._still_for = 0.
+
+    def specific_energy(self, gameworld: VTWorld) -> float:
+        """Returns the kinetic energy (translational and rotational) of the dynamic objects per unit of their mass
+
+        Args:
+            gameworld (VTWorld): the world to measure
+
+        Returns:
+            float: the kinetic energy per unit mass; 0 if nothing can move
+        """
+        energy = 0.
+        mass = 0.
+        for b in gameworld._cpSpace.bodies:
+            v = b.velocity
+            energy += b.mass * (v.x * v.x + v.y * v.y) + b.moment * b.angular_velocity * b.angular_velocity
+            mass += b.mass
+        if mass == 0:
+            return 0.
+        return 0.5 * energy / mass
+
+    def update(self, gameworld: VTWorld, dt: float) -> bool:
+        """Checks the world after a step
+
+        Args:
+            gameworld (VTWorld): the world being simulated
+            dt (float): the time since the last update
+
+        Returns:
+            bool: True if the world has come to rest
+        """
+        gc = gameworld.goal_cond
+        if gc is not None and gc.remaining_time() is not None:
+            self._still_for = 0.
+            return False
+        if all([b.is_sleeping for b in gameworld._cpSpace.bodies]):
+            return True
+        if self.specific_energy(gameworld) < self.energy_threshold:
+            self._still_for += dt
+        else:
+            self._still_for = 0.
+        # Rounding slack so a window that is a whole number of steps is met on time
+        return self._still_for >= self.window - 1e-9
+
+
+########################################
+# Stop predicates
+########################################
+
+class RolloutView:
+
+    def __init__(self, gameworld: VTWorld):
+        """A cheap, read-only view of a world for stop predicates: the states of the dynamic objects are read straight off their physics bodies
+
+        Args:
+            gameworld (VTWorld): the world being simulated
+        """
+        self._world = gameworld
+        self._bodies = dict([(onm, o._cpBody) for onm, o in _dynamic_objects(gameworld)])
+
+    @property
+    def world(self) -> VTWorld:
+        return self._world
+
+    @property
+    def time(self) -> float:
+        return self._world.time
+
+    def position(self, name: str) -> Tuple[float, float]:
+        p = self._bodies[name].position
+        return (p.x, p.y)
+
+    def rotation(self, name: str) -> float:
+        return self._bodies[name].angle
+
+    def velocity(self, name: str) -> Tuple[float, float]:
+        v = self._bodies[name].velocity
+        return (v.x, v.y)
+
+    def remaining_time(self) -> float:
+        """Returns the time left on the goal condition (-1 if the countdown has not started or there is no goal)
+        """
+        gc = self._world.goal_cond
+        rt = None if gc is None else gc.remaining_time()
+        return -1 if rt is None else rt
+
+
+class StopPredicate:
+    """Base class for conditions that end a rollout early (with stop_reason "predicate")
+
+    State predicates override `check`, which is called on a RolloutView at every record interval. Collision predicates set `on_collision = True` and override `collision`, which is called from the world's solid begin handler whenever two objects start touching. When a predicate fires, the rollout stops at the end of the current step, and `fired_at` holds the world time it fired at
+
+    Args:
+        name (str): the name reported in RolloutOutcome.stopped_by
+    """
+    on_collision = False
+
+    def __init__(self, name: str):
+        self.name = name
+        self.fired_at = None
+
+    def start(self, gameworld: VTWorld):
+        """Called once before the first step (by default forgets when the predicate last fired)
+
+        Args:
+            gameworld (VTWorld): the world being simulated
+        """
+        self.fired_at = None
+
+    def check(self, view: RolloutView) -> bool:
+        """Called after every step
+
+        Args:
+            view (RolloutView): the state of the world
+
+        Returns:
+            bool: True to stop the rollout
+        """
+        return False
+
+    def collision(self, o1: str, o2: str) -> bool:
+        """Called when two (solid) objects start touching, if `on_collision` is set
+
+        Args:
+            o1 (str): the name of one object
+            o2 (str): the name of the other object
+
+        Returns:
+            bool: True to stop the rollout
+        """
+        return False
+
+
+class StopWhen(StopPredicate):
+    """Stops when a function of the world state returns True
+
+    Args:
+        fnc (Callable[[RolloutView], bool]): the test, called at every record interval
+        name (str, optional): the name to report. Defaults to None (the function's name).
+    """
+
+    def __init__(self, fnc: Callable[[RolloutView], bool], name: str=None):
+        super().__init__(name or fnc.__name__)
+        self.fnc = fnc
+
+    def check(self, view: RolloutView) -> bool:
+        return self.fnc(view)
+
+
+class StopInRegion(StopPredicate):
+    """Stops when the center of an object enters a rectangular region
+
+    Args:
+        obj (str): the name of the (dynamic) object to watch
+        region (Tuple[float, float, float, float]): the (left, bottom, right, top) bounds of the region
+        name (str, optional): the name to report. Defaults to None ("<obj>_in_region").
+    """
+
+    def __init__(self, obj: str, region: Tuple[float, float, float, float], name: str=None):
+        assert region[0] <= region[2] and region[1] <= region[3], "Region must be (left, bottom, right, top)"
+        super().__init__(name or obj + "_in_region")
+        self.obj = obj
+        self.region = tuple(region)
+
+    def check(self, view: RolloutView) -> bool:
+        x, y = view.position(self.obj)
+        l, b, r, t = self.region
+        return l <= x <= r and b <= y <= t
+
+
+class StopOnTouch(StopPredicate):
+    """Stops as soon as an object starts touching another (or anything)
+
+    Args:
+        obj (str): the name of the object to watch (e.g., "PLACED" for the placed tool)
+        other (str, optional): the name of the object it must touch. Defaults to None (any object).
+        name (str, optional): the name to report. Defaults to None ("<obj>_touch_<other>").
+    """
+    on_collision = True
+
+    def __init__(self, obj: str, other: str=None, name: str=None):
+        super().__init__(name or obj + "_touch_" + (other or "any"))
+        self.obj = obj
+        self.other = other
+
+    def collision(self, o1: str, o2: str) -> bool:
+        if o1 == self.obj:
+            return self.other is None or o2 == self.other
+        if o2 == self.obj:
+            return self.other is None or o1 == self.other
+        return False
+
+
+########################################
+# Simulation loop
+########################################
+
+def _run_steps(gameworld: VTWorld,
+               maxtime: float,
+               step_size: float,
+               quiescence: QuiescenceDetector=None,
+               stop_predicates: List[StopPredicate]=()
+               ) -> Generator[float, None, RolloutOutcome]:
+    # The core loop shared by `simulate` and `iter_rollout`: steps the world, yielding the elapsed
+    #  time after each step, and returns the RolloutOutcome once the rollout should stop
+    if quiescence is not None:
+        quiescence.reset()
+    stop_predicates = list(stop_predicates or ())
+    for p in stop_predicates:
+        p.start(gameworld)
+    state_preds = [p for p in stop_predicates if not p.on_collision]
+    touch_preds = [p for p in stop_predicates if p.on_collision]
+    view = RolloutView(gameworld) if state_preds else None
+    # Collision predicates are chained onto the begin handler (e.g., of a touch goal) for the rollout
+    fired = []
+    prev_begin = gameworld.solid_collision_begin
+    if touch_preds:
+        def begin(o1, o2):
+            prev_begin(o1, o2)
+            for p in touch_preds:
+                if p.fired_at is None and p.collision(o1.name, o2.name):
+                    p.fired_at = gameworld.time
+                    fired.append(p)
+        gameworld.solid_collision_begin = begin
+    try:
+        t = 0
+        while True:
+            gameworld.step(step_size)
+            t += step_size
+            yield t
+            if gameworld.check_end():
+                return RolloutOutcome(True, t, "goal")
+            for p in state_preds:
+                if p.check(view):
+                    p.fired_at = gameworld.time
+                    fired.append(p)
+                    break
+            if fired:
+                return RolloutOutcome(False, t, "predicate", fired[0].name)
+            if t >= maxtime:
+                return RolloutOutcome(False, t, "timeout")
+            if quiescence is not None and quiescence.update(gameworld, step_size):
+                return RolloutOutcome(False, t, "settled")
+    finally:
+        if touch_preds:
+            gameworld.solid_collision_begin = prev_begin
+
+
+def simulate(gameworld: VTWorld,
+             maxtime: float=20.,
+             step_size: float=0.1,
+             recorders: List[Recorder]=(),
+             quiescence: QuiescenceDetector=None,
+             stop_predicates: List[StopPredicate]=()
+             ) -> RolloutOutcome:
+    """Runs the world forward until the goal is accomplished or time runs out, calling each recorder after every step
+
+    Args:
+        gameworld (VTWorld): the gameworld (with all objects added)
+        maxtime (float, optional): the total time to run the world until time out. Defaults to 20.
+        step_size (float, optional): the time between checking for solutions (and recording). Defaults to 0.1.
+        recorders (List[Recorder], optional): the recorders to feed. Defaults to ().
+        quiescence (QuiescenceDetector, optional): if given, also stops (unsuccessfully, with stop_reason "settled") once the world has come to rest. Defaults to None.
+        stop_predicates (List[StopPredicate], optional): also stops (unsuccessfully, with stop_reason "predicate") as soon as any of these fires. The goal is checked first. Defaults to ().
+
+    Returns:
+        RolloutOutcome: (success, time, stop_reason, stopped_by)
+    """
+    for r in recorders:
+        r.start(gameworld)
+    steps = _run_steps(gameworld, maxtime, step_size, quiescence, stop_predicates)
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            out = stop.value
+            break
+        for r in recorders:
+            r.record(gameworld)
+    for r in recorders:
+        r.finish(gameworld)
+    return out
+
+
+# Fields that `iter_rollout` can report
+ROLLOUT_FIELDS = ['position', 'rotation', 'velocity', 'angular_velocity', 'remaining_time', 'collisions']
+
+
+def iter_rollout(gameworld: VTWorld,
+                 step_size: float=0.1,
+                 maxtime: float=20.,
+                 fields: List[str]=('position', 'rotation', 'velocity'),
+                 quiescence: QuiescenceDetector=None,
+                 stop_predicates: List[StopPredicate]=()
+                 ) -> Generator[Dict, None, RolloutOutcome]:
+    """Runs the world forward like `simulate`, but yields a record of the state after every step instead of storing the path
+
+    Each record is a dict with the world 'time' plus an entry for each requested field:
+        'position', 'rotation', 'velocity', 'angular_velocity': {object name: value} for every dynamic object
+        'remaining_time': the time left on the goal condition (-1 if the countdown has not started or there is no goal)
+        'collisions': the collision episodes that started during the step, in the format of `VTCollisionTracker.episodes` (their end times are as of that step)
+
+    The first record describes the world before the first step (with no collisions). Stop early by breaking out of the loop (or calling `close()`); otherwise the generator's return value (e.g., from `yield from`) is the RolloutOutcome
+
+    Args:
+        gameworld (VTWorld): the gameworld (with all objects added)
+        step_size (float, optional): the time between records. Defaults to 0.1.
+        maxtime (float, optional): the total time to run the world until time out. Defaults to 20.
+        fields (List[str], optional): the fields to report (from ROLLOUT_FIELDS). Defaults to ('position', 'rotation', 'velocity').
+        quiescence (QuiescenceDetector, optional): if given, also stops once the world has come to rest (see `simulate`). Defaults to None.
+        stop_predicates (List[StopPredicate], optional): also stops as soon as any of these fires (see `simulate`). Defaults to ().
+
+    Raises:
+        AssertionError: if an unknown field is requested
+
+    Yields:
+        Dict: the state after each step
+    """
+    for f in fields:
+        assert f in ROLLOUT_FIELDS, "Unknown rollout field: " + f
+    tracked = [(onm, o._cpBody) for onm, o in _dynamic_objects(gameworld)]
+    want_collisions = 'collisions' in fields
+    if want_collisions:
+        was_recording = gameworld.record_collisions
+        gameworld.record_collisions = True
+        tracker = gameworld.collision_tracker
+        n_episodes = len(tracker)
+
+    def make_record() -> Dict:
+        rec = {'time': gameworld.time}
+        for f in fields:
+            if f == 'position':
+                rec[f] = dict([(onm, (b.position.x, b.position.y)) for onm, b in tracked])
+            elif f == 'rotation':
+                rec[f] = dict([(onm, b.angle) for onm, b in tracked])
+            elif f == 'velocity':
+                rec[f] = dict([(onm, (b.velocity.x, b.velocity.y)) for onm, b in tracked])
+            elif f == 'angular_velocity':
+                rec[f] = dict([(onm, b.angular_velocity) for onm, b in tracked])
+            elif f == 'remaining_time':
+                rt = None if gameworld.goal_cond is None else gameworld.goal_cond.remaining_time()
+                rec[f] = -1 if rt is None else rt
+        return rec
+
+    steps = None
+    try:
+        rec = make_record()
+        if want_collisions:
+            rec['collisions'] = []
+        yield rec
+        steps = _run_steps(gameworld, maxtime, step_size, quiescence, stop_predicates)
+        while True:
+            try:
+                next(steps)
+            except StopIteration as stop:
+                return stop.value
+            rec = make_record()
+            if want_collisions:
+                rec['collisions'] = tracker.episodes_since(n_episodes)
+                n_episodes = len(tracker)
+            yield rec
+    finally:
+        # Closing the loop puts back any handlers it replaced
+        if steps is not None:
+            steps.close()
+        if want_collisions:
+            gameworld.record_collisions = was_recording
+
+
+def _with_outcome(result: Tuple, out: RolloutOutcome, return_outcome: bool) -> Tuple:
+    # The outcome is only added on request, so results keep their shape whatever stopping options are given
+    if return_outcome:
+        return result + (out,)
+    return result
+
+
 """
 Simple game running
 
@@ -21,103 +618,70 @@ Returns tuple of:
 """
 def run_game(gameworld: VTWorld,
              maxtime: float=20.,
-             step_size: float=0.1
+             step_size: float=0.1,
+             quiescence: QuiescenceDetector=None,
+             stop_predicates: List[StopPredicate]=None,
+             return_outcome: bool=False
              ) -> Tuple[bool, float, VTWorld]:
-    running = True
-    t = 0
-    while running:
-        gameworld.step(step_size)
-        t += step_size
-        if gameworld.check_end() or (t >= maxtime):
-            running = False
-    return gameworld.check_end(), t
+    out = simulate(gameworld, maxtime, step_size, quiescence=quiescence, stop_predicates=stop_predicates)
+    return _with_outcome((out.success, out.time), out, return_outcome)
 
 
 """
 Run the game and keep track of object positions
 
 Returns tuple of:
-    Dict[(obj_name, List[(x, y)])]: a dictionary with keys being the names of each of the non-static objects in the world. Each entry is a list of positions of that object at each of the timesteps
+    Trajectory: a dict-like record keyed by the names of each of the non-static objects in the world. Each entry is an array of the (x, y, rot, vx, vy) of that object at each of the timesteps
     bool: whether the goal was accomplished
     float: the time at which the world was stopped (due to solution or timeout)
 """
 def get_path(gameworld: VTWorld,
              maxtime: float=20.,
              step_size: float=0.1,
-             return_world: bool=False
+             return_world: bool=False,
+             quiescence: QuiescenceDetector=None,
+             stop_predicates: List[StopPredicate]=None,
+             return_outcome: bool=False
              ) -> Tuple[Dict, bool, float]:
-    running = True
-    t = 0
-    pathdict = dict()
-    tracknames = []
-    for onm, o in gameworld.objects.items():
-        if not o.is_static():
-            tracknames.append(onm)
-            pathdict[onm] = [[o.position[0], o.position[1], o.rotation, o.velocity[0], o.velocity[1]]]
-    while running:
-        gameworld.step(step_size)
-        t += step_size
-        for onm in tracknames:
-            pathdict[onm].append([gameworld.objects[onm].position[0], gameworld.objects[onm].position[1], gameworld.objects[onm].rotation, gameworld.objects[onm].velocity[0], gameworld.objects[onm].velocity[1]])
-        if gameworld.check_end() or (t >= maxtime):
-            running = False
+    sr = StateRecorder(maxtime, step_size)
+    out = simulate(gameworld, maxtime, step_size, [sr], quiescence, stop_predicates)
     if return_world:
-        return pathdict, gameworld.check_end(), t, gameworld
-    return pathdict, gameworld.check_end(), t
+        return _with_outcome((sr.path, out.success, out.time, gameworld), out, return_outcome)
+    return _with_outcome((sr.path, out.success, out.time), out, return_outcome)
 
 
 def get_path_bounding_boxes(gameworld: VTWorld,
              maxtime: float=20.,
              step_size: float=0.1,
-             return_world: bool=False
+             return_world: bool=False,
+             quiescence: QuiescenceDetector=None,
+             stop_predicates: List[StopPredicate]=None,
+             return_outcome: bool=False
              ) -> Tuple[Dict, bool, float]:
-    running = True
-    t = 0
-    pathdict = dict()
-    tracknames = []
-    for onm, o in gameworld.objects.items():
-        if not o.is_static():
-            tracknames.append(onm)
-            pathdict[onm] = [[o.position[0], o.position[1], o.rotation, o.get_bounding_box(), o.to_geom()]]
-    while running:
-        gameworld.step(step_size)
-        t += step_size
-        for onm in tracknames:
-            pathdict[onm].append([gameworld.objects[onm].position[0], gameworld.objects[onm].position[1], gameworld.objects[onm].rotation, gameworld.objects[onm].get_bounding_box(), gameworld.objects[onm].to_geom()])
-        if gameworld.check_end() or (t >= maxtime):
-            running = False
+    br = BoundingBoxRecorder()
+    out = simulate(gameworld, maxtime, step_size, [br], quiescence, stop_predicates)
     if return_world:
-        return pathdict, gameworld.check_end(), t, gameworld
-    return pathdict, gameworld.check_end(), t
+        return _with_outcome((br.path, out.success, out.time, gameworld), out, return_outcome)
+    return _with_outcome((br.path, out.success, out.time), out, return_outcome)
 
 """
 Run the game and keep track of object states (position, rotation, velocity)
 
 Returns tuple of:
-    Dict[(obj_name, List[(x, y, rot, vx, vy)])]: a dictionary with keys being the names of each of the non-static objects in the world. Each entry is a list of 5-length Tuples that include: (position_x, position_y, rotation_angle, velocity_x, velocity_y)
+    Trajectory: a dict-like record keyed by the names of each of the non-static objects in the world. Each entry is an (n_steps, 5) array with rows of: (position_x, position_y, rotation_angle, velocity_x, velocity_y)
     bool: whether the goal was accomplished
     float: the time at which the world was stopped (due to solution or timeout)
 """
 def get_state_path(gameworld: VTWorld,
              maxtime: float=20.,
-             step_size: float=0.1
+             step_size: float=0.1,
+             quiescence: QuiescenceDetector=None,
+             stop_predicates: List[StopPredicate]=None,
+             return_outcome: bool=False
              ) -> Tuple[Dict, bool, float]:
-    running = True
-    t = 0
-    pathdict = dict()
-    tracknames = []
-    for onm, o in gameworld.objects.items():
-        if not o.is_static():
-            tracknames.append(onm)
-            pathdict[onm] = [[o.position[0], o.position[1], o.rotation, o.velocity[0], o.velocity[1]]]
-    while running:
-        gameworld.step(step_size)
-        t += step_size
-        for onm in tracknames:
-            pathdict[onm].append([gameworld.objects[onm].position[0], gameworld.objects[onm].position[1], gameworld.objects[onm].rotation, gameworld.objects[onm].velocity[0], gameworld.objects[onm].velocity[1]])
-        if gameworld.check_end() or (t >= maxtime):
-            running = False
-    return pathdict, gameworld.check_end(), t
+    sr = StateRecorder(maxtime, step_size)
+    out = simulate(gameworld, maxtime, step_size, [sr], quiescence, stop_predicates)
+    return _with_outcome((sr.path, out.success, out.time), out, return_outcome)
 
 
 """
@@ -130,41 +694,21 @@ Returns tuple of:
 """
 def get_geom_path(gameworld: VTWorld,
              maxtime: float=20.,
-             step_size: float=0.1
+             step_size: float=0.1,
+             quiescence: QuiescenceDetector=None,
+             stop_predicates: List[StopPredicate]=None,
+             return_outcome: bool=False
              ) -> Tuple[Dict, bool, float]:
-    running = True
-    t = 0
-    pathdict = dict()
-    tracknames = []
-    def togeom(o):
-        if o.type == 'Poly':
-            return o.vertices
-        elif o.type == 'Ball':
-            return [o.position, o.radius]
-        elif o.type == 'Container' or o.type == 'Compound':
-            return o.polys
-        else:
-            raise Exception('Shape type "' + o.type + '" not found')
-    for onm, o in gameworld.objects.items():
-        if not o.is_static():
-            tracknames.append(onm)
-            pathdict[onm] = [[o.position, o.rotation, o.velocity]]
-    while running:
-        gameworld.step(step_size)
-        t += step_size
-        for onm in tracknames:
-            o = gameworld.objects[onm]
-            pathdict[onm].append([o.type, togeom(o)])
-        if gameworld.check_end() or (t >= maxtime):
-            running = False
-    return pathdict, gameworld.check_end(), t
+    gr = GeomRecorder()
+    out = simulate(gameworld, maxtime, step_size, [gr], quiescence, stop_predicates)
+    return _with_outcome((gr.path, out.success, out.time), out, return_outcome)
 
 
 """
 Run the game and keep track of object positions
 
 Returns tuple of:
-    Dict[(obj_name, List[(x, y)])]: a dictionary with keys being the names of each of the non-static objects in the world. Each entry is a list of positions of that object at each of the timesteps
+    Trajectory: a dict-like record keyed by the names of each of the non-static objects in the world, as in `get_state_path`
     List[TBD]: NEED TO LOOK INTO COLLISION EVENTS AGAIN
     bool: whether the goal was accomplished
     float: the time at which the world was stopped (due to solution or timeout)
@@ -173,28 +717,17 @@ def get_collisions(gameworld: VTWorld,
              maxtime: float=20.,
              step_size: float=0.1,
              collision_slop: float=0.2001,
-             return_world: bool=False
+             return_world: bool=False,
+             quiescence: QuiescenceDetector=None,
+             stop_predicates: List[StopPredicate]=None,
+             return_outcome: bool=False
              ) -> Tuple[Dict, List, bool, float, VTWorld]:
-    running = True
-    t = 0
-    pathdict = dict()
-    tracknames = []
-    for onm, o in gameworld.objects.items():
-        if not o.is_static():
-            tracknames.append(onm)
-            pathdict[onm] = [[o.position[0], o.position[1], o.rotation, o.velocity[0], o.velocity[1]]]
-    while running:
-        gameworld.step(step_size)
-        t += step_size
-        for onm in tracknames:
-            pathdict[onm].append([gameworld.objects[onm].position[0], gameworld.objects[onm].position[1], gameworld.objects[onm].rotation, gameworld.objects[onm].velocity[0], gameworld.objects[onm].velocity[1]])
-        if gameworld.check_end() or (t >= maxtime):
-            running = False
-    collisions = filter_collision_events(gameworld.collision_events,
-                                         collision_slop)
+    sr = StateRecorder(maxtime, step_size)
+    cr = CollisionRecorder(collision_slop)
+    out = simulate(gameworld, maxtime, step_size, [sr, cr], quiescence, stop_predicates)
     if return_world:
-        return pathdict, collisions, gameworld.check_end(), t, gameworld
-    return pathdict, collisions, gameworld.check_end(), t
+        return _with_outcome((sr.path, cr.collisions, out.success, out.time, gameworld), out, return_outcome)
+    return _with_outcome((sr.path, cr.collisions, out.success, out.time), out, return_outcome)
 
 """
 Run the game and return all info needed for 
@@ -208,29 +741,15 @@ Returns tuple of:
 def get_game_outcomes(gameworld: VTWorld,
              maxtime: float=20.,
              step_size: float=0.1,
-             collision_slop: float=0.2001
+             collision_slop: float=0.2001,
+             quiescence: QuiescenceDetector=None,
+             stop_predicates: List[StopPredicate]=None,
+             return_outcome: bool=False
              ) -> Tuple[Dict, List, bool, float]:
-    running = True
-    t = 0
-    pathdict = dict()
-    tracknames = []
-    remtime = []
-    for onm, o in gameworld.objects.items():
-        if not o.is_static():
-            tracknames.append(onm)
-            pathdict[onm] = [[o.position[0], o.position[1], o.rotation, o.velocity[0], o.velocity[1]]]
-    while running:
-        gameworld.step(step_size)
-        t += step_size
-        for onm in tracknames:
-            pathdict[onm].append([gameworld.objects[onm].position[0], gameworld.objects[onm].position[1], gameworld.objects[onm].rotation, gameworld.objects[onm].velocity[0], gameworld.objects[onm].velocity[1]])
-        rt = gameworld.goal_cond.remaining_time()
-        if rt is None:
-            rt = -1
-        remtime.append(rt)
-        if gameworld.check_end() or (t >= maxtime):
-            running = False
-    return pathdict, remtime, gameworld.check_end(), t
+    sr = StateRecorder(maxtime, step_size)
+    gr = GoalTimeRecorder()
+    out = simulate(gameworld, maxtime, step_size, [sr, gr], quiescence, stop_predicates)
+    return _with_outcome((sr.path, gr.remaining_times, out.success, out.time), out, return_outcome)
 
 class CollisionError(Exception):
 
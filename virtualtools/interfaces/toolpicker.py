@@ -1,5 +1,6 @@
 from typing import Tuple, Annotated, Dict
 from .vtinterface import VTInterface, place_object_by_polys
+from .freespace import FreeSpaceMap, compute_free_space
 from ..world import VTWorld, load_vt_from_dict
 import json, os, random
 import numpy as np
@@ -14,13 +15,18 @@ class ToolPicker(VTInterface):
                  gamedict: Dict,
                  basic_timestep: float=0.1,
                  maxtime: float=20.,
-                 world_timestep: float=None):
+                 world_timestep: float=None,
+                 noise_seed: int=0):
         super().__init__(gamedict['world'], basic_timestep,
-                         maxtime, world_timestep)
+                         maxtime, world_timestep, noise_seed)
         self._tools = gamedict['tools']
         self._tpdict = gamedict
         self.runs = {}
+        self._free_space_maps = dict()
 
+    def _clear_caches(self):
+        super()._clear_caches()
+        self._free_space_maps = dict()
 
     @property
     def action_keys(self):
@@ -46,6 +52,25 @@ class ToolPicker(VTInterface):
     
     def to_dict(self):
         return self._tpdict
+
+    def free_space_map(self, tool: str, resolution: float=1.) -> FreeSpaceMap:
+        """Returns a grid of every position where a tool can be placed without colliding with anything
+
+        Grid points within one grid cell of an illegal placement are marked blocked as well (see `compute_free_space`). Maps are computed once per (tool, resolution) and cached
+
+        Args:
+            tool (str): the name of the tool
+            resolution (float, optional): the grid spacing in pixels. Defaults to 1.
+
+        Returns:
+            FreeSpaceMap: the valid placement positions for the tool
+        """
+        assert tool in self._tools.keys(), "Tool " + tool + " does not exist in tool set " + str(self.toolnames)
+        key = (tool, resolution)
+        if key not in self._free_space_maps:
+            valid = compute_free_space(self._get_base_world(), self._tools[tool], resolution)
+            self._free_space_maps[key] = FreeSpaceMap(valid, resolution)
+        return self._free_space_maps[key]
     
     def get_objects(self):
         # get objects and their initial positions
@@ -0,0 +1,136 @@
+from typing import Dict, List, Iterator
+from collections.abc import Mapping
+import numpy as np
+
+__all__ = ['Trajectory', 'TRAJECTORY_FIELDS']
+
+# The per-object values stored at each recorded step
+TRAJECTORY_FIELDS = ('x', 'y', 'rotation', 'vx', 'vy')
+
+
+class Trajectory(Mapping):
+
+    def __init__(self,
+                 names: List[str],
+                 n_steps: int=256,
+                 dtype: type=np.float64):
+        """A columnar record of the states of dynamic objects through a rollout
+
+        States are held in a single preallocated array of shape (n_steps, n_objects, 5), where the last axis is (x, y, rotation, vx, vy). The buffer grows if more steps are recorded than were allocated for.
+
+        This also behaves like the older dict-of-lists paths (read-only): `traj[name]` gives an (n_steps, 5) array view for that object, so `traj[name][i][0:2]` is the position of the object at step i
+
+        Args:
+            names (List[str]): the Virtual Tools names of the objects to track, in column order
+            n_steps (int, optional): the number of steps to allocate space for. Defaults to 256.
+            dtype (type, optional): the floating point type of the buffer. Defaults to np.float64.
+        """
+        self._names = list(names)
+        self._index = dict([(nm, i) for i, nm in enumerate(self._names)])
+        self._data = np.empty((max(n_steps, 1), len(self._names), len(TRAJECTORY_FIELDS)),
+                              dtype=dtype)
+        self._n = 0
+
+    @staticmethod
+    def steps_for(maxtime: float, step_size: float) -> int:
+        """Returns the number of records a rollout of `maxtime` seconds will produce (including the initial state)
+
+        Args:
+            maxtime (float): the maximum length of the rollout in seconds
+            step_size (float): the time between records in seconds
+
+        Returns:
+            int: the number of rows to allocate
+        """
+        # Extra row covers float accumulation of the time counter
+        return int(np.ceil(maxtime / step_size)) + 2
+
+    def _next_row(self) -> np.ndarray:
+        if self._n == self._data.shape[0]:
+            grown = np.empty((2 * self._data.shape[0],) + self._data.shape[1:],
+                             dtype=self._data.dtype)
+            grown[:self._n] = self._data
+            self._data = grown
+        row = self._data[self._n]
+        self._n += 1
+        return row
+
+    def append(self, states):
+        """Adds a record of all objects at the next step
+
+        Args:
+            states (array-like): an (n_objects, 5) set of states, in the same order as `names`
+        """
+        self._next_row()[:] = states
+
+    ########################################
+    # Array access
+    ########################################
+
+    @property
+    def array(self) -> np.ndarray:
+        """np.ndarray: an (n_steps, n_objects, 5) view of the recorded states
+        """
+        return self._data[:self._n]
+
+    @property
+    def positions(self) -> np.ndarray:
+        """np.ndarray: an (n_steps, n_objects, 2) view of the (x, y) positions
+        """
+        return self._data[:self._n, :, 0:2]
+
+    @property
+    def rotations(self) -> np.ndarray:
+        """np.ndarray: an (n_steps, n_objects) view of the rotations
+        """
+        return self._data[:self._n, :, 2]
+
+    @property
+    def velocities(self) -> np.ndarray:
+        """np.ndarray: an (n_steps, n_objects, 2) view of the (vx, vy) velocities
+        """
+        return self._data[:self._n, :, 3:5]
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._names)
+
+    @property
+    def n_steps(self) -> int:
+        return self._n
+
+    def index(self, name: str) -> int:
+        """Returns the column of an object in the state arrays
+
+        Args:
+            name (str): the Virtual Tools name of the object
+
+        Returns:
+            int: the index along the object axis
+        """
+        return self._index[name]
+
+    def to_dict(self) -> Dict:
+        """Returns the states in the older (JSON-serializable) format: a dict of lists of [x, y, rotation, vx, vy]
+
+        Returns:
+            Dict: object name -> list of 5-length lists
+        """
+        arr = self.array
+        return dict([(nm, arr[:, i, :].tolist()) for nm, i in self._index.items()])
+
+    ########################################
+    # Dict compatibility
+    ########################################
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self._data[:self._n, self._index[name], :]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __repr__(self):
+        return "Trajectory(" + str(self._names) + ", n_steps=" + str(self._n) + ")"
@@ -1,6 +1,6 @@
 from typing import Tuple, Annotated, Dict
 from .vtinterface import VTInterface, place_object_by_vertex_list
-from ..world import VTWorld
+from ..world import VTWorld, load_vt_from_dict
 from geometry import check_counterclockwise
 
 __all__ = ['VertexDrawer']
@@ -10,8 +10,9 @@ class VertexDrawer(VTInterface):
                  worlddict: Dict,
                  basic_timestep: float=0.1,
                  maxtime: float=20.,
-                 world_timestep: float=None):
-        super().__init__(worlddict, basic_timestep, maxtime, world_timestep)
+                 world_timestep: float=None,
+                 noise_seed: int=0):
+        super().__init__(worlddict, basic_timestep, maxtime, world_timestep, noise_seed)
 
     @property
     def action_keys(self):
@@ -1,11 +1,15 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Tuple, List
 import warnings
-from ..world import VTWorld, noisify_world, load_vt_from_dict
+from ..world import VTWorld, noisify_world, load_vt_from_dict, VTNoisyWorldFactory, compile_world_spec, \
+        world_from_spec
+from ..world.constants import FIDELITY_PROFILES, DEFAULT_FIDELITY
 from .running import (run_game, get_path, get_path_bounding_boxes, get_state_path, get_collisions, 
-        get_geom_path, get_game_outcomes, CollisionError)
+        get_geom_path, get_game_outcomes, CollisionError, QuiescenceDetector, StopPredicate, RolloutOutcome)
+from .parallel import VTWorkerPool, VTForkServer
+from .cache import RolloutCache, cached_rollout
 from geometry import ear_clip, lines_intersect, check_counterclockwise, gift_wrap
-from ..helpers import any_line_intersections, strip_goal
+from ..helpers import any_line_intersections, strip_goal, success_interval, canonical_hash
 
 
 """
@@ -24,10 +28,7 @@ def check_collision_by_polys(world: VTWorld,
                              polys: List[List[Tuple[float, float]]],
                              position: Tuple[float, float]
                              ) -> bool:
-    for pverts in polys:
-        if world.check_collision(position, pverts):
-            return True
-    return False
+    return world.placement_checker.collides(polys, position)
 
 
 """
@@ -133,8 +134,11 @@ class VTInterface(ABC):
                  vt_worlddict: Dict,
                  basic_timestep: float=0.1,
                  maxtime: float=20.,
-                 world_timestep: float=None):
+                 world_timestep: float=None,
+                 noise_seed: int=0):
         self._worlddict = vt_worlddict
+        # Base seed for noise given by sample index (see noise_seed)
+        self._noise_seed = noise_seed
         self._maxtime = maxtime
         self.bts = basic_timestep
         world_timestep = world_timestep or self._worlddict['bts']
@@ -142,6 +146,35 @@ class VTInterface(ABC):
             warnings.warn("Cannot set smaller basic_timestep than world_timestep; setting both to basic_timestep")
             world_timestep = basic_timestep
         self._worlddict['bts'] = world_timestep
+        # Compiled specs of the world (keyed by stop_on_goal) that base worlds are built from
+        self._base_specs = dict()
+        # Noisy world factories (keyed by stop_on_goal and fidelity), which cache the contact structure of the world
+        self._noisy_factories = dict()
+        # Worker processes for batch evaluation (started on first use), and how they are run (see `executor`)
+        self._pool = None
+        self._executor = 'pool'
+        # Optional store of rollout results, and the hash identifying this interface's world/tools in its keys
+        self._cache = None
+        self._interface_hash = None
+        # Optional early stopping once the world comes to rest (see `quiescence`)
+        self._quiescence = None
+        # Solver settings used when a call does not name its own (see `fidelity`)
+        self._fidelity = DEFAULT_FIDELITY
+
+    def __getstate__(self):
+        # Noisy world factories and worker processes are rebuilt on the other side
+        state = self.__dict__.copy()
+        state['_noisy_factories'] = dict()
+        state['_pool'] = None
+        return state
+
+    def _clear_caches(self):
+        # Drops anything derived from the world dict (called when it changes)
+        self._base_specs = dict()
+        self._noisy_factories = dict()
+        self._interface_hash = None
+        # Workers hold the old world, so they need restarting
+        self.close_pool()
 
     # Required knowledge about interface: action definition + name
     @property
@@ -175,152 +208,472 @@ class VTInterface(ABC):
         nworld = noisify_world(world, **noise)
         return self.place(action, nworld)
     
+    def _resolve_noise(self, noise: Dict) -> Dict:
+        # Indexed noise samples are drawn under the interface's base seed
+        if noise is not None and noise.get('seed_index') is not None and noise.get('seed') is None:
+            return dict(noise, seed=self._noise_seed)
+        return noise
+
+    def _rollout_key(self,
+                     method: str,
+                     action: Dict,
+                     noise: Dict,
+                     maxtime: float,
+                     stop_on_goal: bool,
+                     fidelity: str=None,
+                     return_outcome: bool=False) -> str:
+        # Key for the rollout cache; None if the rollout should not be cached
+        noise = self._resolve_noise(noise)
+        # Unseeded noise is a fresh sample every time
+        if noise is not None and noise.get('seed') is None:
+            return None
+        # The world and tools are hashed once (and rehashed when the world dict is replaced); the settings
+        #  that can change between calls (bts, maxtime, fidelity, quiescence, noise seed) go in by value
+        if self._interface_hash is None:
+            self._interface_hash = canonical_hash([self.interface_type, self.to_dict(), self._worlddict])
+        key = [method, self._interface_hash, action, noise,
+               self.bts, maxtime or self._maxtime, stop_on_goal]
+        # Early stopping changes the results; keys without it are left as they were
+        if self._quiescence is not None:
+            key.append(['quiescence', self._quiescence.energy_threshold, self._quiescence.window])
+        fidelity = fidelity or self._fidelity
+        if fidelity != DEFAULT_FIDELITY:
+            key.append(['fidelity', fidelity])
+        if return_outcome:
+            key.append('outcome')
+        return canonical_hash(key)
+
+    def _illegal_action(self, code: List, return_outcome: bool) -> List:
+        # Error codes match the length of results, which end with an "illegal" outcome if it was asked for
+        if return_outcome:
+            return code + [RolloutOutcome(None, -1, "illegal")]
+        return code
+
+    def _get_noisy_factory(self, stop_on_goal: bool=True, fidelity: str=None) -> VTNoisyWorldFactory:
+        key = (stop_on_goal, fidelity or self._fidelity)
+        if key not in self._noisy_factories:
+            if stop_on_goal:
+                w = load_vt_from_dict(self._worlddict)
+            else:
+                w = load_vt_from_dict(strip_goal(self._worlddict))
+            # Carried into every noisy world through the factory's world dict
+            w.fidelity = key[1]
+            self._noisy_factories[key] = VTNoisyWorldFactory(w)
+        return self._noisy_factories[key]
+
     @property
     def dict(self):
         return self.to_dict()
 
+    def _get_base_world(self, stop_on_goal: bool=True, fidelity: str=None) -> VTWorld:
+        """Builds a new copy of the world in its initial state, from a compiled spec of the world dict that is kept across calls
+
+        This skips the hashing and parsing that `load_vt_from_dict` does on each call, and gives the same world. A new world is built every time rather than rewinding one with `VTWorld.restore`: pymunk's contact cache and broadphase index survive a restore, which would make rollouts depend on what was run before (see benchmarks/pooled_worlds.py)
+
+        Args:
+            stop_on_goal (bool, optional): if False, returns a version of the world with the goal stripped. Defaults to True.
+            fidelity (str, optional): the solver settings of the world. Defaults to None (the interface's `fidelity`).
+
+        Returns:
+            VTWorld: the new world
+        """        
+        if stop_on_goal not in self._base_specs:
+            if stop_on_goal:
+                self._base_specs[stop_on_goal] = compile_world_spec(self._worlddict)
+            else:
+                self._base_specs[stop_on_goal] = compile_world_spec(strip_goal(self._worlddict))
+        w = world_from_spec(self._base_specs[stop_on_goal])
+        w.fidelity = fidelity or self._fidelity
+        # Only the rollouts that collect collisions need them logged (see CollisionRecorder)
+        w.record_collisions = False
+        w.log_collision_events = False
+        return w
+
     def _setup_world(self,
                       action: Dict,
                       noise: Dict=None,
                       stop_on_goal: bool=True,
-                      new_object_properties: Dict=None
+                      new_object_properties: Dict=None,
+                      reuse_world: bool=True,
+                      fidelity: str=None
                       ) -> VTWorld:
-        # To keep running after the goal condition, strip the goal
-        if stop_on_goal:
-            wd = self._worlddict
-        else:
-            wd = strip_goal(self._worlddict)
         # Optional adjutment of object properties (for modeling)
         if new_object_properties:
             raise NotImplementedError("Object property adjustment not yet implemented")
-        # Run the action, return [None, -1] as illegal action flag
-        w = load_vt_from_dict(wd)
+        # Noisy worlds are always built fresh, from a factory that is shared across samples
         if noise is not None:
-            return self.noisy_placement(action, noise, w)
+            noise = self._resolve_noise(noise)
+            return self.place(action, self._get_noisy_factory(stop_on_goal, fidelity).make(**noise))
+        # Worlds that are handed back to the caller are loaded from the world dict and keep
+        #  recording collisions; others are built from the compiled base spec
+        if reuse_world:
+            return self.place(action, self._get_base_world(stop_on_goal, fidelity))
+        elif stop_on_goal:
+            w = load_vt_from_dict(self._worlddict)
         else:
-            return self.place(action, w)
+            # To keep running after the goal condition, strip the goal
+            w = load_vt_from_dict(strip_goal(self._worlddict))
+        w.fidelity = fidelity or self._fidelity
+        # Run the action, return [None, -1] as illegal action flag
+        return self.place(action, w)
 
+    @cached_rollout
     def run_placement(self,
                       action: Dict,
                       noise: Dict=None,
                       maxtime: float=None,
                       stop_on_goal: bool=True,
-                      new_object_properties: Dict=None
+                      new_object_properties: Dict=None,
+                      stop_predicates: List[StopPredicate]=None,
+                      fidelity: str=None,
+                      return_outcome: bool=False
                       ) -> Tuple[bool, float]:
         maxtime = maxtime or self._maxtime
         try:
             w = self._setup_world(action,
                                   noise,
                                   stop_on_goal,
-                                  new_object_properties)
+                                  new_object_properties,
+                                  fidelity=fidelity)
         except CollisionError:
-            return [None, -1] # Error code for illegal action
-        return run_game(w, maxtime, self.bts)
+            return self._illegal_action([None, -1], return_outcome) # Error code for illegal action
+        return run_game(w, maxtime, self.bts, quiescence=self._quiescence,
+                        stop_predicates=stop_predicates, return_outcome=return_outcome)
 
+    @cached_rollout
     def observe_placement_path(self,
                                action: Dict,
                                noise: Dict=None,
                                maxtime: float=None,
                                stop_on_goal: bool=True,
                                new_object_properties: Dict=None,
-                               return_world: bool=False
+                               return_world: bool=False,
+                               stop_predicates: List[StopPredicate]=None,
+                               fidelity: str=None,
+                               return_outcome: bool=False
                                ) -> Tuple[Dict, bool, float]:
         maxtime = maxtime or self._maxtime
         w = self._setup_world(action,
                                 noise,
                                 stop_on_goal,
-                                new_object_properties)
-        return get_path(w, maxtime, self.bts, return_world=return_world)
+                                new_object_properties,
+                                reuse_world=not return_world,
+                                fidelity=fidelity)
+        return get_path(w, maxtime, self.bts, return_world=return_world, quiescence=self._quiescence,
+                        stop_predicates=stop_predicates, return_outcome=return_outcome)
     
+    @cached_rollout
     def observe_placement_path_bounding_boxes(self,
                                action: Dict,
                                noise: Dict=None,
                                maxtime: float=None,
                                stop_on_goal: bool=True,
                                new_object_properties: Dict=None,
-                               return_world: bool=False
+                               return_world: bool=False,
+                               stop_predicates: List[StopPredicate]=None,
+                               fidelity: str=None,
+                               return_outcome: bool=False
                                ) -> Tuple[Dict, bool, float]:
         maxtime = maxtime or self._maxtime
         if action is None:
-            w = strip_goal(self._worlddict)
-            w = load_vt_from_dict(w)
+            if return_world:
+                w = load_vt_from_dict(strip_goal(self._worlddict))
+                w.fidelity = fidelity or self._fidelity
+            else:
+                w = self._get_base_world(False, fidelity)
         else:
             w = self._setup_world(action,
                                     noise,
                                     stop_on_goal,
-                                    new_object_properties)
-        return get_path_bounding_boxes(w, maxtime, self.bts, return_world=return_world)
-
+                                    new_object_properties,
+                                    reuse_world=not return_world,
+                                    fidelity=fidelity)
+        return get_path_bounding_boxes(w, maxtime, self.bts, return_world=return_world,
+                                       quiescence=self._quiescence, stop_predicates=stop_predicates,
+                                       return_outcome=return_outcome)
+
+    @cached_rollout
     def observe_full_path(self,
                           action: Dict,
                           noise: Dict=None,
                           maxtime: float=None,
                           stop_on_goal: bool=True,
-                          new_object_properties: Dict=None
+                          new_object_properties: Dict=None,
+                          stop_predicates: List[StopPredicate]=None,
+                          fidelity: str=None,
+                          return_outcome: bool=False
                           ) -> Tuple[Dict, bool, float]:
         maxtime = maxtime or self._maxtime
         try:
             w = self._setup_world(action,
                                   noise,
                                   stop_on_goal,
-                                  new_object_properties)
+                                  new_object_properties,
+                                  fidelity=fidelity)
         except CollisionError:
-            return [None, None, -1] # Error code for illegal action
-        return get_state_path(w, maxtime, self.bts)
+            return self._illegal_action([None, None, -1], return_outcome) # Error code for illegal action
+        return get_state_path(w, maxtime, self.bts, quiescence=self._quiescence,
+                              stop_predicates=stop_predicates, return_outcome=return_outcome)
 
+    @cached_rollout
     def observe_geom_path(self,
                           action: Dict,
                           noise: Dict=None,
                           maxtime: float=None,
                           stop_on_goal: bool=True,
-                          new_object_properties: Dict=None
+                          new_object_properties: Dict=None,
+                          stop_predicates: List[StopPredicate]=None,
+                          fidelity: str=None,
+                          return_outcome: bool=False
                           ) -> Tuple[Dict, bool, float]:
         maxtime = maxtime or self._maxtime
         try:
             w = self._setup_world(action,
                                   noise,
                                   stop_on_goal,
-                                  new_object_properties)
+                                  new_object_properties,
+                                  fidelity=fidelity)
         except CollisionError:
-            return [None, None, -1] # Error code for illegal action
-        return get_geom_path(w, maxtime, self.bts)
+            return self._illegal_action([None, None, -1], return_outcome) # Error code for illegal action
+        return get_geom_path(w, maxtime, self.bts, quiescence=self._quiescence,
+                             stop_predicates=stop_predicates, return_outcome=return_outcome)
     
+    @cached_rollout
     def observe_game_path(self,
                           action: Dict,
                           noise: Dict=None,
                           maxtime: float=None,
                           stop_on_goal: bool=True,
-                          new_object_properties: Dict=None
+                          new_object_properties: Dict=None,
+                          stop_predicates: List[StopPredicate]=None,
+                          fidelity: str=None,
+                          return_outcome: bool=False
                           ) -> Tuple[Dict, List, bool, float]:
         maxtime = maxtime or self._maxtime
         try:
             w = self._setup_world(action,
                                   noise,
                                   stop_on_goal,
-                                  new_object_properties)
+                                  new_object_properties,
+                                  fidelity=fidelity)
         except CollisionError:
-            return [None, None, None, -1] # Error code for illegal action
-        return get_game_outcomes(w, maxtime, self.bts)
+            return self._illegal_action([None, None, None, -1], return_outcome) # Error code for illegal action
+        return get_game_outcomes(w, maxtime, self.bts, quiescence=self._quiescence,
+                                 stop_predicates=stop_predicates, return_outcome=return_outcome)
 
+    @cached_rollout
     def observe_collision_events(self,
                                action: Dict,
                                noise: Dict=None,
                                maxtime: float=None,
                                stop_on_goal: bool=True,
                                new_object_properties: Dict=None,
-                               return_world: bool=False
+                               return_world: bool=False,
+                               stop_predicates: List[StopPredicate]=None,
+                               fidelity: str=None,
+                               return_outcome: bool=False
                                ) -> Tuple[Dict, bool, float]:
         maxtime = maxtime or self._maxtime
         try:
             w = self._setup_world(action,
                                   noise,
                                   stop_on_goal,
-                                  new_object_properties)
+                                  new_object_properties,
+                                  reuse_world=not return_world,
+                                  fidelity=fidelity)
         except CollisionError:
             if return_world:
-                return [None, None, -1, -1, None]
-            return [None, None, -1, -1, None] # Error code for illegal action
-        return get_collisions(w, maxtime, self.bts, return_world=return_world)
+                return self._illegal_action([None, None, -1, -1, None], return_outcome)
+            return self._illegal_action([None, None, -1, -1, None], return_outcome) # Error code for illegal action
+        return get_collisions(w, maxtime, self.bts, return_world=return_world, quiescence=self._quiescence,
+                              stop_predicates=stop_predicates, return_outcome=return_outcome)
+
+    ########################################
+    # Batch evaluation
+    ########################################
+    def _get_pool(self, workers: int) -> VTWorkerPool:
+        if self._pool is not None and self._pool.workers != workers:
+            self.close_pool()
+        if self._pool is None:
+            if self._executor == 'fork':
+                self._pool = VTForkServer(self, workers)
+            else:
+                self._pool = VTWorkerPool(self, workers)
+        return self._pool
+
+    def close_pool(self):
+        """Shuts down the worker processes used for batch evaluation (if any were started)
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    def _run_batch(self, method: str, actions: List[Dict], workers: int,
+                   noise_indices: List[int]=None, **kwargs) -> List:
+        """Calls `method` on every action, either serially or spread over `workers` processes (run by the `executor`)
+
+        The pool is kept alive between calls (until `close_pool` is called or the worker count changes), so repeated batches do not pay to restart processes or rebuild the world. If `noise_indices` is given, action i is run on noise sample `noise_indices[i]` (see `noise_seed`)
+        """
+        actions = list(actions)
+        item_kwargs = None
+        if noise_indices is not None:
+            assert len(noise_indices) == len(actions), "Need one noise index per action"
+            assert kwargs.get('noise') is not None, "Noise indices require noise parameters"
+            item_kwargs = [{'noise': dict(kwargs['noise'], seed_index=k)} for k in noise_indices]
+        if workers is None or workers <= 1 or len(actions) <= 1:
+            fn = getattr(self, method)
+            if item_kwargs is None:
+                return [fn(a, **kwargs) for a in actions]
+            return [fn(a, **dict(kwargs, **ik)) for a, ik in zip(actions, item_kwargs)]
+        return self._get_pool(workers).map(method, actions, kwargs, item_kwargs)
+
+    def run_placements(self,
+                       actions: List[Dict],
+                       noise: Dict=None,
+                       maxtime: float=None,
+                       stop_on_goal: bool=True,
+                       workers: int=None,
+                       noise_indices: List[int]=None
+                       ) -> List[Tuple[bool, float]]:
+        """Runs `run_placement` on a list of actions
+
+        Args:
+            actions (List[Dict]): the actions to run
+            noise (Dict, optional): noise parameters applied to each run. Defaults to None.
+            maxtime (float, optional): the maximum time to run each placement. Defaults to the interface maxtime.
+            stop_on_goal (bool, optional): whether to stop each run when the goal is reached. Defaults to True.
+            workers (int, optional): the number of processes to spread the runs over; runs serially if None or 1. Defaults to None.
+            noise_indices (List[int], optional): the noise sample index for each action (see `noise_seed`), so that runs with the same index share their noise. Defaults to None (independent noise).
+
+        Returns:
+            List[Tuple[bool, float]]: the `run_placement` output for each action, in order
+        """
+        return self._run_batch('run_placement', actions, workers, noise_indices,
+                               noise=noise, maxtime=maxtime, stop_on_goal=stop_on_goal)
+
+    def estimate_success(self,
+                         action: Dict,
+                         noise: Dict,
+                         max_samples: int=200,
+                         tolerance: float=0.1,
+                         threshold: float=None,
+                         batch_size: int=20,
+                         confidence: float=0.95,
+                         method: str='wilson',
+                         maxtime: float=None,
+                         stop_on_goal: bool=True,
+                         workers: int=None,
+                         paired: bool=False
+                         ) -> Tuple[float, Tuple[float, float], int]:
+        """Estimates the probability that an action succeeds under noise, running only as many noisy rollouts as needed
+
+        Rollouts are run in batches. After each batch an interval is put around the success rate, and sampling stops once that interval is narrower than `tolerance`, or (if a `threshold` is given) once it lies entirely above or below the threshold. Samples where the noisy placement is illegal count as failures
+
+        Args:
+            action (Dict): the action to evaluate
+            noise (Dict): noise parameters for each rollout (see `noisify_world`). If None, the single deterministic rollout is returned. If it fixes a 'seed' or 'seed_index', rollout k uses noise sample index k under that seed, since otherwise every rollout would replay the same sample
+            max_samples (int, optional): the most rollouts to run. Defaults to 200.
+            tolerance (float, optional): stop once the interval is narrower than this. Defaults to 0.1.
+            threshold (float, optional): a decision threshold; stop once the interval is clearly above or below it. Defaults to None.
+            batch_size (int, optional): the number of rollouts between checks. Defaults to 20.
+            confidence (float, optional): the coverage of the interval. Defaults to 0.95.
+            method (str, optional): the interval to use, either 'wilson' or 'bayes' (see `success_interval`). Defaults to 'wilson'.
+            maxtime (float, optional): the maximum time to run each rollout. Defaults to the interface maxtime.
+            stop_on_goal (bool, optional): whether to stop each rollout when the goal is reached. Defaults to True.
+            workers (int, optional): the number of processes to spread each batch over (see `run_placements`). Defaults to None.
+            paired (bool, optional): if True, rollout k uses noise sample index k (see `noise_seed`), so that estimates for different actions share their noise and can be compared in pairs. Defaults to False.
+
+        Returns:
+            Tuple[float, Tuple[float, float], int]: the estimated success probability, its (lower, upper) interval, and the number of rollouts run
+        """
+        assert batch_size > 0 and max_samples > 0, "batch_size and max_samples must be positive"
+        if noise is None:
+            success = bool(self.run_placement(action, None, maxtime, stop_on_goal)[0])
+            p = float(success)
+            return p, (p, p), 1
+        n = 0
+        successes = 0
+        interval = success_interval(0, 0, confidence, method)
+        indexed = paired or noise.get('seed') is not None or noise.get('seed_index') is not None
+        while n < max_samples:
+            nbatch = min(batch_size, max_samples - n)
+            indices = list(range(n, n + nbatch)) if indexed else None
+            results = self.run_placements([action] * nbatch, noise, maxtime,
+                                          stop_on_goal, workers, indices)
+            successes += sum([1 for r in results if r[0]])
+            n += nbatch
+            interval = success_interval(successes, n, confidence, method)
+            if interval[1] - interval[0] < tolerance:
+                break
+            if threshold is not None and (interval[0] > threshold or interval[1] < threshold):
+                break
+        return successes / n, interval, n
+
+    def observe_placement_path_batch(self,
+                                     actions: List[Dict],
+                                     noise: Dict=None,
+                                     maxtime: float=None,
+                                     stop_on_goal: bool=True,
+                                     workers: int=None,
+                                     noise_indices: List[int]=None
+                                     ) -> List[Tuple[Dict, bool, float]]:
+        return self._run_batch('observe_placement_path', actions, workers, noise_indices,
+                               noise=noise, maxtime=maxtime, stop_on_goal=stop_on_goal)
+
+    def observe_placement_path_bounding_boxes_batch(self,
+                                                    actions: List[Dict],
+                                                    noise: Dict=None,
+                                                    maxtime: float=None,
+                                                    stop_on_goal: bool=True,
+                                                    workers: int=None,
+                                                    noise_indices: List[int]=None
+                                                    ) -> List[Tuple[Dict, bool, float]]:
+        return self._run_batch('observe_placement_path_bounding_boxes', actions, workers, noise_indices,
+                               noise=noise, maxtime=maxtime, stop_on_goal=stop_on_goal)
+
+    def observe_full_path_batch(self,
+                                actions: List[Dict],
+                                noise: Dict=None,
+                                maxtime: float=None,
+                                stop_on_goal: bool=True,
+                                workers: int=None,
+                                noise_indices: List[int]=None
+                                ) -> List[Tuple[Dict, bool, float]]:
+        return self._run_batch('observe_full_path', actions, workers, noise_indices,
+                               noise=noise, maxtime=maxtime, stop_on_goal=stop_on_goal)
+
+    def observe_geom_path_batch(self,
+                                actions: List[Dict],
+                                noise: Dict=None,
+                                maxtime: float=None,
+                                stop_on_goal: bool=True,
+                                workers: int=None,
+                                noise_indices: List[int]=None
+                                ) -> List[Tuple[Dict, bool, float]]:
+        return self._run_batch('observe_geom_path', actions, workers, noise_indices,
+                               noise=noise, maxtime=maxtime, stop_on_goal=stop_on_goal)
+
+    def observe_game_path_batch(self,
+                                actions: List[Dict],
+                                noise: Dict=None,
+                                maxtime: float=None,
+                                stop_on_goal: bool=True,
+                                workers: int=None,
+                                noise_indices: List[int]=None
+                                ) -> List[Tuple[Dict, List, bool, float]]:
+        return self._run_batch('observe_game_path', actions, workers, noise_indices,
+                               noise=noise, maxtime=maxtime, stop_on_goal=stop_on_goal)
+
+    def observe_collision_events_batch(self,
+                                       actions: List[Dict],
+                                       noise: Dict=None,
+                                       maxtime: float=None,
+                                       stop_on_goal: bool=True,
+                                       workers: int=None,
+                                       noise_indices: List[int]=None
+                                       ) -> List[Tuple[Dict, bool, float]]:
+        return self._run_batch('observe_collision_events', actions, workers, noise_indices,
+                               noise=noise, maxtime=maxtime, stop_on_goal=stop_on_goal)
 
     @property
     def worlddict(self) -> Dict:
@@ -331,9 +684,71 @@ class VTInterface(ABC):
         try:
             load_vt_from_dict(newdict)
             self._worlddict = newdict
+            self._clear_caches()
         except:
             raise Exception("Set worlddict with a dictionary that cannot be interpreted as a VTWorld object")
 
+    @property
+    def cache(self) -> RolloutCache:
+        """RolloutCache: a store of rollout results that `run_placement` and the `observe_*` methods check before simulating (None to turn caching off). Results are keyed on a hash of the world and tools, the action, the (seeded) noise, the timesteps, maxtime, stop_on_goal, and the fidelity; rollouts with unseeded noise or that return the world are never cached
+        """
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache: RolloutCache):
+        self._cache = cache
+        # Workers hold the old cache
+        self.close_pool()
+
+    @property
+    def noise_seed(self) -> int:
+        """int: the base seed for noise samples given by index (a 'seed_index' entry in a noise dict, or `noise_indices` in the batch methods). Sample k is the same for every action run through this interface, so noisy outcomes can be compared between actions with common random numbers
+        """
+        return self._noise_seed
+
+    @noise_seed.setter
+    def noise_seed(self, seed: int):
+        self._noise_seed = seed
+        # Workers hold the old seed
+        self.close_pool()
+
+    @property
+    def quiescence(self) -> QuiescenceDetector:
+        """QuiescenceDetector: if set, rollouts stop early (and unsuccessfully) once the world has come to rest with no goal countdown running, rather than running to maxtime, with stop_reason "settled" in the RolloutOutcome that `run_placement` and the `observe_*` methods append when called with `return_outcome=True`. Defaults to None (off)
+        """
+        return self._quiescence
+
+    @quiescence.setter
+    def quiescence(self, detector: QuiescenceDetector):
+        self._quiescence = detector
+        # Workers hold the old setting
+        self.close_pool()
+
+    @property
+    def fidelity(self) -> str:
+        """str: the solver settings (a profile in FIDELITY_PROFILES: 'exact', 'fast', or 'screening') used by rollouts that don't name their own with a `fidelity` argument. Defaults to 'exact'
+        """
+        return self._fidelity
+
+    @fidelity.setter
+    def fidelity(self, fidelity: str):
+        assert fidelity in FIDELITY_PROFILES, "Unknown fidelity profile: " + str(fidelity)
+        self._fidelity = fidelity
+        # Workers hold the old setting
+        self.close_pool()
+
+    @property
+    def executor(self) -> str:
+        """str: how batches with `workers` run: 'pool' (a persistent VTWorkerPool, which pickles the interface to each worker once) or 'fork' (a VTForkServer, which forks the current process for each batch so workers share the already-built worlds copy-on-write)
+        """
+        return self._executor
+
+    @executor.setter
+    def executor(self, executor: str):
+        assert executor in ['pool', 'fork'], "Executor must be 'pool' or 'fork'"
+        self._executor = executor
+        self.close_pool()
+
     @property
     def basic_timestep(self) -> float:
         return self._bts
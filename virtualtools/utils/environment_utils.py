@@ -440,6 +440,8 @@ def get_collision_areas(tp, obj, tool):
     wd = load_vt_from_dict(tp._worlddict)
     obj_bb = obj.get_bounding_box()
     tool_bb = tp.tool_bbox(tool)
+    # Valid placements for this tool, used to probe areas without placing it
+    fsm = tp.free_space_map(tool)
 
     tool_width = tool_bb[1][0] - tool_bb[0][0]
     tool_height = tool_bb[1][1] - tool_bb[0][1]
@@ -487,9 +489,7 @@ def get_collision_areas(tp, obj, tool):
         
         collision = False
         for point in points_to_check:
-            try:
-                tp.place({'tool': tool, 'position': point})
-            except Exception as e:
+            if not fsm.is_valid(point):
                 collision = True
                 break
 
@@ -502,24 +502,18 @@ def get_collision_areas(tp, obj, tool):
         collision = True
         while collision and x_min < x_max:
             for point in [(x_min, y_min), (x_min, (y_max-y_min)//3 + y_min), (x_min, y_max - (y_max-y_min)//3), (x_min, y_max)]:
-                try:
-                    tp.place({'tool': tool, 'position': point})
+                if fsm.is_valid(point):
                     collision = False
                     break
-                except Exception as e:
-                    continue
             x_min += 1
 
         # 2) in case there is a block on the right
         collision = True
         while collision and x_min < x_max:
             for point in [(x_max, y_min), (x_max, (y_max-y_min)//3 + y_min), (x_max, y_max - (y_max-y_min)//3), (x_max, y_max)]:
-                try:
-                    tp.place({'tool': tool, 'position': point})
+                if fsm.is_valid(point):
                     collision = False
                     break
-                except Exception as e:
-                    continue
             x_max -= 1
 
         x_mid = (x_min + x_max) / 2
@@ -528,24 +522,18 @@ def get_collision_areas(tp, obj, tool):
         collision = True
         while collision and y_min < y_max:
             for point in [(x_min, y_max), ((x_max-x_min)//3 +x_min, y_max), (x_max - (x_max-x_min)//3, y_max), (x_max, y_max)]:
-                try:
-                    tp.place({'tool': tool, 'position': point})
+                if fsm.is_valid(point):
                     collision = False
                     break
-                except Exception as e:
-                    continue
             y_max -= 1
 
         # 4) in case there is a block on the bottom
         collision = True
         while collision and y_min < y_max:
             for point in [(x_min, y_min), ((x_max-x_min)//3 +x_min, y_min), (x_max - (x_max-x_min)//3, y_min), (x_max, y_min)]:
-                try:
-                    tp.place({'tool': tool, 'position': point})
+                if fsm.is_valid(point):
                     collision = False
                     break
-                except Exception as e:
-                    continue
             y_min += 1
 
         if x_min >= x_max or y_min >= y_max:
@@ -5,6 +5,7 @@ import numpy as np
 from ..world import VTWorld, load_vt_from_dict
 from ..world.constants import DEFAULT_COLOR, DEFAULT_GOAL_COLOR
 from ..world.object import VTObject, VTPoly, VTBall, VTSeg, VTContainer, VTCompound, VTGoal, VTBlocker
+from ..interfaces.trajectory import Trajectory
 
 WHITE = (255, 255, 255, 255)
 
@@ -128,6 +129,18 @@ def makeImageArrayAsNumpy(worlddict, path, sample_ratio=1):
     else:
         world = load_vt_from_dict(worlddict)
     images = []
+    if isinstance(path, Trajectory):
+        # Columnar paths: read every object's state at a step from one array slice
+        tracked = [(path.index(onm), o) for onm, o in world.objects.items()
+                   if not o.is_static() and onm in path]
+        states = path.array
+        for i in range(0, path.n_steps, sample_ratio):
+            for j, o in tracked:
+                o.set_pos(states[i, j, 0:2])
+                o.set_rot(states[i, j, 2])
+            img = draw_world(world)
+            images.append(pg.surfarray.array3d(img).swapaxes(0,1))
+        return np.array(images)
     if len(path[(list(path.keys())[0])]) == 2:
         nsteps = len(path[list(path.keys())[0]][0])
     else:
@@ -1,6 +1,11 @@
 from .world import VTWorld, load_vt_from_dict, reverse_world
 from .object import VTPoly, VTBall, VTSeg, VTContainer, VTCompound, \
     VTGoal, VTBlocker, VTObject
-from .noisyworld import noisify_world, trunc_norm, wrapped_norm
+from .checker import VTPlacementChecker
+from .spec import VTWorldSpec, VTObjectSpec, compile_world_spec, world_from_spec
+from .collisions import VTCollisionTracker
+from .noisyworld import noisify_world, noisify_collisions, trunc_norm, wrapped_norm, VTNoisyWorldFactory
+from .noise import VTNoiseSource
 from .conditions import VTCond_Base, VTCond_AnyTouch, VTCond_AnyInGoal, \
-    VTCond_ManyInGoal, VTCond_SpecificTouch, VTCond_SpecificInGoal
+    VTCond_ManyInGoal, VTCond_SpecificTouch, VTCond_SpecificInGoal, VTCondSet, \
+    cond_to_dict, cond_from_dict
@@ -1,5 +1,6 @@
 from typing import Tuple, List, Dict
 from abc import ABC, abstractmethod
+import copy
 import numpy as np
 import pymunk as pm
 
@@ -34,6 +35,8 @@ class VTObject(ABC):
         self.density = density
         self._cpBody = None
         self._cpShape = None
+        # Index into the parent world's object table (set when added to a world)
+        self._vt_index = None
 
     def is_static(self) -> bool:
         """Returns true if the object is static (density==0)
@@ -133,6 +136,10 @@ class VTObject(ABC):
     def _expose_shapes(self):
         return [self._cpShape]
 
+    def _expose_all_shapes(self):
+        # Includes any sensor shapes that _expose_shapes leaves out
+        return self._expose_shapes()
+
     def check_contact(self, object) -> bool:
         """Checks for contact between this and another object
 
@@ -294,8 +301,15 @@ class VTObject(ABC):
     elasticity = property(get_elasticity, set_elasticity)
 
 
+# How much earlier than its countdown ends a condition asks to be re-checked
+_WAKE_SLACK = 1e-9
+
+
 class VTCond_Base(ABC):
 
+    # Attributes that hold the goal bookkeeping (overwritten by each condition)
+    _state_attrs = ('won',)
+
     def __init__(self):
         """Abstract initialization of a win condition. Should never be called directly; only inherited
         """        
@@ -316,6 +330,35 @@ class VTCond_Base(ABC):
         curtime = self.parent.time - ti
         return max(self.dur - curtime, 0)
 
+    def next_check_time(self) -> float:
+        """Returns the earliest world time at which the victory condition could be met if nothing enters, leaves, or touches anything before then. The world only re-checks the condition once this time has passed or a collision event arrives
+
+        Returns:
+            float: the wake-up time (np.inf if no countdown is running)
+        """
+        ti = self._get_time_in()
+        if ti == -1:
+            return np.inf
+        # Slightly early, so rounding in remaining_time can never make a win late
+        return ti + self.dur - _WAKE_SLACK
+
+    def _get_state(self) -> Dict:
+        """Returns a copy of the bookkeeping used to track progress towards victory (e.g., what is in the goal and since when)
+
+        Returns:
+            Dict: the values of the attributes in `_state_attrs`
+        """        
+        return {a: copy.copy(getattr(self, a)) for a in self._state_attrs}
+
+    def _set_state(self, state: Dict):
+        """Reinstates bookkeeping captured by `_get_state`
+
+        Args:
+            state (Dict): the output of a previous `_get_state` call
+        """        
+        for a, v in state.items():
+            setattr(self, a, copy.copy(v))
+
     def is_won(self) -> bool:
         """Returns whether the victory condition has been met already
 
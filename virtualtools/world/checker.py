@@ -0,0 +1,111 @@
+from typing import Tuple, List
+import pymunk as pm
+from .constants import *
+
+__all__ = ['VTPlacementChecker']
+
+
+def _static_clone(shape: pm.Shape, body: pm.Body) -> pm.Shape:
+    # Copies a shape onto `body` (a static body at the origin) in world coordinates
+    sb = shape.body
+    if isinstance(shape, pm.Poly):
+        verts = [sb.local_to_world(v) for v in shape.get_vertices()]
+        clone = pm.Poly(body, verts, radius=shape.radius)
+    elif isinstance(shape, pm.Circle):
+        clone = pm.Circle(body, shape.radius, sb.local_to_world(shape.offset))
+    elif isinstance(shape, pm.Segment):
+        clone = pm.Segment(body, sb.local_to_world(shape.a),
+                           sb.local_to_world(shape.b), shape.radius)
+    else:
+        raise NotImplementedError("Cannot copy shape of type " + str(type(shape)))
+    clone.sensor = shape.sensor
+    clone.collision_type = shape.collision_type
+    clone.filter = shape.filter
+    return clone
+
+
+class VTPlacementChecker:
+
+    def __init__(self, world):
+        """Answers "would this shape overlap anything?" for a VTWorld without touching the world's own space
+
+        Every shape in the world (objects, goals, container sensors, and blockers) is copied as a static shape into a separate query-only pymunk space. The copies are refreshed only when the static layout changes or a dynamic object moves, so repeated queries against a world at rest are pure lookups
+
+        Args:
+            world (VTWorld): the world to check placements in
+        """
+        self._world = world
+        self._space = None
+        self._static_key = None
+        self._dynamic_key = None
+        self._dynamic_shapes = []
+
+    def _sync(self):
+        w = self._world
+        statics = []
+        dynamics = []
+        for o in list(w.objects.values()) + list(w.blockers.values()):
+            if o.is_static():
+                statics.append(o)
+            else:
+                dynamics.append(o)
+
+        skey = (w._static_version, tuple([o.name for o in statics]))
+        if skey != self._static_key:
+            self._space = pm.Space()
+            for o in statics:
+                for s in o._expose_all_shapes():
+                    self._space.add(_static_clone(s, self._space.static_body))
+            self._static_key = skey
+            self._dynamic_key = None
+            self._dynamic_shapes = []
+
+        dkey = tuple([(o.name, tuple(o._cpBody.position), o._cpBody.angle) for o in dynamics])
+        if dkey != self._dynamic_key:
+            if len(self._dynamic_shapes) > 0:
+                self._space.remove(*self._dynamic_shapes)
+            self._dynamic_shapes = [_static_clone(s, self._space.static_body)
+                                    for o in dynamics for s in o._expose_all_shapes()]
+            if len(self._dynamic_shapes) > 0:
+                self._space.add(*self._dynamic_shapes)
+            self._dynamic_key = dkey
+
+    def _query(self, shape: pm.Shape) -> bool:
+        shape.collision_type = COLTYPE_CHECKER
+        shape.sensor = True
+        return len(self._space.shape_query(shape)) > 0
+
+    def collides(self,
+                 polys: List[List[Tuple[float, float]]],
+                 position: Tuple[float, float]) -> bool:
+        """Checks whether a shape made of convex polygons would overlap anything in the world
+
+        Args:
+            polys (List[List[Tuple[float, float]]]): a list of convex polygons (each a list of (x,y) vertices relative to `position`)
+            position (Tuple[float, float]): the position the shape would be placed at
+
+        Returns:
+            bool: true if any of the polygons overlaps an object, goal, or blocker
+        """
+        self._sync()
+        tmpBody = pm.Body(1, 1)
+        for verts in polys:
+            nvert = [(v[0]+position[0], v[1]+position[1]) for v in verts]
+            if self._query(pm.Poly(tmpBody, nvert)):
+                return True
+        return False
+
+    def collides_circle(self,
+                        position: Tuple[float, float],
+                        radius: float) -> bool:
+        """Checks whether a circle would overlap anything in the world
+
+        Args:
+            position (Tuple[float, float]): the center of the circle
+            radius (float): the radius of the circle
+
+        Returns:
+            bool: true if the circle overlaps an object, goal, or blocker
+        """
+        self._sync()
+        return self._query(pm.Circle(pm.Body(1, 1), radius, position))
@@ -0,0 +1,145 @@
+from typing import Tuple, List, Dict
+import pymunk as pm
+from .abstracts import VTObject
+
+__all__ = ['VTCollisionTracker']
+
+# Object indices are packed into one integer per pair of objects
+_PAIR_SHIFT = 32
+
+
+def _pair_id(i1: int, i2: int) -> int:
+    if i1 < i2:
+        return (i1 << _PAIR_SHIFT) | i2
+    return (i2 << _PAIR_SHIFT) | i1
+
+
+def _contact_info(arb: pm.Arbiter, flip: bool) -> Tuple[float, ...]:
+    # Flattened (nx, ny, restitution, [ax, ay, bx, by, distance] per contact point)
+    cps = arb.contact_point_set
+    n = cps.normal
+    if flip:
+        info = [-n.x, -n.y, arb.restitution]
+    else:
+        info = [n.x, n.y, arb.restitution]
+    for cp in cps.points:
+        info.extend([cp.point_a.x, cp.point_a.y, cp.point_b.x, cp.point_b.y, cp.distance])
+    return tuple(info)
+
+
+def _expand_info(info: Tuple[float, ...]) -> List:
+    # Back to the [normal, restitution, [[point_a, point_b, distance], ...]] format of collision events
+    points = [[[info[i], info[i+1]], [info[i+2], info[i+3]], info[i+4]]
+              for i in range(3, len(info), 5)]
+    return [pm.Vec2d(info[0], info[1]), info[2], points]
+
+
+class VTCollisionTracker:
+
+    def __init__(self, slop_time: float = 0.2001):
+        """Groups the contacts between pairs of objects into collision episodes as the world is simulated
+
+        Each pair of objects is tracked by an integer ID built from the objects' world indices. An episode starts when any shapes of the two objects start touching, and ends when the last of them separate. If the same pair touches again within `slop_time` seconds, the contact continues the earlier episode rather than starting a new one. Contact information (normal, restitution, and contact points) is only captured at the start of each episode
+
+        Args:
+            slop_time (float, optional): breaks in contact this short or shorter are merged into a single episode. Defaults to 0.2001.
+        """
+        self.slop_time = slop_time
+        self.reset()
+
+    def reset(self):
+        """Clears all tracked contacts and episodes
+        """
+        # pair ID -> number of shape pairs currently touching
+        self._active = dict()
+        # pair ID -> [name1, name2, begin, end (None while touching), contact info] of the latest episode
+        self._open = dict()
+        self._finished = []
+        # Every episode (the same lists as in _open and _finished) in the order they started
+        self._started = []
+
+    def __len__(self):
+        return len(self._started)
+
+    def begin(self, o1: VTObject, o2: VTObject, time: float, arb: pm.Arbiter):
+        """Records that two objects started touching (called from the world's begin callback)
+
+        Args:
+            o1 (VTObject): the first object
+            o2 (VTObject): the second object
+            time (float): the world time
+            arb (pm.Arbiter): the arbiter for the contact, used for contact information at the start of an episode
+        """
+        pid = _pair_id(o1._vt_index, o2._vt_index)
+        n = self._active.get(pid, 0)
+        self._active[pid] = n + 1
+        # Other shapes of these two objects are already touching
+        if n > 0:
+            return
+        ep = self._open.get(pid)
+        if ep is not None:
+            # Short break since they last touched: continue that episode
+            if time - ep[3] <= self.slop_time:
+                ep[3] = None
+                return
+            self._finished.append(ep)
+        # Episodes are reported with the objects in name order
+        if o2.name < o1.name:
+            ep = [o2.name, o1.name, time, None, _contact_info(arb, True)]
+        else:
+            ep = [o1.name, o2.name, time, None, _contact_info(arb, False)]
+        self._open[pid] = ep
+        self._started.append(ep)
+
+    def end(self, o1: VTObject, o2: VTObject, time: float):
+        """Records that two objects stopped touching (called from the world's separate callback)
+
+        Args:
+            o1 (VTObject): the first object
+            o2 (VTObject): the second object
+            time (float): the world time
+        """
+        pid = _pair_id(o1._vt_index, o2._vt_index)
+        n = self._active.get(pid, 0)
+        # Contact started before tracking did
+        if n == 0:
+            return
+        if n == 1:
+            del self._active[pid]
+            self._open[pid][3] = time
+        else:
+            self._active[pid] = n - 1
+
+    def episodes(self) -> List:
+        """Returns all collision episodes so far, ordered by start time
+
+        Returns:
+            List: a list of [name1, name2, begin time, end time (None if still touching), [normal, restitution, contact points]] entries, in the same format as `filter_collision_events`
+        """
+        eps = self._finished + list(self._open.values())
+        eps = sorted(eps, key=lambda e: e[2])
+        return [[e[0], e[1], e[2], e[3], _expand_info(e[4])] for e in eps]
+
+    def episodes_since(self, index: int) -> List:
+        """Returns the episodes that started after the first `index` (in the format of `episodes`). Pass the length of the tracker to pick up only the episodes that start after that point
+
+        Args:
+            index (int): the number of episodes to skip
+
+        Returns:
+            List: the later episodes, ordered by start time; ongoing episodes have an end time of None
+        """
+        return [[e[0], e[1], e[2], e[3], _expand_info(e[4])] for e in self._started[index:]]
+
+    def _get_state(self) -> Dict:
+        return {'active': dict(self._active),
+                'open': dict([(k, list(v)) for k, v in self._open.items()]),
+                'finished': [list(e) for e in self._finished],
+                'slop_time': self.slop_time}
+
+    def _set_state(self, state: Dict):
+        self._active = dict(state['active'])
+        self._open = dict([(k, list(v)) for k, v in state['open'].items()])
+        self._finished = [list(e) for e in state['finished']]
+        self._started = sorted(self._finished + list(self._open.values()), key=lambda e: e[2])
+        self.slop_time = state['slop_time']
@@ -5,12 +5,18 @@ from .constants import *
 from .object import *
 
 __all__ = ["VTCond_AnyInGoal", "VTCond_SpecificInGoal", "VTCond_AnyTouch",
-           "VTCond_SpecificTouch", "VTCond_ManyInGoal"]
+           "VTCond_SpecificTouch", "VTCond_ManyInGoal", "VTCondSet",
+           "cond_to_dict", "cond_from_dict"]
+
+# When a VTCondSet counts as won: once any of its conditions is met, once all are, or never
+COND_SET_STOP_MODES = ['any', 'all', 'none']
 
 
 
 class VTCond_AnyInGoal(VTCond_Base):
 
+    _state_attrs = ('won', 'ins')
+
     def __init__(self, goalname: str, duration: float, parent, exclusions: List[str] = []):
         """A victory condition if *any* moving object makes it into the goal (except those defined by the exception list)
 
@@ -55,6 +61,8 @@ class VTCond_AnyInGoal(VTCond_Base):
 
 class VTCond_ManyInGoal(VTCond_Base):
 
+    _state_attrs = ('won', 'objsin', 'tin')
+
     def __init__(self, goalname, objlist, duration, parent):
         self.type = "ManyInGoal"
         self.won = False
@@ -91,6 +99,8 @@ class VTCond_ManyInGoal(VTCond_Base):
 
 class VTCond_SpecificInGoal(VTCond_Base):
 
+    _state_attrs = ('won', 'tin')
+
     def __init__(self, goalname, objname, duration, parent):
         self.type = "SpecificInGoal"
         self.won = False
@@ -120,6 +130,8 @@ class VTCond_SpecificInGoal(VTCond_Base):
 
 class VTCond_AnyTouch(VTCond_Base):
 
+    _state_attrs = ('won', 'tin')
+
     def __init__(self, objname, duration, parent):
         self.type = "AnyTouch"
         self.won = False
@@ -146,6 +158,8 @@ class VTCond_AnyTouch(VTCond_Base):
 
 class VTCond_SpecificTouch(VTCond_Base):
 
+    _state_attrs = ('won', 'tin')
+
     def __init__(self, objname1, objname2, duration, parent):
         self.type = "SpecificTouch"
         self.won = False
@@ -172,3 +186,201 @@ class VTCond_SpecificTouch(VTCond_Base):
 
     def _get_time_in(self):
         return self.tin
+
+
+class VTCondSet(VTCond_Base):
+
+    def __init__(self, parent, stop: str = 'any'):
+        """A set of named victory conditions tracked together in a single rollout
+
+        The set holds the world's collision hooks and passes every goal (sensor) event to the conditions that watch goals, and every solid begin/end event to the conditions that watch contacts, so any number of conditions can run side by side. The first time each condition is met is kept in `satisfied_times`
+
+        Args:
+            parent (VTWorld): the VTWorld object this is describing the victory condition for
+            stop (str, optional): when the set counts as won (ending the rollout): 'any' (as soon as one condition is met), 'all' (once every condition has been met), or 'none' (never; run to the end and read the times). Defaults to 'any'.
+        """
+        assert stop in COND_SET_STOP_MODES, "stop must be one of " + ", ".join(COND_SET_STOP_MODES)
+        self.type = "CondSet"
+        self.won = False
+        self.stop = stop
+        self.dur = None
+        self.conds = dict()
+        self.first_won = dict()
+        self.has_time = True
+        self.parent = parent
+        self._goal_conds = []
+        self._touch_conds = []
+
+    def add(self, name: str, cond: VTCond_Base):
+        """Adds a condition to the set (call `attach_hooks` again afterwards if the set is already attached)
+
+        Args:
+            name (str): the name to report the condition under
+            cond (VTCond_Base): the condition, made for the same world as the set (but not attached itself)
+        """
+        assert name not in self.conds, "Condition names must be unique: " + name
+        assert cond.parent is self.parent, "Conditions must belong to the same world as the set"
+        assert not isinstance(cond, VTCondSet), "Condition sets cannot be nested"
+        self.conds[name] = cond
+        self.first_won[name] = None
+        if hasattr(cond, '_goes_in'):
+            self._goal_conds.append(cond)
+        if hasattr(cond, '_begin_touch'):
+            self._touch_conds.append(cond)
+
+    def _goes_in(self, obj, goal):
+        for c in self._goal_conds:
+            c._goes_in(obj, goal)
+
+    def _goes_out(self, obj, goal):
+        for c in self._goal_conds:
+            c._goes_out(obj, goal)
+
+    def _begin_touch(self, obj1, obj2):
+        for c in self._touch_conds:
+            c._begin_touch(obj1, obj2)
+
+    def _end_touch(self, obj1, obj2):
+        for c in self._touch_conds:
+            c._end_touch(obj1, obj2)
+
+    def attach_hooks(self):
+        """Sets collision handlers for all of the conditions in the set (the solid handlers are only taken over if a condition watches contacts)
+        """
+        if self._goal_conds:
+            self.parent.set_goal_collision_begin(self._goes_in)
+            self.parent.set_goal_collision_end(self._goes_out)
+        if self._touch_conds:
+            self.parent.set_solid_collision_begin(self._begin_touch)
+            self.parent.set_solid_collision_end(self._end_touch)
+
+    def _update(self):
+        # Notes the first time each condition is met
+        for nm, c in self.conds.items():
+            if self.first_won[nm] is None and c.is_won():
+                c.won = True
+                self.first_won[nm] = self.parent.time
+        met = [t is not None for t in self.first_won.values()]
+        if self.stop == 'any':
+            self.won = any(met)
+        elif self.stop == 'all':
+            self.won = len(met) > 0 and all(met)
+
+    def satisfied_times(self) -> Dict[str, float]:
+        """Returns the world time each condition was first met at (None if it has not been)
+
+        Returns:
+            Dict[str, float]: the times, keyed by condition name
+        """
+        self._update()
+        return dict(self.first_won)
+
+    def remaining_time(self) -> float:
+        """Returns the time left until the set is won: 0 once it is, otherwise the shortest countdown still running ('any' and 'none'), or the longest once every unmet condition has a countdown running ('all'). None if there is no such countdown
+
+        Returns:
+            float: the time remaining (or None)
+        """
+        self._update()
+        if self.won:
+            return 0
+        rts = [c.remaining_time() for nm, c in self.conds.items() if self.first_won[nm] is None]
+        if self.stop == 'all':
+            if len(rts) == 0 or any([rt is None for rt in rts]):
+                return None
+            return max(rts)
+        rts = [rt for rt in rts if rt is not None]
+        if len(rts) == 0:
+            return None
+        return min(rts)
+
+    def is_won(self) -> bool:
+        self._update()
+        return self.won
+
+    def next_check_time(self) -> float:
+        """Returns the wake-up time of the set: the soonest of its unmet conditions ('any' and 'none'), or the latest once every unmet condition has a countdown running ('all')
+
+        Returns:
+            float: the wake-up time (np.inf if there is nothing to wait for)
+        """
+        wakes = [c.next_check_time() for nm, c in self.conds.items() if self.first_won[nm] is None]
+        if self.won or len(wakes) == 0:
+            # Nothing left to notice, but a won set keeps being checked like a single condition
+            return -np.inf if self.won else np.inf
+        if self.stop == 'all':
+            return max(wakes)
+        return min(wakes)
+
+    def _get_state(self) -> Dict:
+        return {'won': self.won,
+                'first_won': dict(self.first_won),
+                'conds': dict([(nm, c._get_state()) for nm, c in self.conds.items()])}
+
+    def _set_state(self, state: Dict):
+        self.won = state['won']
+        self.first_won = dict(state['first_won'])
+        for nm, cstate in state['conds'].items():
+            self.conds[nm]._set_state(cstate)
+
+
+def cond_to_dict(gc: VTCond_Base) -> Dict:
+    """Describes a victory condition in the serializable format used for 'gcond' in world dicts
+
+    Args:
+        gc (VTCond_Base): the condition
+
+    Raises:
+        Exception: if the condition is of an unknown type
+
+    Returns:
+        Dict: the description
+    """
+    if gc.type == 'AnyInGoal':
+        return {'type': gc.type, 'goal': gc.goal, 'obj': '-',
+                'exclusions': gc.excl, 'duration': gc.dur}
+    elif gc.type == 'SpecificInGoal':
+        return {'type': gc.type, 'goal': gc.goal, 'obj': gc.obj, 'duration': gc.dur}
+    elif gc.type == 'ManyInGoal':
+        return {'type': gc.type, 'goal': gc.goal, 'objlist': gc.objlist, 'duration': gc.dur}
+    elif gc.type == "AnyTouch":
+        return {'type': gc.type, 'goal': gc.goal, 'obj': '-', 'duration': gc.dur}
+    elif gc.type == 'SpecificTouch':
+        return {'type': gc.type, 'goal': gc.o1, 'obj': gc.o2, 'duration': gc.dur}
+    elif gc.type == 'CondSet':
+        return {'type': gc.type, 'stop': gc.stop,
+                'conditions': dict([(nm, cond_to_dict(c)) for nm, c in gc.conds.items()])}
+    else:
+        raise Exception('Invalid goal condition type provided')
+
+
+def cond_from_dict(g: Dict, parent) -> VTCond_Base:
+    """Makes a victory condition (not yet attached) from its description in a world dict
+
+    Args:
+        g (Dict): the description (e.g., from `cond_to_dict`)
+        parent (VTWorld): the world the condition is for
+
+    Raises:
+        Exception: if the description has an unknown type
+
+    Returns:
+        VTCond_Base: the condition
+    """
+    if g['type'] == 'AnyInGoal':
+        return VTCond_AnyInGoal(g['goal'], float(g['duration']), parent, list(g.get('exclusions', [])))
+    elif g['type'] == 'SpecificInGoal':
+        return VTCond_SpecificInGoal(g['goal'], g['obj'], float(g['duration']), parent)
+    elif g['type'] == 'ManyInGoal':
+        return VTCond_ManyInGoal(g['goal'], list(g['objlist']), float(g['duration']), parent)
+    elif g['type'] == 'AnyTouch':
+        return VTCond_AnyTouch(g['goal'], float(g['duration']), parent)
+    elif g['type'] == 'SpecificTouch':
+        return VTCond_SpecificTouch(g['goal'], g['obj'], float(g['duration']), parent)
+    elif g['type'] == 'CondSet':
+        cs = VTCondSet(parent, g.get('stop', 'any'))
+        for nm, sub in g['conditions'].items():
+            cs.add(nm, cond_from_dict(sub, parent))
+        return cs
+    else:
+        raise Exception("In valid goal condition type given")
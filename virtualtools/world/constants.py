@@ -10,6 +10,30 @@ COLTYPE_PLACED = 102
 COLTYPE_BLOCKED = 103
 COLTYPE_CHECKER = 104
 
+# Named sets of solver settings that trade accuracy for speed (see VTWorld.fidelity)
+#  exact: pymunk's own defaults (chipmunk stores them in single precision, hence the digits), with
+#         objects falling asleep after resting for 5s -- what every world used before profiles existed
+#  fast: fewer solver iterations and looser contacts, for when small differences in paths don't matter
+#  screening: much cheaper and rougher, for quickly ranking many candidates before re-checking the best
+FIDELITY_PROFILES = {
+    'exact': {'iterations': 10,
+              'collision_slop': 0.10000000149011612,
+              'collision_bias': 0.0017970074436457143,
+              'idle_speed_threshold': 0.,
+              'sleep_time_threshold': 5.},
+    'fast': {'iterations': 5,
+             'collision_slop': 0.25,
+             'collision_bias': (1 - 0.2) ** 60,
+             'idle_speed_threshold': 1.,
+             'sleep_time_threshold': 2.},
+    'screening': {'iterations': 2,
+                  'collision_slop': 0.5,
+                  'collision_bias': (1 - 0.3) ** 60,
+                  'idle_speed_threshold': 5.,
+                  'sleep_time_threshold': 0.5}
+}
+DEFAULT_FIDELITY = 'exact'
+
 DEFAULT_NOISE_DICT = {
     'position_static': 5.,
     'position_moving': 5.,
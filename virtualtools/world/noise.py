@@ -0,0 +1,161 @@
+from __future__ import annotations
+from typing import Tuple
+import numpy as np
+from scipy.special import ndtr, ndtri
+
+__all__ = ['VTNoiseSource']
+
+# Truncation bounds (in standard deviations) used when no bound is given
+_DEFAULT_BOUND = 20.
+# Rejection-sampling attempts before switching to the inverse CDF
+_MAX_REJECTIONS = 8
+
+
+class VTNoiseSource:
+
+    def __init__(self, seed: int | np.random.SeedSequence = None, buffer_size: int = 4096):
+        """A seedable source of the random draws used to add noise to worlds
+
+        Standard normal and uniform samples are drawn from a numpy Generator in large buffers, so single draws (e.g., inside collision callbacks) only cost an index lookup
+
+        Args:
+            seed (int | np.random.SeedSequence, optional): the seed for the generator; the same seed always gives the same sequence of draws. Defaults to None (fresh entropy).
+            buffer_size (int, optional): the number of samples drawn at a time. Defaults to 4096.
+        """
+        self._rng = np.random.default_rng(seed)
+        self._bufsize = buffer_size
+        self._normals = self._rng.standard_normal(buffer_size)
+        self._nidx = 0
+        self._uniforms = self._rng.random(buffer_size)
+        self._uidx = 0
+
+    @classmethod
+    def streams(cls, seed: int = None,
+                seed_index: int = None) -> Tuple[VTNoiseSource, VTNoiseSource]:
+        """Makes independent perception and collision noise sources from one seed
+
+        Keeping the two streams apart means the number of perceptual draws (which can vary, e.g., with retries) never shifts the collision noise, so the k-th noise sample of a seed is the same for every action
+
+        Args:
+            seed (int, optional): the base seed. Defaults to None (fresh entropy).
+            seed_index (int, optional): the index of the noise sample under `seed`; each index gets its own independent pair of streams. Defaults to None.
+
+        Returns:
+            Tuple[VTNoiseSource, VTNoiseSource]: the (perception, collision) noise sources
+        """
+        if seed_index is None:
+            ss = np.random.SeedSequence(seed)
+        else:
+            ss = np.random.SeedSequence(seed, spawn_key=(seed_index,))
+        perception, collision = ss.spawn(2)
+        return cls(perception), cls(collision)
+
+    @property
+    def generator(self) -> np.random.Generator:
+        """np.random.Generator: the underlying generator
+        """
+        return self._rng
+
+    def normal(self) -> float:
+        """Returns one draw from a standard normal
+
+        Returns:
+            float: the draw
+        """
+        if self._nidx == self._bufsize:
+            self._normals = self._rng.standard_normal(self._bufsize)
+            self._nidx = 0
+        z = self._normals[self._nidx]
+        self._nidx += 1
+        return float(z)
+
+    def normals(self, n: int) -> np.ndarray:
+        """Returns draws from a standard normal
+
+        Args:
+            n (int): the number of draws
+
+        Returns:
+            np.ndarray: an array of n draws (the same ones that n calls to `normal` would give)
+        """
+        parts = [self._normals[self._nidx:self._nidx + n]]
+        self._nidx += len(parts[0])
+        need = n - len(parts[0])
+        # Refill the buffer as `normal` does, so the stream does not depend on how draws are taken
+        while need > 0:
+            self._normals = self._rng.standard_normal(self._bufsize)
+            self._nidx = min(need, self._bufsize)
+            parts.append(self._normals[:self._nidx])
+            need -= self._nidx
+        return np.concatenate(parts)
+
+    def uniform(self) -> float:
+        """Returns one draw from a uniform on [0, 1)
+
+        Returns:
+            float: the draw
+        """
+        if self._uidx == self._bufsize:
+            self._uniforms = self._rng.random(self._bufsize)
+            self._uidx = 0
+        u = self._uniforms[self._uidx]
+        self._uidx += 1
+        return float(u)
+
+    def _std_trunc_norm(self, a: float, b: float) -> float:
+        # Standard normal truncated to [a, b]
+        for _ in range(_MAX_REJECTIONS):
+            z = self.normal()
+            if a <= z <= b:
+                return z
+        # Unlikely interval: invert the CDF, working in the lower tail for precision
+        if a > 0:
+            return -self._std_trunc_norm_icdf(-b, -a)
+        return self._std_trunc_norm_icdf(a, b)
+
+    def _std_trunc_norm_icdf(self, a: float, b: float) -> float:
+        pa = ndtr(a)
+        pb = ndtr(b)
+        z = float(ndtri(pa + self.uniform() * (pb - pa)))
+        # Guard against rounding at the edges of the interval
+        return min(max(z, a), b)
+
+    def trunc_norm(self, mu: float, sig: float,
+                   lower: float = None, upper: float = None) -> float:
+        """Provides a random draw from a truncated normal
+
+        Args:
+            mu (float): the mean of the (untruncated) distribution
+            sig (float): the standard deviation of the (untruncated) distribution
+            lower (float, optional): the truncation lower bound. Defaults to None, which coerces this to 20 sds below the mean
+            upper (float, optional): the truncation upper bound. Defaults to None, which coerces this to 20 sds above the mean
+
+        Returns:
+            float: a random number drawn from this distribution
+        """
+        a = -_DEFAULT_BOUND if lower is None else (lower - mu) / sig
+        b = _DEFAULT_BOUND if upper is None else (upper - mu) / sig
+        return mu + sig * self._std_trunc_norm(a, b)
+
+    def wrapped_norm(self, mu: float, sig: float) -> float:
+        """Provides a random draw from a wrapped normal (around 2pi radians)
+
+        Args:
+            mu (float): the mean of the (unwrapped) distribution
+            sig (float): the standard deviation of the (unwrapped) distribution
+
+        Returns:
+            float: a random number drawn from this distribution; will be in the range of [0, 2*pi)
+        """
+        return (mu + sig * self.normal()) % (2 * np.pi)
+
+    def isotropic(self, sig: float) -> Tuple[float, float]:
+        """Provides a 2D draw from an isotropic gaussian with mean 0
+
+        Args:
+            sig (float): the standard deviation along each axis
+
+        Returns:
+            Tuple[float, float]: the (x, y) draw
+        """
+        return (sig * self.normal(), sig * self.normal())
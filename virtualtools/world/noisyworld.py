@@ -1,14 +1,28 @@
-from .world import VTWorld
+from .world import VTWorld, load_vt_from_dict
 from .object import VTObject
 from typing import Dict, List, Tuple
 from .constants import *
-from scipy.stats import norm, truncnorm
+from .noise import VTNoiseSource
 import numpy as np
 import pymunk as pm
 from copy import copy
 import pickle
+import os
 
-__all__ = ['noisify_world', 'trunc_norm', 'wrapped_norm']
+__all__ = ['noisify_world', 'noisify_collisions', 'trunc_norm', 'wrapped_norm', 'VTNoisyWorldFactory']
+
+# Unseeded source for the module-level draws, made separately in each process so that forked
+#  workers do not repeat their parent's draws
+_default_noise = None
+_default_noise_pid = None
+
+
+def _get_default_noise() -> VTNoiseSource:
+    global _default_noise, _default_noise_pid
+    if _default_noise is None or _default_noise_pid != os.getpid():
+        _default_noise = VTNoiseSource()
+        _default_noise_pid = os.getpid()
+    return _default_noise
 
 
 def trunc_norm(mu: float, sig: float,
@@ -24,15 +38,7 @@ def trunc_norm(mu: float, sig: float,
     Returns:
         float: a random number drawn from this distribution
     """    
-    if lower is None:
-        a = -20
-    else:
-        a = (lower - mu) / sig
-    if upper is None:
-        b = 20
-    else:
-        b = (upper - mu) / sig
-    return mu + sig * truncnorm.rvs(a, b, size=1)[0]
+    return _get_default_noise().trunc_norm(mu, sig, lower, upper)
 
 
 def wrapped_norm(mu: float, sig: float) -> float:
@@ -45,7 +51,7 @@ def wrapped_norm(mu: float, sig: float) -> float:
     Returns:
         float: a random number drawn from this distribution; will be in the range of [0, 2*pi)
     """    
-    return (mu + sig * norm.rvs(size=1))[0] % (2 * np.pi)
+    return _get_default_noise().wrapped_norm(mu, sig)
 
 # Helper function to keep track of objects that are touching before the noisification
 
@@ -79,15 +85,16 @@ def _move_static(obj, pos_ch, space):
 
     if obj.type == 'Poly':
         space.remove(obj._cpShape)
-        nverts = [v + pos_ch for v in obj.vertices]
+        nverts = [tuple(v + pos_ch) for v in obj.vertices]
         obj._cpShape = pm.Poly(space.static_body, nverts)
         obj._cpShape.friction = fric
         obj._cpShape.elasticity = elast
         obj._cpShape.collision_type = COLTYPE_SOLID
         obj._cpShape.name = nm
+        obj._cpShape.vt_index = obj._vt_index
         space.add(obj._cpShape)
     elif obj.type == 'Ball':
-        npos = obj._cpShape.offset + pos_ch
+        npos = tuple(obj._cpShape.offset + pos_ch)
         rad = obj._cpShape.radius
         space.remove(obj._cpShape)
         obj._cpShape = pm.Circle(space.static_body, rad, npos)
@@ -95,10 +102,11 @@ def _move_static(obj, pos_ch, space):
         obj._cpShape.elasticity = elast
         obj._cpShape.collision_type = COLTYPE_SOLID
         obj._cpShape.name = nm
+        obj._cpShape.vt_index = obj._vt_index
         space.add(obj._cpShape)
     elif obj.type == 'Segment':
-        a = obj._cpShape.a + pos_ch
-        b = obj._cpShape.b + pos_ch
+        a = tuple(obj._cpShape.a + pos_ch)
+        b = tuple(obj._cpShape.b + pos_ch)
         rad = obj._cpShape.radius
         space.remove(obj._cpShape)
         obj._cpShape = pm.Segment(space.static_body, a, b, rad)
@@ -106,47 +114,276 @@ def _move_static(obj, pos_ch, space):
         obj._cpShape.elasticity = elast
         obj._cpShape.collision_type = COLTYPE_SOLID
         obj._cpShape.name = nm
+        obj._cpShape.vt_index = obj._vt_index
         space.add(obj._cpShape)
     elif obj.type == 'Container':
-        space.remove(obj._cpPolyShapes)
+        space.remove(*obj._cpPolyShapes)
         space.remove(obj._cpSensor)
         newshapes = []
         newpolys = []
-        obj.seglist = [s + pos_ch for s in obj.seglist]
-        for p in obj.getPolys():
-            newverts = [v + pos_ch for v in p]
+        obj.seglist = [pm.Vec2d(*(s + pos_ch)) for s in obj.seglist]
+        obj.pos = obj.pos + pos_ch
+        for p in obj.get_polys():
+            newverts = [tuple(v + pos_ch) for v in p]
             newpolys.append(newverts)
             s = pm.Poly(space.static_body, newverts)
             s.friction = fric
             s.elasticity = elast
             s.collision_type = COLTYPE_SOLID
             s.name = nm
+            s.vt_index = obj._vt_index
             newshapes.append(s)
         obj.polylist = newpolys
         obj._cpPolyShapes = newshapes
-        space.add(obj._cpPolyShapes)
-        sensvert = [v + pos_ch for v in obj._cpSensor.get_vertices()]
+        space.add(*obj._cpPolyShapes)
+        sensvert = [tuple(v + pos_ch) for v in obj._cpSensor.get_vertices()]
         obj._cpSensor = pm.Poly(space.static_body, sensvert)
         obj._cpSensor.sensor = True
         obj._cpSensor.collision_type = COLTYPE_SENSOR
         obj._cpSensor.name = nm
+        obj._cpSensor.vt_index = obj._vt_index
         space.add(obj._cpSensor)
     elif obj.type == 'Compound':
-        space.remove(obj._cpShapes)
+        space.remove(*obj._cpShapes)
         newpolys = []
         newshapes = []
-        for p in obj.getPolys():
-            newverts = [v + pos_ch for v in p]
+        for p in obj.get_polys():
+            newverts = [tuple(v + pos_ch) for v in p]
             newpolys.append(newverts)
             s = pm.Poly(space.static_body, newverts)
             s.friction = fric
             s.elasticity = elast
             s.collision_type = COLTYPE_SOLID
             s.name = nm
+            s.vt_index = obj._vt_index
             newshapes.append(s)
         obj.polylist = newpolys
         obj._cpShapes = newshapes
-        space.add(obj._cpShapes)
+        space.add(*obj._cpShapes)
+
+
+# Helper to find the names of the objects that a given object is touching
+
+
+def _touching_names(world: VTWorld, obj: VTObject, contact_shapes: set) -> frozenset:
+    names = set()
+    for s in obj._expose_shapes():
+        for q in world._cpSpace.shape_query(s):
+            # Skip blockers and container sensors, which objects do not touch
+            if q.shape in contact_shapes and q.shape.name != obj.name:
+                names.add(q.shape.name)
+    return frozenset(names)
+
+
+def _contact_shapes(world: VTWorld) -> set:
+    return set([s for o in world.objects.values() for s in o._expose_shapes()])
+
+
+class _VTCollisionNoise:
+    # Perturbs the restitution and normal of new contacts in pre_solve. A class rather than a
+    #  closure so that copies of the world (VTWorld.copy) get their own copy, tied to the new world
+
+    def __init__(self, world: VTWorld, source: VTNoiseSource,
+                 direction_sd: float, elasticity_sd: float):
+        self.world = world
+        self.source = source
+        self.direction_sd = direction_sd
+        self.elasticity_sd = elasticity_sd
+
+    def __call__(self, arb: pm.Arbiter):
+        if self.world.time <= 0.001 or not arb.is_first_contact:
+            return
+        # Make the restitution noisy
+        if self.elasticity_sd > 0:
+            arb.restitution += self.source.trunc_norm(0, self.elasticity_sd, -arb.restitution)
+        # Make the contact normals noisy
+        if self.direction_sd > 0:
+            newnorm = arb.contact_point_set.normal.rotated(
+                self.source.wrapped_norm(0, self.direction_sd))
+            setpoints = []
+            for cp in arb.contact_point_set.points:
+                setpoints.append(pm.ContactPoint(
+                    list(cp.point_a), list(cp.point_b), cp.distance))
+            arb.contact_point_set = pm.ContactPointSet(list(newnorm), setpoints)
+
+
+class VTNoisyWorldFactory:
+
+    # Walls stay put and do not link the objects touching them into groups
+    wall_names = ["_LeftWall", "_BottomWall", "_RightWall", "_TopWall"]
+
+    def __init__(self, base_world: VTWorld):
+        """Makes noisy copies of a world, doing all of the work that does not depend on the random draws only once
+
+        The world is serialized once, and the groups of touching objects (which are moved together by static noise) and the set of objects each moving object touches (which must still be touched after moving noise) are found the first time they are needed. Each call to `make` then only rebuilds the world and applies fresh perturbations
+
+        Args:
+            base_world (VTWorld): the world to make noisy copies of. Later changes to this world are not picked up by the factory
+        """
+        self._wdict = base_world.to_dict()
+        self._base = base_world
+        self._groups = None
+        self._touches = None
+
+    @property
+    def contact_groups(self) -> List[List[str]]:
+        """List[List[str]]: the names of the objects in each group of (transitively) touching objects, excluding the walls
+        """
+        if self._groups is None:
+            w = self._base
+            shapes = _contact_shapes(w)
+            # Union-find over the object names
+            parent = dict([(nm, nm) for nm in w.objects.keys() if nm not in self.wall_names])
+
+            def find(nm):
+                while parent[nm] != nm:
+                    parent[nm] = parent[parent[nm]]
+                    nm = parent[nm]
+                return nm
+
+            for nm in parent.keys():
+                for onm in _touching_names(w, w.objects[nm], shapes):
+                    if onm in parent:
+                        r1 = find(nm)
+                        r2 = find(onm)
+                        if r1 != r2:
+                            parent[r2] = r1
+            groups = dict()
+            for nm in parent.keys():
+                groups.setdefault(find(nm), []).append(nm)
+            self._groups = list(groups.values())
+        return self._groups
+
+    @property
+    def touch_sets(self) -> Dict[str, frozenset]:
+        """Dict[str, frozenset]: the names of the objects touched by each moving object
+        """
+        if self._touches is None:
+            w = self._base
+            shapes = _contact_shapes(w)
+            self._touches = dict([(nm, _touching_names(w, o, shapes))
+                                  for nm, o in w.objects.items() if not o.is_static()])
+        return self._touches
+
+    def make(self,
+             noise_position_static: float=0.,
+             noise_position_moving: float=0.,
+             noise_collision_direction: float=0.,
+             noise_collision_elasticity: float=0.,
+             noise_gravity: float=0.,
+             noise_object_friction: float=0.,
+             noise_object_density: float=0.,
+             noise_object_elasticity: float=0.,
+             seed: int=None,
+             seed_index: int=None) -> VTWorld:
+        """Creates a noisy version of the base world (see `noisify_world` for a description of the arguments)
+
+        Returns:
+            VTWorld: a noisy version of the base world
+        """
+        w = load_vt_from_dict(self._wdict)
+        perception, collision = VTNoiseSource.streams(seed, seed_index)
+
+        # Figure out the gravity (with adjustments)
+        if noise_gravity > 0:
+            grav = w.gravity * perception.trunc_norm(1, noise_gravity, 0)
+        else:
+            grav = w.gravity
+
+        # Turn gravity off while objects get moved around
+        w.gravity = 0
+
+        # With static noise, move all touching objects together
+        if noise_position_static > 0:
+            for group in self.contact_groups:
+                pos_change = np.array(perception.isotropic(noise_position_static))
+                for onm in group:
+                    o = w.objects[onm]
+                    if o.is_static():
+                        _move_static(o, pos_change, w._cpSpace)
+                    else:
+                        o.position += pos_change
+            w._static_version += 1
+
+        # With moving noise, adjust objects individually but make sure they are still touching everything they already were
+        if noise_position_moving > 0:
+            touches = self.touch_sets
+            # Static noise recreates shapes, so these are found after it
+            shapes = _contact_shapes(w)
+            free_obj = []
+            orig_pos = {}
+            orig_vel = {}
+            for onm, obj in w.objects.items():
+                if not obj.is_static():
+                    free_obj.append(obj)
+                    orig_pos[onm] = obj.position
+                    orig_vel[onm] = obj.velocity
+                    obj.velocity = (0, 0)
+
+            # Catch to ensure moving static objects doesn't produce an impossible configuration
+            noise_attempts = 0
+            max_attempts = 500
+            while len(free_obj) > 0 and noise_attempts < max_attempts:
+                noise_attempts += 1
+
+                # Randomly perturb everything
+                for o in free_obj:
+                    o.position += np.array(perception.isotropic(noise_position_moving))
+
+                # Take tiny steps to resolve overlaps
+                for i in range(10):
+                    w._cpSpace.step(.1)
+
+                # Check that the contacts are exactly those that existed already - if not, reset
+                checked_contacts = []
+                for o in free_obj:
+                    if _touching_names(w, o, shapes) == touches[o.name]:
+                        checked_contacts.append(o.name)
+                        o._cpBody.sleep()
+                    else:
+                        o.position = orig_pos[o.name]
+
+                # things are getting messed up when we reduce free_obj in the w._cpSpace.step() phase to not include all objects. I'm not sure why,
+                # but the obvious fix for this for now is to just free up every object whenever we don't "make it" through to having no free objects
+                if len(checked_contacts) < len(free_obj):
+                    for o in free_obj:
+                        o._cpBody.activate()  # wake things again if this isn't going to work
+                else:
+                    free_obj = []
+
+            # Wake things back up
+            for onm, v in orig_vel.items():
+                o = w.objects[onm]
+                o._cpBody.activate()
+                o.velocity = v
+
+            # so as to prevent impossible configurations - just go back to original position
+            if noise_attempts >= max_attempts:
+                for onm, v in orig_vel.items():
+                    o = w.objects[onm]
+                    o.velocity = v
+                    o.position = orig_pos[onm]
+
+        # Set the callbacks to add noise
+        if noise_collision_direction > 0 or noise_collision_elasticity > 0:
+            # The world only routes pre_solve through Python when there is noise to add
+            w._set_collision_noise(_VTCollisionNoise(w, collision, noise_collision_direction,
+                                                     noise_collision_elasticity))
+
+        # Reset the world
+        w.gravity = grav
+        return w
+
+
+def _world_factory(gameworld: VTWorld) -> VTNoisyWorldFactory:
+    # Reuses the factory from the last call on this world (and the contact structure it found),
+    #  unless the world has changed since
+    wdict = gameworld.to_dict()
+    factory = getattr(gameworld, '_noisy_factory', None)
+    if factory is None or factory._wdict != wdict:
+        factory = VTNoisyWorldFactory(gameworld)
+        gameworld._noisy_factory = factory
+    return factory
 
 
 def noisify_world(gameworld: VTWorld,
@@ -157,9 +394,13 @@ def noisify_world(gameworld: VTWorld,
                   noise_gravity: float=0.,
                   noise_object_friction: float=0.,
                   noise_object_density: float=0.,
-                  noise_object_elasticity: float=0.) -> VTWorld:
+                  noise_object_elasticity: float=0.,
+                  seed: int=None,
+                  seed_index: int=None) -> VTWorld:
     """Creates a noisy version of a VTWorld, including: perceptual noise, collision noise, and property noise
     (NOTE: property noise currently is not implemented, except for gravity)
+
+    Repeated calls on the same, unchanged world reuse the VTNoisyWorldFactory from the last call, so the groups of touching objects are only found once
     
     perceptual noise:
         Changes the location of objects by perturbing each objects' positions by a gaussian around the original location. The standard deviation of this is set separately for static and moving objects
@@ -180,204 +421,43 @@ def noisify_world(gameworld: VTWorld,
         noise_object_friction (float, optional): NOT IMPLEMENTED. Defaults to 0..
         noise_object_density (float, optional): NOT IMPLEMENTED. Defaults to 0..
         noise_object_elasticity (float, optional): NOT IMPLEMENTED. Defaults to 0..
+        seed (int, optional): the seed for all random draws (including the collision noise drawn during the rollout), so that the same seed gives the same noisy world and dynamics. Defaults to None (unseeded).
+        seed_index (int, optional): the index of this noise sample under `seed`. Sample k of every world made with the same seed gets the same perceptual perturbation and the same collision noise stream, so outcomes for different actions can be compared in pairs (common random numbers). Defaults to None.
 
     Returns:
         VTWorld: a noisy version of the original world
-    """    
-
-    w = gameworld.copy()
-
-    # Figure out the gravity (with adjustments)
-    if noise_gravity > 0:
-        grav = w.gravity * trunc_norm(1, noise_gravity, 0)
-    else:
-        grav = w.gravity
-
-    # Turn things off (gravity & callbacks)
-    w.gravity = 0
-    w._cpSpace.add_collision_handler(COLTYPE_SOLID, COLTYPE_SOLID)
-    w._cpSpace.add_collision_handler(COLTYPE_PLACED, COLTYPE_SOLID)
-    w._cpSpace.add_collision_handler(COLTYPE_SOLID, COLTYPE_SENSOR)
-    w._cpSpace.add_collision_handler(COLTYPE_PLACED, COLTYPE_SENSOR)
-
-    # Adjust the object positions and attributes
-    # First segment in to static vs not static & adjust properties
-    wall_names = ["_LeftWall", "_BottomWall", "_RightWall", "_TopWall"]
+    """
+    return _world_factory(gameworld).make(noise_position_static,
+                                               noise_position_moving,
+                                               noise_collision_direction,
+                                               noise_collision_elasticity,
+                                               noise_gravity,
+                                               noise_object_friction,
+                                               noise_object_density,
+                                               noise_object_elasticity,
+                                               seed,
+                                               seed_index)
+
+
+def noisify_collisions(gameworld: VTWorld,
+                       noise_collision_direction: float=0.,
+                       noise_collision_elasticity: float=0.,
+                       seed: int=None,
+                       seed_index: int=None):
+    """Adds collision noise to a world in place, from its current state onwards (e.g., to a world forked mid-rollout with `VTWorld.copy`)
+
+    Any collision noise the world already had is replaced; setting both standard deviations to 0 removes it
 
-    # With static noise, group all touching objects and move them together
-    if noise_position_static > 0:
-        # Make object groups (things that move together because they are touching)
-        obj_groups = []
-        objs = w.objects.values()
-        for i in range(len(objs) - 1):
-            o1 = objs[i]
-            if o1.name not in wall_names:
-                this_idx = -1
-                for idx, og in enumerate(obj_groups):
-                    if o1.name in [o.name for o in og]:
-                        this_idx = idx
-                if this_idx == -1:
-                    this_idx = len(obj_groups)
-                    obj_groups.append([o1])
-                for j in range(i + 1, len(objs)):
-                    o2 = objs[j]
-                    if o1.checkContact(o2):
-                        if o2.name not in [o.name for o in obj_groups[this_idx]] + wall_names:
-                            obj_groups[this_idx].append(o2)
-
-        # Now that the space is segmented, move all static items together
-        for og in obj_groups:
-            pos_change = noise_position_static * norm.rvs(size=2)
-            for o in og:
-                if o.is_static():
-                    _move_static(o, pos_change, w._cpSpace)
-                else:
-                    o.position += pos_change
-
-    # With moving noise, adjust objects individually but make sure they are still touching everything they already were
-    if noise_position_moving > 0:
-        # Find the things that need to be moved and cache their original positions and touching objects
-        free_obj = []
-        orig_pos = {}
-        orig_vel = {}
-        touch_dict = {}
-        for onm, obj in w.objects.items():
-            if not obj.is_static():
-                free_obj.append(obj)
-                orig_pos[onm] = obj.position
-                orig_vel[onm] = obj.velocity
-
-                obj.velocity = (0, 0)
-                touch_dict[onm] = []
-                for onm2, obj2 in w.objects.items():
-                    if onm != onm2:
-                        if obj.checkContact(obj2):
-                            touch_dict[onm].append(obj2)
-
-        # Catch to ensure moving static objects doesn't produce an impossible configuration
-        noise_attempts = 0
-        max_attempts = 500
-        while len(free_obj) > 0 and noise_attempts < max_attempts:
-            noise_attempts += 1
-
-            # Randomly perturb everything
-            for o in free_obj:
-                o.position += noise_position_moving * norm.rvs(size=2)
-
-            # Take tiny steps to resolve overlaps
-            for i in range(10):
-                w._cpSpace.step(.1)
-
-            # Check that any contacts that existed already still remain - if not, reset
-            checked_contacts = []
-            for o in free_obj:
-                stillgood = True
-                touches = touch_dict[o.name]
-                for o2 in w.objects.values():
-                    if stillgood and o.name != o2.name:  # Make sure it's not the same thing; save compuatation
-                        if o.checkContact(o2):
-                            # If there's a contact, make sure that it's not a new one
-                            if o2 not in touches:
-                                stillgood = False
-                        else:
-                            # Otherwise, make sure if it's not touching it shouldn't be
-                            if o2 in touches:
-                                stillgood = False
-                if stillgood:
-                    checked_contacts.append(o.name)
-                    o._cpBody.sleep()
-                else:
-                    o.position = orig_pos[o.name]
-
-            # Now reduce free_obj
-
-            # things are getting messed up when we reduce free_obj in the w._cpSpace.step() phase to not include all objects. I'm not sure why,
-            # but the obvious fix for this for now is to just free up every object whenever we don't "make it" through to having no free objects
-            curr_free_obj = [
-                o for o in free_obj if o.name not in checked_contacts]
-            if len(curr_free_obj) > 0:
-                for o in free_obj:
-                    o._cpBody.activate()  # wake things again if this isn't going to work
-            else:
-                free_obj = []
-
-        # Wake things back up
-        for onm, v in orig_vel.items():
-            o = w.objects[onm]
-            o._cpBody.activate()
-            o.velocity = v
-
-        # so as to prevent impossible configurations - just go back to original position
-        if noise_attempts >= max_attempts:
-            for onm, v in orig_vel.items():
-                o = w.objects[onm]
-                o.velocity = v
-                o.position = orig_pos[onm]
-
-    # Set the callbacks to add noise
+    Args:
+        gameworld (VTWorld): the world to add collision noise to
+        noise_collision_direction (float, optional): the sd of a wrapped gaussian describing collision impulse perturbations. Defaults to 0..
+        noise_collision_elasticity (float, optional): the sd of the elasticity of the colision, which directly impacts the magnitude. Defaults to 0..
+        seed (int, optional): the seed for the collision noise. Defaults to None (unseeded).
+        seed_index (int, optional): the index of this noise sample under `seed`; this draws the same collision noise stream as `noisify_world` does for the same seed and index. Defaults to None.
+    """
     if noise_collision_direction > 0 or noise_collision_elasticity > 0:
-        def noisify_arbiter(arb):
-            # Make the restitution noisy
-            if noise_collision_elasticity > 0:
-                arb.restitution += trunc_norm(0,
-                                              noise_collision_elasticity, -arb.restitution)
-            # Make the contact normals noisy
-            if noise_collision_direction > 0:
-                newnorm = arb.contact_point_set.normal.rotated(
-                    wrapped_norm(0, noise_collision_direction))
-                setpoints = []
-                for cp in arb.contact_point_set.points:
-                    setpoints.append(pm.ContactPoint(
-                        list(cp.point_a), list(cp.point_b), cp.distance))
-                newcps = pm.ContactPointSet(list(newnorm), setpoints)
-                arb.contact_point_set = newcps
-
-        def do_solid_solid_pre(arb, space, data):
-            if w.time > 0.001 and arb.is_first_contact:
-                noisify_arbiter(arb)
-            return w._solid_solid_pre(arb, space, data)
-
+        _, collision = VTNoiseSource.streams(seed, seed_index)
+        gameworld._set_collision_noise(_VTCollisionNoise(gameworld, collision, noise_collision_direction,
+                                                         noise_collision_elasticity))
     else:
-        def do_solid_solid_pre(arb, space, data):
-            return w._solid_solid_pre(arb, space, data)
-
-    # Reset the world
-    w.gravity = grav
-
-    def do_solid_solid_begin(arb, space, data):
-        return w._solid_solid_begin(arb, space, data)
-
-    def do_solid_solid_post(arb, space, data):
-        return w._solid_solid_post(arb, space, data)
-
-    def do_solid_solid_end(arb, space, data):
-        return w._solid_solid_end(arb, space, data)
-
-    def do_solid_goal_begin(arb, space, data):
-        return w._solid_goal_begin(arb, space, data)
-
-    def do_solid_goal_end(arb, space, data):
-        return w._solid_goal_end(arb, space, data)
-
-    ssch = w._cpSpace.add_collision_handler(COLTYPE_SOLID, COLTYPE_SOLID)
-    ssch.begin = do_solid_solid_begin
-    ssch.pre_solve = do_solid_solid_pre
-    ssch.post_solve = do_solid_solid_post
-    ssch.separate = do_solid_solid_end
-
-    psch = w._cpSpace.add_collision_handler(COLTYPE_PLACED, COLTYPE_SOLID)
-    psch.begin = do_solid_solid_begin
-    psch.pre_solve = do_solid_solid_pre
-    psch.post_solve = do_solid_solid_post
-    psch.separate = do_solid_solid_end
-
-    ssench = w._cpSpace.add_collision_handler(COLTYPE_SOLID, COLTYPE_SENSOR)
-    ssench.begin = do_solid_goal_begin
-    ssench.separate = do_solid_goal_end
-
-    psench = w._cpSpace.add_collision_handler(COLTYPE_PLACED, COLTYPE_SENSOR)
-    psench.begin = do_solid_goal_begin
-    psench.separate = do_solid_goal_end
-
-    w._cpSpace.step(.000001)
-    return w
+        gameworld._set_collision_noise(None)
@@ -16,7 +16,8 @@ class VTPoly(VTObject):
 
     def __init__(self,name: str, space: pm.Space, vertices: List[Tuple[float,float]],
                  density: float = DEFAULT_DENSITY, elasticity: float=DEFAULT_ELASTICITY,
-                 friction: float=DEFAULT_FRICTION, color: str | Tuple[int,int,int,int]=DEFAULT_COLOR):
+                 friction: float=DEFAULT_FRICTION, color: str | Tuple[int,int,int,int]=DEFAULT_COLOR,
+                 geometry: Dict=None):
         """Instantiates a convex polygon object
 
         Args:
@@ -27,12 +28,15 @@ class VTPoly(VTObject):
             elasticity (float, optional): the elasticity of the object. Defaults to DEFAULT_ELASTICITY.
             friction (float, optional): the friction of the object. Defaults to DEFAULT_FRICTION.
             color (str | Tuple[int,int,int,int], optional): either a string or (r,g,b,a) tuple describing the object color. Defaults to DEFAULT_COLOR.
+            geometry (Dict, optional): the output of `VTPoly.compute_geometry` for these vertices and density, if already computed. Defaults to None.
         """        
         VTObject.__init__(self, name, "Poly", space, color, density, friction, elasticity)
 
-        vertices = [[float(vp) for vp in v] for v in vertices]
-        loc = verts_to_vec2d(convex_centroid(vertices))
-        self.area = convex_area(vertices)
+        if geometry is None:
+            geometry = VTPoly.compute_geometry(vertices, density)
+        vertices = geometry['vertices']
+        loc = verts_to_vec2d(geometry['centroid'])
+        self.area = geometry['area']
         mass = density * self.area
 
         if mass == 0:
@@ -43,7 +47,7 @@ class VTPoly(VTObject):
             self._cpShape.name = name
             space.add(self._cpShape)
         else:
-            vertices = poly_to_vec2d(recenter_polygon(vertices))
+            vertices = geometry['local_vertices']
             imom = pm.moment_for_poly(mass, vertices)
             self._cpBody = pm.Body(mass, imom)
             self._cpShape = pm.Poly(self._cpBody, vertices)
@@ -54,6 +58,26 @@ class VTPoly(VTObject):
             self._cpBody.position = loc
             space.add(self._cpBody, self._cpShape)
 
+    @staticmethod
+    def compute_geometry(vertices: List[Tuple[float, float]], density: float) -> Dict:
+        """Computes everything a VTPoly derives from its vertices, so it can be done once and reused (see `VTWorldSpec`)
+
+        Args:
+            vertices (List[Tuple[float, float]]): a list of (x,y) vertices making up the polygon
+            density (float): the density of the object (0 for static)
+
+        Returns:
+            Dict: the geometry to pass to the constructor
+        """
+        vertices = [[float(vp) for vp in v] for v in vertices]
+        area = convex_area(vertices)
+        geometry = {'vertices': vertices,
+                    'centroid': tuple(convex_centroid(vertices)),
+                    'area': area}
+        if density * area != 0:
+            geometry['local_vertices'] = poly_to_vec2d(recenter_polygon(vertices))
+        return geometry
+
     def get_vertices(self) -> List[Tuple[float, float]]:
         """Returns the vertices of the polygon
 
@@ -214,28 +238,24 @@ class VTContainer(VTObject):
 
     def __init__(self,name, space, ptlist, width, density = DEFAULT_DENSITY,
                  elasticity=DEFAULT_ELASTICITY, friction=DEFAULT_FRICTION,
-                 inner_color=DEFAULT_GOAL_COLOR, outer_color=DEFAULT_COLOR):
+                 inner_color=DEFAULT_GOAL_COLOR, outer_color=DEFAULT_COLOR,
+                 geometry=None):
         VTObject.__init__(self, name, "Container", space, outer_color, density, friction, elasticity)
         self.inner_color = inner_color
         self.outer_color = outer_color
         self.r = width / 2
 
-        loc = verts_to_vec2d(convex_centroid(ptlist))
+        if geometry is None:
+            geometry = VTContainer.compute_geometry(ptlist, width, density)
+        loc = verts_to_vec2d(geometry['centroid'])
         self.pos = np.array([loc.x, loc.y])
-        ptlist = copy.deepcopy(ptlist)
-        if density != 0:
-            ptlist = recenter_polygon(ptlist)
-        #self.seglist = map(lambda p: pm.Vec2d(p), ptlist)
-        self.seglist = [verts_to_vec2d(p) for p in ptlist]
+        self.seglist = list(geometry['seglist'])
 
-        self._area = np.pi * self.r * self.r
+        self._area = geometry['area']
         imom = 0
         for i in range(len(self.seglist)-1):
-            v1 = self.seglist[i]
-            v2 = self.seglist[i+1]
-            larea = 2*self.r* v1.get_distance(v2)
-            self._area += larea
-            imom += pm.moment_for_segment(larea*density, v1, v2, 0)
+            imom += pm.moment_for_segment(geometry['segment_areas'][i]*density,
+                                          self.seglist[i], self.seglist[i+1], 0)
 
         mass = density * self._area
         if mass == 0:
@@ -245,7 +265,7 @@ class VTContainer(VTObject):
             space.add(self._cpBody)
 
         self._cpPolyShapes = []
-        self.polylist = segs_to_poly(ptlist, self.r)
+        self.polylist = list(geometry['polylist'])
 
         for pl in self.polylist:
             pshp = pm.Poly(uBody, pl)
@@ -256,11 +276,7 @@ class VTContainer(VTObject):
             self._cpPolyShapes.append(pshp)
             space.add(pshp)
 
-        # Make sure we have ccw
-        if not check_counterclockwise(ptlist):
-            ptlist.reverse()
-
-        self._cpSensor = pm.Poly(uBody, poly_to_vec2d(ptlist))
+        self._cpSensor = pm.Poly(uBody, geometry['sensor'])
         self._cpSensor.sensor = True
         self._cpSensor.collision_type = COLTYPE_SENSOR
         self._cpSensor.name = name
@@ -268,6 +284,42 @@ class VTContainer(VTObject):
         if mass != 0:
             self._cpBody.position = loc
 
+    @staticmethod
+    def compute_geometry(ptlist, width, density) -> Dict:
+        """Computes everything a VTContainer derives from its points, so it can be done once and reused (see `VTWorldSpec`)
+
+        Args:
+            ptlist (List[Tuple[float, float]]): the (x,y) points defining the container walls
+            width (float): the width of the walls
+            density (float): the density of the object (0 for static)
+
+        Returns:
+            Dict: the geometry to pass to the constructor
+        """
+        r = width / 2
+        centroid = tuple(convex_centroid(ptlist))
+        ptlist = copy.deepcopy(ptlist)
+        if density != 0:
+            ptlist = recenter_polygon(ptlist)
+        seglist = [verts_to_vec2d(p) for p in ptlist]
+
+        area = np.pi * r * r
+        segment_areas = []
+        for i in range(len(seglist)-1):
+            larea = 2*r* seglist[i].get_distance(seglist[i+1])
+            segment_areas.append(larea)
+            area += larea
+
+        polylist = segs_to_poly(ptlist, r)
+
+        # Make sure we have ccw
+        if not check_counterclockwise(ptlist):
+            ptlist.reverse()
+
+        return {'centroid': centroid, 'seglist': seglist, 'area': area,
+                'segment_areas': segment_areas, 'polylist': polylist,
+                'sensor': poly_to_vec2d(ptlist)}
+
     def get_polys(self):
         if self.is_static():
             polys = self.polylist
@@ -321,6 +373,9 @@ class VTContainer(VTObject):
     def _expose_shapes(self):
         return self._cpPolyShapes
 
+    def _expose_all_shapes(self):
+        return self._cpPolyShapes + [self._cpSensor]
+
     def distance_from_point(self, point):
         d, _ = self._cpSensor.point_query(point)
         return d
@@ -342,19 +397,20 @@ class VTContainer(VTObject):
 class VTCompound(VTObject):
 
     def __init__(self, name, space, polygons, density = DEFAULT_DENSITY,
-                 elasticity=DEFAULT_ELASTICITY, friction=DEFAULT_FRICTION,color=DEFAULT_COLOR):
+                 elasticity=DEFAULT_ELASTICITY, friction=DEFAULT_FRICTION,color=DEFAULT_COLOR,
+                 geometry=None):
         VTObject.__init__(self, name, "Compound", space, color, density, friction, elasticity)
 
-        self._area = 0
+        if geometry is None:
+            geometry = VTCompound.compute_geometry(polygons, density)
+        self._area = geometry['area']
         self.polylist = []
         self._cpShapes = []
+        gx, gy = geometry['centroid']
+        loc = pm.Vec2d(gx, gy)
         # If it's static, add polygons inplace
         if density == 0:
-            polyCents = []
-            areas = []
-            for vertices in polygons:
-                polyCents.append(verts_to_vec2d(convex_centroid(vertices)))
-                areas.append(convex_area(vertices))
+            for vertices in geometry['polygons']:
                 sh = pm.Poly(space.static_body, vertices)
                 sh.elasticity = elasticity
                 sh.friction = friction
@@ -362,37 +418,12 @@ class VTCompound(VTObject):
                 sh.name = name
                 space.add(sh)
                 self._cpShapes.append(sh)
-                self.polylist.append([pm.Vec2d(p) for p in vertices])
-
-            gx = gy = 0
-            for pc, a in zip(polyCents, areas):
-                gx += pc[0] * a
-                gy += pc[1] * a
-                self._area += a
-            gx /= self._area
-            gy /= self._area
-            loc = pm.Vec2d(gx, gy)
+                self.polylist.append([pm.Vec2d(p[0], p[1]) for p in vertices])
             self.pos = np.array([gx, gy])
 
         else:
-            polyCents = []
-            areas = []
-            for i in range(len(polygons)):
-                vertices = polygons[i]
-                polyCents.append(verts_to_vec2d(convex_centroid(vertices)))
-                vertices = recenter_polygon(vertices)
-                polygons[i] = poly_to_vec2d(vertices)
-                areas.append(convex_area(vertices))
-            gx = gy = 0
-            for pc, a in zip(polyCents, areas):
-                gx += pc[0] * a
-                gy += pc[1] * a
-                self._area += a
-            gx /= self._area
-            gy /= self._area
-            loc = pm.Vec2d(gx, gy)
             imom = 0
-            for pc, a, verts in zip(polyCents, areas, polygons):
+            for pc, a, verts in zip(geometry['centroids'], geometry['areas'], geometry['polygons']):
                 pos = pm.Vec2d(pc[0] - loc.x, pc[1] - loc.y)
                 imom += pm.moment_for_poly(density*a, verts, pos)
                 rcverts = [pm.Vec2d(p[0]+pos.x, p[1]+pos.y) for p in verts]
@@ -410,6 +441,38 @@ class VTCompound(VTObject):
                 space.add(sh)
             self._cpBody.position = loc
 
+    @staticmethod
+    def compute_geometry(polygons, density) -> Dict:
+        """Computes everything a VTCompound derives from its polygons, so it can be done once and reused (see `VTWorldSpec`)
+
+        Args:
+            polygons (List[List[Tuple[float, float]]]): the convex polygons making up the object
+            density (float): the density of the object (0 for static)
+
+        Returns:
+            Dict: the geometry to pass to the constructor
+        """
+        centroids = []
+        areas = []
+        polys = []
+        for vertices in polygons:
+            centroids.append(verts_to_vec2d(convex_centroid(vertices)))
+            # Dynamic polygons are stored relative to their own centroids
+            if density != 0:
+                vertices = poly_to_vec2d(recenter_polygon(vertices))
+            areas.append(convex_area(vertices))
+            polys.append(vertices)
+        area = 0
+        gx = gy = 0
+        for pc, a in zip(centroids, areas):
+            gx += pc[0] * a
+            gy += pc[1] * a
+            area += a
+        gx /= area
+        gy /= area
+        return {'polygons': polys, 'centroids': centroids, 'areas': areas,
+                'centroid': (gx, gy), 'area': area}
+
     def get_polys(self):
         if self.is_static():
             rpolys = []
@@ -471,14 +534,22 @@ class VTCompound(VTObject):
 
 class VTGoal(VTObject):
 
-    def __init__(self, name, space, vertices, color):
+    def __init__(self, name, space, vertices, color, geometry=None):
         VTObject.__init__(self, name, "Goal", space, color, 0, 0, 0)
+        if geometry is None:
+            geometry = VTGoal.compute_geometry(vertices)
         self._cpShape = pm.Poly(space.static_body, vertices)
         self._cpShape.sensor = True
         self._cpShape.collision_type = COLTYPE_SENSOR
         self._cpShape.name = name
         space.add(self._cpShape)
-        self.pos = np.array(convex_centroid(vertices))
+        self.pos = np.array(geometry['centroid'])
+
+    @staticmethod
+    def compute_geometry(vertices) -> Dict:
+        """Computes everything a VTGoal derives from its vertices, so it can be done once and reused (see `VTWorldSpec`)
+        """
+        return {'centroid': tuple(convex_centroid(vertices))}
 
     def get_vertices(self):
         verts = [np.array(v) for v in self._cpShape.get_vertices()]
@@ -496,14 +567,22 @@ class VTGoal(VTObject):
 
 class VTBlocker(VTObject):
 
-    def __init__(self, name, space, vertices, color):
+    def __init__(self, name, space, vertices, color, geometry=None):
         VTObject.__init__(self, name, "Blocker", space, color, 0, 0, 0)
+        if geometry is None:
+            geometry = VTBlocker.compute_geometry(vertices)
         self._cpShape = pm.Poly(space.static_body, vertices)
         self._cpShape.sensor = True
         self._cpShape.collision_type = COLTYPE_BLOCKED
         self._cpShape.name = name
         space.add(self._cpShape)
-        self.pos = np.array(convex_centroid(vertices))
+        self.pos = np.array(geometry['centroid'])
+
+    @staticmethod
+    def compute_geometry(vertices) -> Dict:
+        """Computes everything a VTBlocker derives from its vertices, so it can be done once and reused (see `VTWorldSpec`)
+        """
+        return {'centroid': tuple(convex_centroid(vertices))}
 
     def get_vertices(self):
         verts = [np.array(v) for v in self._cpShape.get_vertices()]
@@ -0,0 +1,193 @@
+from typing import Tuple, Dict, Any, NamedTuple
+from collections import OrderedDict
+from copy import deepcopy
+from .constants import *
+from .object import VTPoly, VTContainer, VTCompound, VTGoal, VTBlocker
+from ..helpers import word_to_color, canonical_hash
+
+__all__ = ['VTObjectSpec', 'VTWorldSpec', 'compile_world_spec', 'world_from_spec']
+
+# Most compiled specs to keep around (keyed by the content hash of their world dict)
+_SPEC_CACHE_SIZE = 256
+_spec_cache = OrderedDict()
+
+
+class VTObjectSpec(NamedTuple):
+    """A compiled object: everything needed to add it to a world, with its derived geometry already computed
+    """
+    name: str
+    type: str
+    args: Tuple
+    density: float
+    elasticity: float
+    friction: float
+    geometry: Dict
+
+
+class VTWorldSpec(NamedTuple):
+    """A compiled, validated world dict. Specs are shared between every world built from them and must not be modified
+    """
+    key: str
+    dims: Tuple[float, float]
+    gravity: float
+    bts: float
+    def_density: float
+    def_elasticity: float
+    def_friction: float
+    bk_color: Any
+    def_color: Any
+    objects: Tuple[VTObjectSpec, ...]
+    blockers: Tuple[VTObjectSpec, ...]
+    gcond: Tuple
+    fidelity: str
+
+
+def _freeze(l):
+    # Nested sequences become tuples, so specs never share mutable data with the dict they came from
+    if hasattr(l, "__iter__") and not isinstance(l, (str, dict)):
+        return tuple([_freeze(i) for i in l])
+    return l
+
+
+def _compile_object(nm: str, o: Dict, d: Dict) -> VTObjectSpec:
+    def_elast = float(d['defaults']['elasticity'])
+    def_fric = float(d['defaults']['friction'])
+    elasticity = float(o.get('elasticity', def_elast))
+    friction = float(o.get('friction', def_fric))
+    density = float(o.get('density', d['defaults']['density']))
+
+    if o['type'] == 'Poly':
+        verts = _freeze(o['vertices'])
+        args = (verts, word_to_color(o['color']))
+        geom = VTPoly.compute_geometry(verts, density)
+    elif o['type'] == 'Ball':
+        args = (_freeze(o['position']), o['radius'], word_to_color(o['color']))
+        geom = None
+    elif o['type'] == 'Segment':
+        args = (_freeze(o['p1']), _freeze(o['p2']), o['width'], word_to_color(o['color']))
+        geom = None
+    elif o['type'] == 'Container':
+        if 'innerColor' not in o:
+            if 'color' in o:
+                ic = word_to_color(o['color'])
+            else:
+                ic = None
+        else:
+            ic = word_to_color(o['innerColor'])
+        if 'outerColor' not in o:
+            oc = DEFAULT_COLOR
+        else:
+            oc = word_to_color(o['outerColor'])
+        pts = [list(p) for p in o['points']]
+        args = (_freeze(pts), o['width'], ic, oc)
+        geom = VTContainer.compute_geometry(pts, o['width'], density)
+    elif o['type'] == 'Goal':
+        verts = _freeze(o['vertices'])
+        args = (verts, word_to_color(o['color']))
+        geom = VTGoal.compute_geometry(verts)
+    elif o['type'] == 'Compound':
+        polys = _freeze(o['polys'])
+        args = (polys, word_to_color(o['color']))
+        geom = VTCompound.compute_geometry(polys, density)
+    else:
+        raise Exception("Invalid object type given: " + o['type'])
+    return VTObjectSpec(nm, o['type'], args, density, elasticity, friction, geom)
+
+
+def _compile_gcond(g: Dict) -> Tuple:
+    # (name of the VTWorld attach method, its arguments)
+    if g is None:
+        return None
+    if g['type'] == 'AnyInGoal':
+        excl = g.get('exclusions', [])
+        return ('attach_any_in_goal', (g['goal'], float(g['duration']), _freeze(excl)))
+    elif g['type'] == 'SpecificInGoal':
+        return ('attach_specific_in_goal', (g['goal'], g['obj'], float(g['duration'])))
+    elif g['type'] == 'ManyInGoal':
+        return ('attach_many_in_goal', (g['goal'], _freeze(g['objlist']), float(g['duration'])))
+    elif g['type'] == 'AnyTouch':
+        return ('attach_any_touch', (g['goal'], float(g['duration'])))
+    elif g['type'] == 'SpecificTouch':
+        return ('attach_specific_touch', (g['goal'], g['obj'], float(g['duration'])))
+    elif g['type'] == 'CondSet':
+        # Each condition is validated here, but kept as a (copied) description for attach_cond_set
+        for sub in g['conditions'].values():
+            assert sub['type'] != 'CondSet', "Condition sets cannot be nested"
+            _compile_gcond(sub)
+        conds = tuple([(nm, deepcopy(sub)) for nm, sub in g['conditions'].items()])
+        return ('attach_cond_set', (conds, g.get('stop', 'any')))
+    else:
+        raise Exception("In valid goal condition type given")
+
+
+def compile_world_spec(d: Dict) -> VTWorldSpec:
+    """Compiles a world dict into a VTWorldSpec, parsing colors and precomputing all derived geometry (centroids, areas, recentered vertices, container decompositions)
+
+    Specs are cached by a canonical hash of the dict, so compiling an identical dict again is a lookup. The dict itself is never modified
+
+    Args:
+        d (Dict): a serializable vesion of the world (e.g., from VTWorld.to_dict())
+
+    Raises:
+        Exception: if invalid object or goal types (or an unknown fidelity profile) are described in the Dict
+
+    Returns:
+        VTWorldSpec: the compiled world
+    """
+    fidelity = d.get('fidelity', DEFAULT_FIDELITY)
+    if fidelity not in FIDELITY_PROFILES:
+        raise Exception("Invalid fidelity profile given: " + str(fidelity))
+    key = canonical_hash(d)
+    spec = _spec_cache.get(key)
+    if spec is not None:
+        _spec_cache.move_to_end(key)
+        return spec
+    objects = tuple([_compile_object(nm, o, d) for nm, o in d['objects'].items()])
+    blockers = tuple([VTObjectSpec(nm, 'Blocker', (_freeze(b['vertices']), word_to_color(b['color'])),
+                                   0., 0., 0., VTBlocker.compute_geometry(b['vertices']))
+                      for nm, b in d['blocks'].items()])
+    spec = VTWorldSpec(key, _freeze(d['dims']), d['gravity'], d['bts'],
+                       float(d['defaults']['density']), float(d['defaults']['elasticity']),
+                       float(d['defaults']['friction']),
+                       word_to_color(d['defaults']['bk_color']), word_to_color(d['defaults']['color']),
+                       objects, blockers, _compile_gcond(d['gcond']), fidelity)
+    _spec_cache[key] = spec
+    while len(_spec_cache) > _SPEC_CACHE_SIZE:
+        _spec_cache.popitem(last=False)
+    return spec
+
+
+def world_from_spec(spec: VTWorldSpec):
+    """Builds a new VTWorld from a compiled spec
+
+    Args:
+        spec (VTWorldSpec): the compiled world
+
+    Returns:
+        VTWorld: a new world in the state described by the spec
+    """
+    from .world import VTWorld
+    vtw = VTWorld(list(spec.dims), spec.gravity, [False, False, False, False], spec.bts,
+                  spec.def_density, spec.def_elasticity, spec.def_friction,
+                  spec.bk_color, spec.def_color, fidelity=spec.fidelity)
+    for o in spec.objects:
+        if o.type == 'Poly':
+            vtw.add_poly(o.name, o.args[0], o.args[1], o.density, o.elasticity, o.friction, o.geometry)
+        elif o.type == 'Ball':
+            vtw.add_ball(o.name, o.args[0], o.args[1], o.args[2], o.density, o.elasticity, o.friction)
+        elif o.type == 'Segment':
+            vtw.add_segment(o.name, o.args[0], o.args[1], o.args[2], o.args[3], o.density, o.elasticity, o.friction)
+        elif o.type == 'Container':
+            vtw.add_container(o.name, o.args[0], o.args[1], o.args[2], o.args[3],
+                              o.density, o.elasticity, o.friction, o.geometry)
+        elif o.type == 'Goal':
+            vtw.add_poly_goal(o.name, o.args[0], o.args[1], o.geometry)
+        elif o.type == 'Compound':
+            vtw.add_compound(o.name, o.args[0], o.args[1], o.density, o.elasticity, o.friction, o.geometry)
+    for b in spec.blockers:
+        vtw.add_poly_block(b.name, b.args[0], b.args[1], b.geometry)
+    if spec.gcond is not None:
+        method, args = spec.gcond
+        # Name lists are handed to the condition as fresh lists
+        getattr(vtw, method)(*[list(a) if isinstance(a, tuple) else a for a in args])
+    return vtw
@@ -5,10 +5,12 @@ from .constants import * # Add period here
 from .object import VTPoly, VTBall, VTSeg, VTContainer, VTCompound, \
     VTGoal, VTBlocker, VTObject
 from .conditions import *
-from ..helpers import word_to_color, distance_to_object
+from .abstracts import VTCond_Base
+from .checker import VTPlacementChecker
+from .collisions import VTCollisionTracker
+from ..helpers import distance_to_object
 from copy import deepcopy
 import warnings
-import pdb
 
 __all__ = ["VTWorld", "load_vt_from_dict"]
 
@@ -18,6 +20,47 @@ def _empty_collision_handler(arb: pm.Arbiter, space: pm.Space):
 def _empty_object_handler(o1: VTObject, o2: VTObject):
     return
 
+def _is_empty_handler(fnc: Callable) -> bool:
+    return fnc is _empty_collision_handler or fnc is _empty_object_handler
+
+def _get_default_callbacks() -> Dict:
+    # The C callbacks a new pymunk handler starts with (plain collision processing, no Python).
+    #  These sit on a private attribute of pymunk's CollisionHandler, so if it is missing
+    #  unused events get an empty Python callback instead
+    try:
+        h = pm.Space().add_collision_handler(0, 1)._handler
+        return {'begin': h.beginFunc, 'pre_solve': h.preSolveFunc,
+                'post_solve': h.postSolveFunc, 'separate': h.separateFunc}
+    except AttributeError:
+        warnings.warn("pymunk " + pm.version + " does not expose the C callbacks of its collision handlers; " +
+                      "unused collision events will call into Python, which is slower")
+        return None
+
+_DEFAULT_CALLBACKS = _get_default_callbacks()
+_CALLBACK_FIELDS = {'begin': 'beginFunc', 'pre_solve': 'preSolveFunc',
+                    'post_solve': 'postSolveFunc', 'separate': 'separateFunc'}
+
+# Space settings copied by _VTSpace.clone (the same ones pymunk pickles)
+_SPACE_ATTRS = getattr(pm.Space, '_pickle_attrs_general',
+                       ['iterations', 'gravity', 'damping', 'idle_speed_threshold', 'sleep_time_threshold',
+                        'collision_slop', 'collision_bias', 'collision_persistence', 'threads'])
+
+def _pass_collision(arb: pm.Arbiter, space: pm.Space, data: Dict) -> bool:
+    # Python stand-in for the default C callbacks: process the collision as normal
+    return True
+
+def _set_handler_callback(handler: pm.CollisionHandler, kind: str, fnc: Callable):
+    # Installs a Python callback, or (if fnc is None) puts back the default C callback so
+    #  pymunk doesn't call into Python at all for this event
+    if fnc is None:
+        if _DEFAULT_CALLBACKS is None:
+            setattr(handler, kind, _pass_collision)
+            return
+        setattr(handler._handler, _CALLBACK_FIELDS[kind], _DEFAULT_CALLBACKS[kind])
+        setattr(handler, '_' + kind, None)
+    else:
+        setattr(handler, kind, fnc)
+
 def resolve_arbiter(arb: pm.Arbiter) -> Tuple[str, str]:
     """Returns the Virtual Tool names involved in a pymunk arbiter
 
@@ -39,6 +82,81 @@ def pull_collision_information(arb: pm.Arbiter):
     restitution = arb.restitution
     return [norm, restitution, setpoints]
 
+def _contact_key(s1: pm.Shape, s2: pm.Shape) -> Tuple[int, int]:
+    if id(s1) < id(s2):
+        return (id(s1), id(s2))
+    return (id(s2), id(s1))
+
+def _clone_body(b: pm.Body) -> pm.Body:
+    nb = pm.Body(b.mass, b.moment, b.body_type)
+    nb.center_of_gravity = b.center_of_gravity
+    nb.position = b.position
+    nb.angle = b.angle
+    nb.velocity = b.velocity
+    nb.angular_velocity = b.angular_velocity
+    nb.force = b.force
+    nb.torque = b.torque
+    return nb
+
+def _clone_shape(s: pm.Shape, body: pm.Body) -> pm.Shape:
+    if isinstance(s, pm.Poly):
+        ns = pm.Poly(body, s.get_vertices(), None, s.radius)
+    elif isinstance(s, pm.Circle):
+        ns = pm.Circle(body, s.radius, s.offset)
+    elif isinstance(s, pm.Segment):
+        ns = pm.Segment(body, s.a, s.b, s.radius)
+    else:
+        raise Exception('Cannot copy shape of type ' + type(s).__name__)
+    ns.sensor = s.sensor
+    ns.collision_type = s.collision_type
+    ns.filter = s.filter
+    ns.elasticity = s.elasticity
+    ns.friction = s.friction
+    ns.surface_velocity = s.surface_velocity
+    return ns
+
+class _VTSpace(pm.Space):
+    """A pymunk Space that leaves its collision handlers out when it is pickled or copied. They are bound to the VTWorld that owns the space, which installs them again itself
+    """
+    def __getstate__(self):
+        d = super().__getstate__()
+        # pymunk keeps the handlers among the (name, value) pairs under 'special'
+        if isinstance(d.get('special'), list):
+            d['special'] = [(k, v) for k, v in d['special'] if k != '_handlers']
+        return d
+
+    def clone(self) -> Tuple[pm.Space, Dict]:
+        """Copies the space with its bodies and shapes (but no collision handlers or constraints)
+
+        This does the same as pickling the space, but builds each body and shape directly, which is several times faster
+
+        Returns:
+            Tuple[pm.Space, Dict]: the new space, and a `deepcopy` memo that maps the id of the space and of each of its bodies and shapes to their copies
+        """
+        ns = _VTSpace()
+        for a in _SPACE_ATTRS:
+            setattr(ns, a, getattr(self, a))
+        memo = {id(self): ns, id(self.static_body): ns.static_body}
+        for b in self.bodies:
+            nb = _clone_body(b)
+            nb.__dict__.update([(k, v) for k, v in b.__dict__.items() if k[0] != '_'])
+            memo[id(b)] = nb
+        # Shapes (each preceded by its body) go in in the same order as they went into this
+        #  space, so that contacts are found and solved in the same order
+        added = set([id(ns.static_body)])
+        for s in self.shapes:
+            nb = memo[id(s.body)]
+            sh = _clone_shape(s, nb)
+            sh.__dict__.update([(k, v) for k, v in s.__dict__.items() if k[0] != '_'])
+            memo[id(s)] = sh
+            if id(nb) not in added:
+                added.add(id(nb))
+                ns.add(nb, sh)
+            else:
+                ns.add(sh)
+        ns.add(*[memo[id(b)] for b in self.bodies if id(memo[id(b)]) not in added])
+        return ns, memo
+
 def _listify(l):
     if hasattr(l, "__iter__") and not isinstance(l, str):
         return [_listify(i) for i in l]
@@ -56,7 +174,10 @@ class VTWorld(object):
                  def_elasticity: float = DEFAULT_ELASTICITY,
                  def_friction: float = DEFAULT_FRICTION,
                  bk_col: Annotated[Tuple[int], 3] = (255,255,255),
-                 def_col: Annotated[Tuple[int], 3] = (0,0,0)):
+                 def_col: Annotated[Tuple[int], 3] = (0,0,0),
+                 record_collisions: bool = True,
+                 log_collision_events: bool = True,
+                 fidelity: str = DEFAULT_FIDELITY):
         """Instantiates a virtual tools world
 
         Args:
@@ -69,6 +190,9 @@ class VTWorld(object):
             def_friction (float, optional): _description_. the default friction of all objects in the world, unless otherwise specified. Defaults to 0.5.
             bk_col (Annotated[Tuple[int], 3], optional): the RGB value of the background of the tools world. Defaults to white (255,255,255).
             def_col (Annotated[Tuple[int], 3], optional): the default RGB color of objects added to the world. Not guaranteed to catch. Defaults to black (0,0,0).
+            record_collisions (bool, optional): whether to track collision episodes between objects in `collision_tracker`. Defaults to True.
+            log_collision_events (bool, optional): whether to also keep a raw log of every start and end of contact in `collision_events`. Defaults to True.
+            fidelity (str, optional): the name of the solver settings to use, from FIDELITY_PROFILES. Defaults to "exact".
         """        
 
         self.def_density = def_density
@@ -81,18 +205,31 @@ class VTWorld(object):
         self.bts = basic_timestep
         self.time = 0
         self.has_place_collision = False
+        # Bumped whenever static geometry is moved or removed, so placement checks rebuild
+        self._static_version = 0
+        self._placement_checker = None
+        # The VTNoisyWorldFactory that noisify_world last used for this world
+        self._noisy_factory = None
 
-        self._cpSpace = pm.Space()
+        self._cpSpace = _VTSpace()
         self._cpSpace.gravity = (0, -gravity)
-        self._cpSpace.sleep_time_threshold = 5.
+        self.set_fidelity(fidelity)
 
         self.objects = dict()
+        # Objects by integer index (shapes carry a matching `vt_index`) for fast lookup in collision callbacks
+        self._object_table = []
+        self._free_indices = []
         self.blockers = dict()
         self.constraints = dict() # Not implemented yet
 
+        # The goal is only re-checked while stepping after a collision event (which marks it
+        #  dirty) or once its wake-up time has passed (see `_check_goal`)
+        self._goal_dirty = True
+        self._goal_wake = np.inf
         self.goal_cond = None
         self.win_callback = None
         self._collision_events = []
+        self._collision_tracker = VTCollisionTracker()
         self._ssBegin = _empty_collision_handler
         self._ssPre = _empty_collision_handler
         self._ssPost = _empty_collision_handler
@@ -100,38 +237,15 @@ class VTWorld(object):
         self._sgBegin = _empty_collision_handler
         self._sgEnd = _empty_collision_handler
 
-        def do_solid_solid_begin(arb, space, data):
-            return self._solid_solid_begin(arb, space, data)
-        def do_solid_solid_pre(arb, space, data):
-            return self._solid_solid_pre(arb, space, data)
-        def do_solid_solid_post(arb, space, data):
-            return self._solid_solid_post(arb, space, data)
-        def do_solid_solid_end(arb, space, data):
-            return self._solid_solid_end(arb, space, data)
-        def do_solid_goal_begin(arb, space, data):
-            return self._solid_goal_begin(arb, space, data)
-        def do_solid_goal_end(arb, space, data):
-            return self._solid_goal_end(arb, space, data)
-
-        ssch = self._cpSpace.add_collision_handler(COLTYPE_SOLID, COLTYPE_SOLID)
-        ssch.begin = do_solid_solid_begin
-        ssch.pre_solve = do_solid_solid_pre
-        ssch.post_solve = do_solid_solid_post
-        ssch.separate = do_solid_solid_end
-
-        psch = self._cpSpace.add_collision_handler(COLTYPE_PLACED, COLTYPE_SOLID)
-        psch.begin = do_solid_solid_begin
-        psch.pre_solve = do_solid_solid_pre
-        psch.post_solve = do_solid_solid_post
-        psch.separate = do_solid_solid_end
-
-        ssench = self._cpSpace.add_collision_handler(COLTYPE_SOLID, COLTYPE_SENSOR)
-        ssench.begin = do_solid_goal_begin
-        ssench.separate = do_solid_goal_end
-
-        psench = self._cpSpace.add_collision_handler(COLTYPE_PLACED, COLTYPE_SENSOR)
-        psench.begin = do_solid_goal_begin
-        psench.separate = do_solid_goal_end
+        # Optional perturbation applied to arbiters in pre_solve (set by noisify_world)
+        self._collision_noise = None
+        self._record_collisions = record_collisions
+        self._log_collision_events = log_collision_events
+        # Shape pairs that were touching when this world was copied (see `copy`)
+        self._carried_contacts = dict()
+        # Shape pairs that pymunk still holds as touching from before a `restore`
+        self._stale_contacts = dict()
+        self._compile_handlers()
 
         if closed_ends[0]:
             self.add_box("_LeftWall",[-1,-1,1,self.dims[1]+1], self.def_col, 0)
@@ -153,13 +267,49 @@ class VTWorld(object):
         self.time += t
         for i in range(nsteps):
             self._cpSpace.step(self.bts)
-            if self.check_end() and self.win_callback is not None:
+            if self._carried_contacts:
+                self._settle_carried_contacts()
+            if self._stale_contacts:
+                self._settle_stale_contacts()
+            if (self._goal_dirty or self.time >= self._goal_wake) and self._check_goal() \
+                    and self.win_callback is not None:
                 self.win_callback()
         if remtime / self.bts > .01:
             self._cpSpace.step(remtime)
-        if self.check_end() and self.win_callback is not None:
+            if self._carried_contacts:
+                self._settle_carried_contacts()
+            if self._stale_contacts:
+                self._settle_stale_contacts()
+        if (self._goal_dirty or self.time >= self._goal_wake) and self._check_goal() \
+                and self.win_callback is not None:
             self.win_callback()
 
+    def _check_goal(self) -> bool:
+        # A full goal check, after which the goal can only be won once a collision event
+        #  arrives or its wake-up time passes; until then `step` skips checking. Once the
+        #  wake-up time has passed it is checked after every substep, as `check_end` would be
+        self._goal_dirty = False
+        if self._goal_cond is None:
+            self._goal_wake = np.inf
+            return False
+        won = self._goal_cond.is_won()
+        self._goal_wake = self._goal_cond.next_check_time()
+        return won
+
+    def get_fidelity(self) -> str:
+        return self._fidelity
+
+    def set_fidelity(self, fidelity: str):
+        """Sets the solver iterations, contact slop and bias, and sleeping thresholds together from a named profile
+
+        Args:
+            fidelity (str): the name of a profile in FIDELITY_PROFILES
+        """
+        assert fidelity in FIDELITY_PROFILES, "Unknown fidelity profile: " + str(fidelity)
+        for attr, val in FIDELITY_PROFILES[fidelity].items():
+            setattr(self._cpSpace, attr, val)
+        self._fidelity = fidelity
+
     def _invert(self, pt):
         return (pt[0], self.dims[1] - pt[1])
 
@@ -172,9 +322,9 @@ class VTWorld(object):
         Returns:
             bool: true if victory is achieved; false if not (or if no condition exists)
         """       
-        if self.goal_cond is None:
+        if self._goal_cond is None:
             return False
-        return self.goal_cond.is_won()
+        return self._goal_cond.is_won()
 
     def get_object(self, name: str) -> VTObject:
         """Returns an object that exists in the world
@@ -211,7 +361,7 @@ class VTWorld(object):
     # Adding things to the world
     ########################################
     def add_poly(self,
-                 name, vertices, color, density = None, elasticity = None, friction = None):
+                 name, vertices, color, density = None, elasticity = None, friction = None, geometry = None):
         assert name not in self.objects.keys(), "Name already taken: " + name
         if density is None:
             density = self.def_density
@@ -220,8 +370,8 @@ class VTWorld(object):
         if friction is None:
             friction = self.def_friction
 
-        this_obj = VTPoly(name, self._cpSpace, vertices, density, elasticity, friction, color)
-        self.objects[name] = this_obj
+        this_obj = VTPoly(name, self._cpSpace, vertices, density, elasticity, friction, color, geometry)
+        self._register_object(name, this_obj)
         return this_obj
 
     def add_box(self, name, bounds, color, density = None, elasticity = None, friction = None):
@@ -241,7 +391,7 @@ class VTWorld(object):
         vertices = [(l,b), (l,t), (r,t), (r,b)]
 
         this_obj = VTPoly(name, self._cpSpace, vertices, density, elasticity, friction, color)
-        self.objects[name] = this_obj
+        self._register_object(name, this_obj)
         return this_obj
 
     def add_ball(self, name, position, radius, color, density = None, elasticity = None, friction = None):
@@ -254,7 +404,7 @@ class VTWorld(object):
             friction = self.def_friction
 
         this_obj = VTBall(name, self._cpSpace, position, radius, density, elasticity, friction, color)
-        self.objects[name] = this_obj
+        self._register_object(name, this_obj)
         return this_obj
 
     def add_segment(self, name, p1, p2, width, color, density = None, elasticity = None, friction = None):
@@ -267,10 +417,10 @@ class VTWorld(object):
             friction = self.def_friction
 
         this_obj = VTSeg(name, self._cpSpace, p1, p2, width, density, elasticity, friction, color)
-        self.objects[name] = this_obj
+        self._register_object(name, this_obj)
         return this_obj
 
-    def add_container(self, name, ptlist, width, inner_color, outer_color, density = None, elasticity = None, friction = None):
+    def add_container(self, name, ptlist, width, inner_color, outer_color, density = None, elasticity = None, friction = None, geometry = None):
         assert name not in self.objects.keys(), "Name already taken: " + name
         if density is None:
             density = self.def_density
@@ -279,11 +429,11 @@ class VTWorld(object):
         if friction is None:
             friction = self.def_friction
 
-        this_obj = VTContainer(name, self._cpSpace, ptlist, width, density, elasticity, friction, inner_color, outer_color)
-        self.objects[name] = this_obj
+        this_obj = VTContainer(name, self._cpSpace, ptlist, width, density, elasticity, friction, inner_color, outer_color, geometry)
+        self._register_object(name, this_obj)
         return this_obj
 
-    def add_compound(self, name, polys, color, density = None, elasticity = None, friction = None):
+    def add_compound(self, name, polys, color, density = None, elasticity = None, friction = None, geometry = None):
         assert name not in self.objects.keys(), "Name already taken: " + name
         if density is None:
             density = self.def_density
@@ -292,14 +442,14 @@ class VTWorld(object):
         if friction is None:
             friction = self.def_friction
 
-        this_obj = VTCompound(name, self._cpSpace, polys, density, elasticity, friction, color)
-        self.objects[name] = this_obj
+        this_obj = VTCompound(name, self._cpSpace, polys, density, elasticity, friction, color, geometry)
+        self._register_object(name, this_obj)
         return this_obj
 
-    def add_poly_goal(self, name, vertices, color):
+    def add_poly_goal(self, name, vertices, color, geometry = None):
         assert name not in self.objects.keys(), "Name already taken: " + name
-        this_obj = VTGoal(name, self._cpSpace, vertices, color)
-        self.objects[name] = this_obj
+        this_obj = VTGoal(name, self._cpSpace, vertices, color, geometry)
+        self._register_object(name, this_obj)
         return this_obj
 
     def add_box_goal(self, name, bounds, color):
@@ -311,7 +461,7 @@ class VTWorld(object):
         t = bounds[3]
         vertices = [(l, b), (l, t), (r, t), (r, b)]
         this_obj = VTGoal(name, self._cpSpace, vertices, color)
-        self.objects[name] = this_obj
+        self._register_object(name, this_obj)
         return this_obj
 
     def add_placed_poly(self, name, vertices, color, density = None, elasticity = None, friction = None):
@@ -330,6 +480,39 @@ class VTWorld(object):
         this_obj._cpShape.collision_type = COLTYPE_PLACED
         return this_obj
 
+    def _register_object(self, name: str, obj: VTObject):
+        # Adds an object to the name and index lookups, and tags its shapes with the index
+        # Reuse slots from removed objects so swapping placed tools doesn't grow the table
+        if len(self._free_indices) > 0:
+            idx = self._free_indices.pop()
+            self._object_table[idx] = obj
+        else:
+            idx = len(self._object_table)
+            self._object_table.append(obj)
+        obj._vt_index = idx
+        for s in obj._expose_all_shapes():
+            s.vt_index = idx
+        self.objects[name] = obj
+
+    def remove_object(self, name: str):
+        """Takes an object out of the world (e.g., to swap out a placed tool)
+
+        Args:
+            name (str): the Virtual Tools name flag of the object
+
+        Raises:
+            AssertionError: if the object doesn't exist
+        """
+        o = self.get_object(name)
+        if o.is_static():
+            self._cpSpace.remove(*o._expose_all_shapes())
+            self._static_version += 1
+        else:
+            self._cpSpace.remove(o._cpBody, *o._cpBody.shapes)
+        self._object_table[o._vt_index] = None
+        self._free_indices.append(o._vt_index)
+        del self.objects[name]
+
     def add_block(self, name, bounds, color):
         assert name not in self.blockers.keys(), "Name already taken: " + name
         assert len(bounds) == 4, "Need four numbers for bounds [l,b,r,t]"
@@ -342,9 +525,9 @@ class VTWorld(object):
         self.blockers[name] = this_obj
         return this_obj
 
-    def add_poly_block(self, name, vertices, color):
+    def add_poly_block(self, name, vertices, color, geometry = None):
         assert name not in self.blockers.keys(), "Name already taken: " + name
-        this_obj = VTBlocker(name, self._cpSpace, vertices, color)
+        this_obj = VTBlocker(name, self._cpSpace, vertices, color, geometry)
         self.blockers[name] = this_obj
         return this_obj
 
@@ -357,6 +540,7 @@ class VTWorld(object):
     def set_solid_collision_pre(self, fnc: Callable = _empty_object_handler):
         assert callable(fnc), "Must pass legal function to callback setter"
         self._ssPre = fnc
+        self._compile_handlers()
 
     def get_solid_collision_post(self) -> Callable:
         return self._ssPost
@@ -364,6 +548,7 @@ class VTWorld(object):
     def set_solid_collision_post(self, fnc: Callable = _empty_object_handler):
         assert callable(fnc), "Must pass legal function to callback setter"
         self._ssPost = fnc
+        self._compile_handlers()
 
     def get_solid_collision_begin(self) -> Callable:
         return self._ssBegin
@@ -371,6 +556,7 @@ class VTWorld(object):
     def set_solid_collision_begin(self, fnc: Callable = _empty_object_handler):
         assert callable(fnc), "Must pass legal function to callback setter"
         self._ssBegin = fnc
+        self._compile_handlers()
 
     def get_solid_collision_end(self) -> Callable:
         return self._ssEnd
@@ -378,6 +564,7 @@ class VTWorld(object):
     def set_solid_collision_end(self, fnc: Callable = _empty_object_handler):
         assert callable(fnc), "Must pass legal function to callback setter"
         self._ssEnd = fnc
+        self._compile_handlers()
 
     def get_goal_collision_begin(self) -> Callable:
         return self._sgBegin
@@ -385,6 +572,7 @@ class VTWorld(object):
     def set_goal_collision_begin(self, fnc: Callable = _empty_object_handler):
         assert callable(fnc), "Must pass legal function to callback setter"
         self._sgBegin = fnc
+        self._compile_handlers()
 
     def get_goal_collision_end(self) -> Callable:
         return self._sgEnd
@@ -392,60 +580,194 @@ class VTWorld(object):
     def set_goal_collision_end(self, fnc: Callable = _empty_object_handler):
         assert callable(fnc), "Must pass legal function to callback setter"
         self._sgEnd = fnc
+        self._compile_handlers()
+
+    def _compile_handlers(self):
+        """Installs only the pymunk collision callbacks that have work to do
+
+        pre_solve and post_solve run for every contact on every step, so they are only installed if a user handler (or collision noise) is set. begin and separate are installed for solid collisions if collisions are being tracked or logged or handlers are set, and for goal collisions if handlers are set (e.g., by a goal condition). Everything else is left to pymunk's default C callbacks. This is called automatically whenever a handler or the recording flag changes
+        """
+        need_pre = self._collision_noise is not None or not _is_empty_handler(self._ssPre)
+        need_post = not _is_empty_handler(self._ssPost)
+        recording = self._record_collisions or self._log_collision_events
+        need_ss_begin = recording or not _is_empty_handler(self._ssBegin)
+        need_ss_end = recording or not _is_empty_handler(self._ssEnd)
+        need_sg_begin = not _is_empty_handler(self._sgBegin)
+        need_sg_end = not _is_empty_handler(self._sgEnd)
+        for ctype in [COLTYPE_SOLID, COLTYPE_PLACED]:
+            sch = self._cpSpace.add_collision_handler(ctype, COLTYPE_SOLID)
+            _set_handler_callback(sch, 'begin', self._solid_solid_begin if need_ss_begin else None)
+            _set_handler_callback(sch, 'pre_solve', self._solid_solid_pre if need_pre else None)
+            _set_handler_callback(sch, 'post_solve', self._solid_solid_post if need_post else None)
+            _set_handler_callback(sch, 'separate', self._solid_solid_end if need_ss_end else None)
+            gch = self._cpSpace.add_collision_handler(ctype, COLTYPE_SENSOR)
+            _set_handler_callback(gch, 'begin', self._solid_goal_begin if need_sg_begin else None)
+            _set_handler_callback(gch, 'separate', self._solid_goal_end if need_sg_end else None)
+
+    def _set_collision_noise(self, fnc: Callable):
+        # fnc(arb) perturbs an arbiter in pre_solve; None turns collision noise off
+        self._collision_noise = fnc
+        self._compile_handlers()
+
+    def get_record_collisions(self) -> bool:
+        return self._record_collisions
+
+    def set_record_collisions(self, record: bool):
+        self._record_collisions = record
+        self._compile_handlers()
+
+    def get_log_collision_events(self) -> bool:
+        return self._log_collision_events
+
+    def set_log_collision_events(self, log: bool):
+        self._log_collision_events = log
+        self._compile_handlers()
+
+    def _get_collision_tracker(self) -> VTCollisionTracker:
+        return self._collision_tracker
+
+    def _resolve_objects(self, arb: pm.Arbiter) -> Tuple[VTObject, VTObject]:
+        # Index lookup rather than name lookup, since this runs for every contact on every step
+        s1, s2 = arb.shapes
+        return self._object_table[s1.vt_index], self._object_table[s2.vt_index]
 
     def _solid_solid_pre(self, arb, space, data):
-        onms = resolve_arbiter(arb)
-        o1 = self.get_object(onms[0])
-        o2 = self.get_object(onms[1])
-        self._ssPre(o1,o2)
+        if self._collision_noise is not None:
+            self._collision_noise(arb)
+        if not _is_empty_handler(self._ssPre):
+            o1, o2 = self._resolve_objects(arb)
+            self._ssPre(o1,o2)
         return True
 
     def _solid_solid_post(self, arb, space, data):
-        onms = resolve_arbiter(arb)
-        o1 = self.get_object(onms[0])
-        o2 = self.get_object(onms[1])
+        o1, o2 = self._resolve_objects(arb)
         self._ssPost(o1, o2)
         return True
 
     def _solid_solid_begin(self, arb, space, data):
-        onms = resolve_arbiter(arb)
-        o1 = self.get_object(onms[0])
-        o2 = self.get_object(onms[1])
+        if self._carried_contacts and self._is_carried_contact(arb):
+            return True
+        o1, o2 = self._resolve_objects(arb)
         # Add any non-static/static collisions to the events
         if not (o1.is_static() and o2.is_static()):
-            collision_info = pull_collision_information(arb)
-            self._collision_events.append([onms[0],onms[1], "begin",self.time, collision_info])
+            if self._record_collisions:
+                self._collision_tracker.begin(o1, o2, self.time, arb)
+            if self._log_collision_events:
+                collision_info = pull_collision_information(arb)
+                self._collision_events.append([o1.name, o2.name, "begin", self.time, collision_info])
+        self._goal_dirty = True
         self._ssBegin(o1, o2)
         return True
 
     def _solid_solid_end(self, arb, space, data):
-        onms = resolve_arbiter(arb)
-        o1 = self.get_object(onms[0])
-        o2 = self.get_object(onms[1])
+        if self._stale_contacts and self._is_stale_contact(arb):
+            return True
+        o1, o2 = self._resolve_objects(arb)
+        if self._log_collision_events:
+            self._end_solid_contact(o1, o2, pull_collision_information(arb))
+        else:
+            self._end_solid_contact(o1, o2, None)
+        return True
+
+    def _end_solid_contact(self, o1: VTObject, o2: VTObject, collision_info: List):
         # Add any non-static/static collisions to the events
         if not (o1.is_static() and o2.is_static()):
-            collision_info = pull_collision_information(arb)
-            self._collision_events.append([onms[0], onms[1], "end", self.time, collision_info])
+            if self._record_collisions:
+                self._collision_tracker.end(o1, o2, self.time)
+            if self._log_collision_events:
+                self._collision_events.append([o1.name, o2.name, "end", self.time, collision_info])
+        self._goal_dirty = True
         self._ssEnd(o1, o2)
-        return True
 
     def _solid_goal_begin(self, arb, space, data):
-        onms = resolve_arbiter(arb)
-        o1 = self.get_object(onms[0])
-        o2 = self.get_object(onms[1])
+        if self._carried_contacts and self._is_carried_contact(arb):
+            return True
+        o1, o2 = self._resolve_objects(arb)
+        self._goal_dirty = True
         self._sgBegin(o1, o2)
         return True
 
     def _solid_goal_end(self, arb, space, data):
-        onms = resolve_arbiter(arb)
-        o1 = self.get_object(onms[0])
-        o2 = self.get_object(onms[1])
+        if self._stale_contacts and self._is_stale_contact(arb):
+            return True
+        o1, o2 = self._resolve_objects(arb)
+        self._goal_dirty = True
         self._sgEnd(o1, o2)
         return True
 
+    def _each_contact(self) -> List:
+        # (shape, shape, arbiter) for every touching pair that the solid or goal handlers track,
+        #  ordered as those handlers see them (placed objects first, goals last)
+        contacts = dict()
+        def add_contact(arb):
+            s1, s2 = arb.shapes
+            if s1.collision_type == COLTYPE_SENSOR or s2.collision_type == COLTYPE_PLACED:
+                s1, s2 = s2, s1
+            if s1.collision_type in (COLTYPE_SOLID, COLTYPE_PLACED) and \
+                    s2.collision_type in (COLTYPE_SOLID, COLTYPE_SENSOR):
+                contacts[_contact_key(s1, s2)] = (s1, s2, arb)
+        for o in self._object_table:
+            if o is not None and not o.is_static():
+                o._cpBody.each_arbiter(add_contact)
+        return list(contacts.values())
+
+    def _get_contacts(self) -> List:
+        # (shape, shape, collision information) for every tracked touching pair (see `_each_contact`)
+        return [(s1, s2, pull_collision_information(arb)) for s1, s2, arb in self._each_contact()]
+
+    def _is_carried_contact(self, arb: pm.Arbiter) -> bool:
+        # pymunk does not copy contacts, so pairs touching when the world was copied start
+        #  touching again on the first step; these begins are not new contacts
+        s1, s2 = arb.shapes
+        return _contact_key(s1, s2) in self._carried_contacts
+
+    def _settle_carried_contacts(self):
+        # After the first step of a copied world: any carried pair that is no longer touching
+        #  has separated, so send the separate events that pymunk cannot
+        touching = set([_contact_key(s1, s2) for s1, s2, _ in self._get_contacts()])
+        carried = self._carried_contacts
+        self._carried_contacts = dict()
+        for key, (s1, s2, collision_info) in carried.items():
+            if key in touching:
+                continue
+            o1 = self._object_table[s1.vt_index]
+            o2 = self._object_table[s2.vt_index]
+            if s2.collision_type == COLTYPE_SENSOR:
+                self._goal_dirty = True
+                self._sgEnd(o1, o2)
+            else:
+                self._end_solid_contact(o1, o2, collision_info)
+
+    def _is_stale_contact(self, arb: pm.Arbiter) -> bool:
+        # pymunk keeps its contacts through a `restore`; pairs that were touching before it
+        #  separate on the first step, but these are not real separations
+        s1, s2 = arb.shapes
+        return _contact_key(s1, s2) in self._stale_contacts
+
+    def _settle_stale_contacts(self):
+        # After the first step of a restored world: a stale pair that is still touching never
+        #  gets a begin event from pymunk (it never stopped touching as far as pymunk knows), so
+        #  send the begin events a freshly loaded world would get
+        stale = self._stale_contacts
+        self._stale_contacts = dict()
+        for s1, s2, arb in self._each_contact():
+            if _contact_key(s1, s2) not in stale:
+                continue
+            if s2.collision_type == COLTYPE_SENSOR:
+                self._solid_goal_begin(arb, self._cpSpace, None)
+            else:
+                self._solid_solid_begin(arb, self._cpSpace, None)
+
     ########################################
     # Victory conditions
     ########################################
+    def _get_goal_cond(self) -> VTCond_Base:
+        return self._goal_cond
+
+    def _set_goal_cond(self, cond: VTCond_Base):
+        self._goal_cond = cond
+        self._goal_dirty = True
+
     def _get_callback_on_win(self):
         return self.win_callback
 
@@ -507,6 +829,25 @@ class VTWorld(object):
         self.goal_cond = VTCond_SpecificTouch(obj1, obj2, duration, self)
         self.goal_cond.attach_hooks()
 
+    def attach_cond_set(self, conditions: Dict[str, VTCond_Base], stop: str = 'any') -> VTCondSet:
+        """Sets a victory condition made of several named conditions that are all tracked in the same rollout (see VTCondSet)
+
+        Args:
+            conditions (Dict[str, VTCond_Base]): the conditions by name; each is either a condition made for this world (e.g., `VTCond_AnyInGoal('Goal', 2., world)`) or its description as in a world dict's 'gcond'
+            stop (str, optional): when the set counts as won: 'any', 'all', or 'none' of the conditions met. Defaults to 'any'.
+
+        Returns:
+            VTCondSet: the attached condition set, which records when each condition is first met
+        """
+        cs = VTCondSet(self, stop)
+        for nm, c in dict(conditions).items():
+            if isinstance(c, dict):
+                c = cond_from_dict(c, self)
+            cs.add(nm, c)
+        self.goal_cond = cs
+        self.goal_cond.attach_hooks()
+        return cs
+
     def check_finishers(self) -> bool:
         """Makes sure there is a way to exit the world -- a victory condition and a win_callback that happens afterwards
 
@@ -520,19 +861,109 @@ class VTWorld(object):
     ########################################
 
     def reset_collisions(self):
-        """Clears out the collision events list
+        """Clears out the collision events list and the tracked collision episodes
         """        
         self._collision_events = []
+        self._collision_tracker.reset()
 
     def _get_collision_events(self):
         return self._collision_events
 
+    ########################################
+    # Saving and restoring state
+    ########################################
+
+    def snapshot(self) -> Dict:
+        """Captures the physical state of the world so it can be rewound later with `restore`
+
+        This stores the position, velocity, rotation, angular velocity, forces, and sleeping state of every dynamic object, plus the world time, gravity, collision events, and the goal condition bookkeeping. Object geometry is not stored, so a snapshot can only be restored into the world it came from; objects added after the snapshot are removed again on restore
+
+        Returns:
+            Dict: an opaque description of the world state to pass to `restore`
+        """
+        bodies = dict()
+        for nm, o in self.objects.items():
+            if not o.is_static():
+                b = o._cpBody
+                bodies[nm] = (tuple(b.position), tuple(b.velocity), b.angle,
+                              b.angular_velocity, tuple(b.force), b.torque,
+                              b.is_sleeping)
+        if self.goal_cond is None:
+            gstate = None
+        else:
+            gstate = self.goal_cond._get_state()
+        return {'time': self.time,
+                'gravity': self.gravity,
+                'objects': list(self.objects.keys()),
+                'bodies': bodies,
+                'collision_events': deepcopy(self._collision_events),
+                'collision_tracker': self._collision_tracker._get_state(),
+                'goal_state': gstate}
+
+    def restore(self, snapshot: Dict):
+        """Rewinds the world to a state captured by `snapshot`, without rebuilding any objects
+
+        The captured state is written back onto the existing bodies (nothing is rebuilt), and any objects added since the snapshot (e.g., a placed tool) are removed. Collision callbacks then fire as they would in a freshly loaded world. pymunk's broadphase index and its cache of recent contacts are not rewound, though, so the trajectory from a restored state can differ numerically from that of a freshly loaded world in the same state
+
+        Args:
+            snapshot (Dict): the output of a previous `snapshot` call on this world
+
+        Raises:
+            AssertionError: if an object in the snapshot has since been removed from the world
+        """
+        bodies = snapshot['bodies']
+        assert all([nm in self.objects for nm in snapshot['objects']]), \
+            "Snapshot has objects that are no longer in this world"
+        for nm in [nm for nm in self.objects.keys() if nm not in snapshot['objects']]:
+            self.remove_object(nm)
+        # pymunk still holds the contacts from before the restore: their separations on the next
+        #  step are not passed on, and any still touching then get begin events (see `step`)
+        self._stale_contacts = dict([(_contact_key(s1, s2), (s1, s2)) for s1, s2, _ in self._each_contact()])
+        for nm, (pos, vel, ang, angvel, force, torque, sleeping) in bodies.items():
+            b = self.objects[nm]._cpBody
+            b.position = pos
+            b.velocity = vel
+            b.angle = ang
+            b.angular_velocity = angvel
+            b.force = force
+            b.torque = torque
+            self._cpSpace.reindex_shapes_for_body(b)
+        for nm, state in bodies.items():
+            if state[6]:
+                self.objects[nm]._cpBody.sleep()
+
+        self.time = snapshot['time']
+        self.gravity = snapshot['gravity']
+        self._collision_events = deepcopy(snapshot['collision_events'])
+        self._collision_tracker._set_state(snapshot['collision_tracker'])
+        if self.goal_cond is not None and snapshot['goal_state'] is not None:
+            self.goal_cond._set_state(snapshot['goal_state'])
+        self._goal_dirty = True
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Rebuilt on demand
+        state['_placement_checker'] = None
+        state['_noisy_factory'] = None
+        state['_carried_contacts'] = [c for c in self._get_contacts()
+                                      if _contact_key(c[0], c[1]) not in self._stale_contacts]
+        state['_stale_contacts'] = dict()
+        return state
+
+    def __setstate__(self, state):
+        carried = state.pop('_carried_contacts')
+        self.__dict__.update(state)
+        self._carried_contacts = dict([(_contact_key(s1, s2), (s1, s2, ci)) for s1, s2, ci in carried])
+        self._compile_handlers()
+
     ########################################
     # Misc
     ########################################
     def check_collision(self, pos: Tuple[float, float], verts: List[Tuple[float, float]]) -> bool:
         """Checks whether placing a convex polygon in the world would cause a collision
 
+        This is answered by the world's `placement_checker`, so it does not step or otherwise change the world. Checks used to step the world by 1e-6s first, so a world that was checked before being run now follows a slightly different trajectory than it used to (though success and solution times were unchanged in testing)
+
         Args:
             pos (Tuple[float, float]): the position of the hypothetical polygon (where all vertices are calculated wrt)
             verts (List[Tuple[float, float]]): a list of (x,y) vertices of the convex polygon, relative to the position
@@ -540,31 +971,13 @@ class VTWorld(object):
         Returns:
             bool: true if there would be a collision, false if not
         """        
-        nvert = [(v[0]+pos[0], v[1]+pos[1]) for v in verts]
-        tmpBody = pm.Body(1,1)
-        placeShape = pm.Poly(tmpBody, nvert)
-        placeShape.collision_type = COLTYPE_CHECKER
-        placeShape.sensor = True
-        self._cpSpace.step(.000001)
-
-        self.has_place_collision = False
-        squery = self._cpSpace.shape_query(placeShape)
-        """ Code doesn't account for blockers (sensors)
-        # Update 12/12/23: I don't see why this wouldn't but if you're getting incorrect output, check the blockers!
-        if len(squery) == 0:
-            return False
-        else:
-            for sq in squery:
-                for p in sq.contact_point_set.points:
-                    if p.distance > 0:
-                        return True
-            return False
-        """
-        return len(squery) > 0
+        return self.placement_checker.collides([verts], pos)
 
     def check_circle_collision(self, pos: Tuple[float, float], rad: float) -> bool:
         """Checks if there would be a colision with an object if a circular object were placed in the world
 
+        Like `check_collision`, this does not step the world
+
         Args:
             pos (Tuple[float, float]): the center of the hypothetical circular object
             rad (float): the radius of the hypothetical circular object
@@ -572,15 +985,15 @@ class VTWorld(object):
         Returns:
             bool: true if there would be a colision, false if not
         """        
-        tmpBody = pm.Body(1,1)
-        placeShape = pm.Circle(tmpBody, rad, pos)
-        placeShape.collision_type = COLTYPE_CHECKER
-        placeShape.sensor = True
-        self._cpSpace.step(.000001)
+        return self.placement_checker.collides_circle(pos, rad)
 
-        self.has_place_collision = False
-        squery = self._cpSpace.shape_query(placeShape)
-        return len(squery) > 0
+    @property
+    def placement_checker(self) -> VTPlacementChecker:
+        """VTPlacementChecker: a query-only copy of the world's shapes for checking whether new objects would overlap anything (including goals and blockers)
+        """
+        if self._placement_checker is None:
+            self._placement_checker = VTPlacementChecker(self)
+        return self._placement_checker
 
     def kick(self, objectname: str, impulse: Tuple[float, float], position: Tuple[float, float]):
         """Applies an impulse to an object at a particular point
@@ -633,24 +1046,21 @@ class VTWorld(object):
         """
         assert self.goal_cond, "Goal condition must be specified to get distance"
         warnings.warn("This function is old and looks wrong - be careful using it")
-        try:
-            # Special case... requires getting two distances
-            if type(self.goal_cond) == VTCond_SpecificTouch:
-                o1 = self.get_object(self.goal_cond.o1)
-                o2 = self.get_object(self.goal_cond.o2)
-                #in this case, we actually want the distance between these two objects...
-                return np.abs(o1.distance_from_point([0,0]) - o2.distance_from_point([0,0])) #distance between these two objects is thing that matters
+        # Special case... requires getting two distances
+        if type(self.goal_cond) == VTCond_SpecificTouch:
+            o1 = self.get_object(self.goal_cond.o1)
+            o2 = self.get_object(self.goal_cond.o2)
+            #in this case, we actually want the distance between these two objects...
+            return np.abs(o1.distance_from_point([0,0]) - o2.distance_from_point([0,0])) #distance between these two objects is thing that matters
+        else:
+            gobj = self.get_object(self.goal_cond.goal)
+            if gobj.type != 'Container':
+                return gobj.distance_from_point(point)
             else:
-                gobj = self.get_object(self.goal_cond.goal)
-                if gobj.type != 'Container':
-                    return gobj.distance_from_point(point)
+                if self.distance_to_goal(point) == 0:
+                    return 0
                 else:
-                    if self.distance_to_goal(point) == 0:
-                        return 0
-                    else:
-                        return distance_to_object(gobj, point)
-        except:
-            pdb.set_trace()
+                    return distance_to_object(gobj, point)
 
     def get_dynamic_objects(self) -> List[VTObject]:
         """Returns a list of all dynamic (not static) objects in the world
@@ -673,6 +1083,9 @@ class VTWorld(object):
         wdict['dims'] = tuple(self.dims)
         wdict['bts'] = self.bts
         wdict['gravity'] = self.gravity
+        # Only written when it differs from the default, so existing world dicts keep their hashes
+        if self._fidelity != DEFAULT_FIDELITY:
+            wdict['fidelity'] = self._fidelity
         wdict['defaults'] = dict(density=self.def_density, friction=self.def_friction,
                                  elasticity=self.def_elasticity, color=self.def_col, bk_color=self.bk_col)
 
@@ -711,30 +1124,31 @@ class VTWorld(object):
         if self.goal_cond is None:
             wdict['gcond'] = None
         else:
-            gc = self.goal_cond
-            if gc.type == 'AnyInGoal':
-                wdict['gcond'] = {'type': gc.type, 'goal': gc.goal, 'obj': '-',
-                                  'exclusions': gc.excl, 'duration': gc.dur}
-            elif gc.type == 'SpecificInGoal':
-                wdict['gcond'] = {'type': gc.type, 'goal': gc.goal, 'obj': gc.obj, 'duration': gc.dur}
-            elif gc.type == 'ManyInGoal':
-                wdict['gcond'] = {'type': gc.type, 'goal': gc.goal, 'objlist': gc.objlist, 'duration': gc.dur}
-            elif gc.type == "AnyTouch":
-                wdict['gcond'] = {'type': gc.type, 'goal': gc.goal, 'obj': '-', 'duration': gc.dur}
-            elif gc.type == 'SpecificTouch':
-                wdict['gcond'] = {'type': gc.type, 'goal': gc.o1, 'obj': gc.o2, 'duration': gc.dur}
-            else:
-                raise Exception('Invalid goal condition type provided')
+            wdict['gcond'] = cond_to_dict(self.goal_cond)
 
         return wdict
 
     def copy(self):
-        return load_vt_from_dict(self.to_dict())
+        """Makes an independent copy of the world in its current state
+
+        The pymunk space is cloned directly (rather than rebuilt from `to_dict`), so the copy keeps everything mid-simulation: time, velocities and forces, collision records, the goal condition's progress, collision noise, and any handlers set on the world. Handlers that are plain functions are shared with the original; bound methods of the world or its goal condition are tied to the copy. Two things are not carried over: pymunk's cached contacts (pairs already touching resume on the first step without new begin events, though the solver starts that step without the contact impulses it would have reused), and sleep (objects are awake in the copy)
+
+        Returns:
+            VTWorld: the copy
+        """
+        clone = type(self).__new__(type(self))
+        space, memo = self._cpSpace.clone()
+        memo[id(self)] = clone
+        # Everything else is deep copied, with references to this world and its pymunk objects
+        #  pointing at their copies
+        clone.__setstate__(deepcopy(self.__getstate__(), memo))
+        return clone
 
     ########################################
     # Properties
     ########################################
     gravity = property(get_gravity, set_gravity)
+    fidelity = property(get_fidelity, set_fidelity)
     solid_collision_pre = property(get_solid_collision_pre,
                                     set_solid_collision_pre)
     solid_collision_post = property(get_solid_collision_post,
@@ -747,8 +1161,12 @@ class VTWorld(object):
                                    set_goal_collision_begin)
     goal_collision_end = property(get_goal_collision_end,
                                  set_goal_collision_end)
+    goal_cond = property(_get_goal_cond, _set_goal_cond)
     callback_on_win = property(_get_callback_on_win, _set_callback_on_win)
     collision_events = property(_get_collision_events)
+    record_collisions = property(get_record_collisions, set_record_collisions)
+    log_collision_events = property(get_log_collision_events, set_log_collision_events)
+    collision_tracker = property(_get_collision_tracker)
 
 
 ########################################
@@ -767,65 +1185,9 @@ def load_vt_from_dict(d: Dict) -> VTWorld:
     Returns:
         VTWorld: the world described in the Dict
     """    
-    d = deepcopy(d)
-    def_elast = float(d['defaults']['elasticity'])
-    def_fric = float(d['defaults']['friction'])
-
-    vtw = VTWorld(d['dims'], d['gravity'], [False, False, False, False], d['bts'],
-                  float(d['defaults']['density']), def_elast, def_fric,
-                  word_to_color(d['defaults']['bk_color']), word_to_color(d['defaults']['color']))
-
-    for nm, o in d['objects'].items():
-        elasticity = float(o.get('elasticity', def_elast))
-        friction = float(o.get('friction', def_fric))
-        density = float(o.get('density', d['defaults']['density']))
-
-        if o['type'] == 'Poly':
-            vtw.add_poly(nm, o['vertices'], word_to_color(o['color']), density, elasticity, friction)
-        elif o['type'] == 'Ball':
-            vtw.add_ball(nm, o['position'], o['radius'], word_to_color(o['color']), density, elasticity, friction)
-        elif o['type'] == 'Segment':
-            vtw.add_segment(nm, o['p1'], o['p2'], o['width'], word_to_color(o['color']), density, elasticity, friction)
-        elif o['type'] == 'Container':
-            if 'innerColor' not in o:
-                if 'color' in o:
-                    ic = word_to_color(o['color'])
-                else:
-                    ic = None
-            else:
-                ic = word_to_color(o['innerColor'])
-            if 'outerColor' not in o:
-                oc = DEFAULT_COLOR
-            else:
-                oc = word_to_color(o['outerColor'])
-            vtw.add_container(nm, o['points'], o['width'], ic, oc, density, elasticity, friction)
-        elif o['type'] == 'Goal':
-            vtw.add_poly_goal(nm, o['vertices'], word_to_color(o['color']))
-        elif o['type'] == 'Compound':
-            vtw.add_compound(nm, o['polys'], word_to_color(o['color']), density, elasticity, friction)
-        else:
-            raise Exception("Invalid object type given: " + o['type'])
-
-    for nm, b in d['blocks'].items():
-        vtw.add_poly_block(nm, b['vertices'], word_to_color(b['color']))
-
-    if d['gcond'] is not None:
-        g = d['gcond']
-        if g['type'] == 'AnyInGoal':
-            excl = g.get('exclusions', [])
-            vtw.attach_any_in_goal(g['goal'], float(g['duration']), excl)
-        elif g['type'] == 'SpecificInGoal':
-            vtw.attach_specific_in_goal(g['goal'], g['obj'], float(g['duration']))
-        elif g['type'] == 'ManyInGoal':
-            vtw.attach_many_in_goal(g['goal'], g['objlist'], float(g['duration']))
-        elif g['type'] == 'AnyTouch':
-            vtw.attach_any_touch(g['goal'], float(g['duration']))
-        elif g['type'] == 'SpecificTouch':
-            vtw.attach_specific_touch(g['goal'], g['obj'], float(g['duration']))
-        else:
-            raise Exception("In valid goal condition type given")
-
-    return vtw
+    # Imported here since the spec module builds VTWorlds
+    from .spec import compile_world_spec, world_from_spec
+    return world_from_spec(compile_world_spec(d))
 
 def reverse_world(w: VTWorld) -> VTWorld:
     """Flips a world around its x-axis